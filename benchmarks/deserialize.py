@@ -0,0 +1,94 @@
+"""
+Micro-benchmark of the per item overhead of ApiClient deserialization.
+
+Deserializes lists of N items through ApiClient.deserialize and reports the
+time per item, next to the time of the model's from_dict alone, which is the
+floor any deserializer has to pay. The JSON decoding is measured separately
+and left out. The difference with the floor is the cost of resolving the
+type string and dispatching each item. The lazy column deserializes the list as
+the items of a response with `lazy_items` set, which defers building the
+models to the first access of their fields, and reads the name of each item.
+The fields column deserializes the response projected to the name and total
+physical space of the items, see `pypureclient.projection`.
+
+Usage:
+    python benchmarks/deserialize.py [--items N] [--repeat N]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pypureclient._transport.api_client import ApiClient  # noqa: E402
+from pypureclient._transport.configuration import Configuration  # noqa: E402
+from pypureclient.projection import ProjectedFunction, Projection  # noqa: E402
+from pypureclient.flasharray.FA_2_38 import models  # noqa: E402
+
+
+class _Response(object):
+
+    def __init__(self, data):
+        self.data = data
+
+
+def _volume(i):
+    return {'id': 'id-{}'.format(i), 'name': 'vol{}'.format(i), 'provisioned': 1024 * i,
+            'destroyed': False, 'serial': 'S{}'.format(i), 'subtype': 'regular', 'created': 1000 + i,
+            'space': {'total_physical': i, 'data_reduction': 1.5, 'unique': i},
+            'qos': {'bandwidth_limit': 100}, 'pod': {'id': 'p', 'name': 'pod'}}
+
+
+def _reference(i):
+    return {'id': 'id-{}'.format(i), 'name': 'name{}'.format(i)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=10000, help='number of items in the list')
+    parser.add_argument('--repeat', type=int, default=20, help='best of N runs')
+    args = parser.parse_args()
+
+    api_client = ApiClient(models_package=models)
+    lazy_configuration = Configuration()
+    lazy_configuration.lazy_items = True
+    lazy_api_client = ApiClient(configuration=lazy_configuration, models_package=models)
+
+    def best(function):
+        return min(timeit.repeat(function, number=1, repeat=args.repeat)) * 1e6 / args.items
+
+    cases = [
+        ("'List[int]'", list(range(args.items)), None, None),
+        ("'List[Reference]'", [_reference(i) for i in range(args.items)], models.Reference, None),
+        ("'List[Volume]'", [_volume(i) for i in range(args.items)], models.Volume, 'VolumeGetResponse'),
+    ]
+    print('{} items, best of {} runs, microseconds per item'.format(args.items, args.repeat))
+    projection = Projection(['name', 'space.total_physical'])
+    print('{:<20}{:>12}{:>12}{:>12}{:>12}{:>12}'.format('type', 'floor', 'deserialize', 'overhead', 'lazy',
+                                                        'fields'))
+    for type_name, items, model, response_type in cases:
+        response = _Response(json.dumps(items))
+        decoded = json.loads(response.data)
+        decode = best(lambda: json.loads(response.data))
+        if model is None:
+            floor = 0.0
+        else:
+            floor = best(lambda: [model.from_dict(item) for item in decoded])
+        total = best(lambda: api_client.deserialize(response, type_name.strip("'"))) - decode
+        lazy = projected = '-'
+        if response_type is not None:
+            body = _Response(json.dumps({'items': items}))
+            body_decode = best(lambda: json.loads(body.data))
+            lazy = '{:.3f}'.format(best(lambda: [item.name for item in
+                                                 lazy_api_client.deserialize(body, response_type).items])
+                                    - body_decode)
+            deserialize = ProjectedFunction(lambda: api_client.deserialize(body, response_type), projection)
+            projected = '{:.3f}'.format(best(deserialize) - body_decode)
+        print('{:<20}{:>12.3f}{:>12.3f}{:>12.3f}{:>12}{:>12}'.format(type_name, floor, total, total - floor,
+                                                                    lazy, projected))
+
+
+if __name__ == '__main__':
+    main()
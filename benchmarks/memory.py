@@ -0,0 +1,80 @@
+"""
+Memory benchmark of the items of list responses.
+
+Decodes a JSON list of N synthetic items, the ones served by the mock
+array, builds them as the clients would, and reports the bytes retained
+per item once the decoded list is dropped, measured with tracemalloc:
+the dicts of `raw_items`, the pydantic models of the default clients, the
+LazyModels of `lazy_items` and the read-only records of `compact_items`,
+for the FlashArray volumes and hosts and the FlashBlade file systems.
+
+Usage:
+    python benchmarks/memory.py [--items N]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from mock_array import file_system, host, volume  # noqa: E402
+from pypureclient._transport.compact_model import compact_class  # noqa: E402
+from pypureclient._transport.lazy_model import LazyModel  # noqa: E402
+from pypureclient.flasharray.FA_2_38 import models as fa_models  # noqa: E402
+from pypureclient.flashblade.FB_2_24 import models as fb_models  # noqa: E402
+
+CASES = [
+    ('Volume', fa_models.Volume, volume),
+    ('Host', fa_models.Host, host),
+    ('FileSystem', fb_models.FileSystem, file_system),
+]
+
+
+def _builders(model_class):
+    record_class = compact_class(model_class)
+    return [
+        ('dict', lambda items: items),
+        ('model', lambda items: [model_class.from_dict(item) for item in items]),
+        ('lazy', lambda items: [LazyModel(model_class, item) for item in items]),
+        ('compact', lambda items: [record_class(item) for item in items]),
+    ]
+
+
+def retained(body, build):
+    """Bytes retained by the objects built from a JSON body."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objects = build(json.loads(body))
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del objects
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=10000, help='number of items in the list')
+    args = parser.parse_args()
+
+    print('{} items, bytes retained per item'.format(args.items))
+    print('{:<12}{:>10}{:>10}{:>10}{:>10}{:>10}'.format('model', 'dict', 'model', 'lazy', 'compact', 'saved'))
+    for name, model_class, make_item in CASES:
+        body = json.dumps([make_item(i) for i in range(args.items)])
+        # builds the classes, and resolves the fields, before measuring
+        for _, build in _builders(model_class):
+            build(json.loads(body)[:1])
+        sizes = {label: retained(body, build) / args.items for label, build in _builders(model_class)}
+        saved = 1 - sizes['compact'] / sizes['model']
+        print('{:<12}{:>10.0f}{:>10.0f}{:>10.0f}{:>10.0f}{:>10.0%}'.format(
+            name, sizes['dict'], sizes['model'], sizes['lazy'], sizes['compact'], saved))
+
+
+if __name__ == '__main__':
+    main()
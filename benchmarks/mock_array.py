@@ -0,0 +1,292 @@
+"""
+Local HTTP server mocking a FlashArray and a FlashBlade, for the benchmarks.
+
+Answers the version, OAuth2 token exchange, login and logout endpoints, and
+serves synthetic collections of volumes, volume snapshots, volume
+performance, hosts and file systems, whose items are valid for the models of the
+clients. The lists are paginated with `limit`, `offset` and
+`continuation_token`, filtered with `names`, capped to a maximum page
+size as the arrays do, and their pages are rendered
+once and cached, so that the server costs as little as possible next to
+the client being measured.
+
+Usage, to run it on its own:
+    python benchmarks/mock_array.py [--port N] [--items N] [--page-size N] [--latency S]
+"""
+import argparse
+import base64
+import json
+import threading
+import time
+import urllib.parse
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FA_VERSIONS = ['2.0', '2.24', '2.36', '2.38']
+FB_VERSIONS = ['2.0', '2.12', '2.24']
+
+
+def volume(i):
+    return {
+        'id': 'vol-id-{}'.format(i), 'name': 'vol{}'.format(i), 'connection_count': i % 4,
+        'created': 1700000000000 + i, 'destroyed': False, 'provisioned': 1073741824 * (1 + i % 64),
+        'serial': '6C5A2D4E{:016X}'.format(i), 'subtype': 'regular', 'priority': 0,
+        'priority_adjustment': {'priority_adjustment_operator': '+', 'priority_adjustment_value': 0},
+        'qos': {'bandwidth_limit': 549755813888, 'iops_limit': 100000000},
+        'space': {'data_reduction': 3.2, 'footprint': 1024 * i, 'shared': None, 'snapshots': 512 * i,
+                  'thin_provisioning': 0.6, 'total_physical': 2048 * i, 'total_provisioned': 1073741824,
+                  'total_reduction': 9.1, 'unique': 1536 * i, 'virtual': 4096 * i},
+        'pod': {'id': None, 'name': None}, 'source': {'id': None, 'name': None},
+        'volume_group': {'id': None, 'name': None}, 'promotion_status': 'promoted',
+        'requested_promotion_state': 'promoted', 'time_remaining': None,
+        'context': {'id': 'array-id', 'name': 'array'},
+    }
+
+
+def volume_snapshot(i):
+    return {
+        'id': 'snap-id-{}'.format(i), 'name': 'vol{}.snap{}'.format(i // 8, i % 8),
+        'created': 1700000000000 + i, 'destroyed': False, 'provisioned': 1073741824,
+        'serial': '6C5A2D4F{:016X}'.format(i), 'suffix': 'snap{}'.format(i % 8),
+        'source': {'id': 'vol-id-{}'.format(i // 8), 'name': 'vol{}'.format(i // 8)},
+        'pod': {'id': None, 'name': None}, 'volume_group': {'id': None, 'name': None},
+        'space': {'data_reduction': 3.2, 'footprint': 1024 * i, 'snapshots': 512 * i,
+                  'total_physical': 2048 * i, 'total_provisioned': 1073741824, 'unique': 1536 * i,
+                  'virtual': 4096 * i},
+        'time_remaining': None, 'context': {'id': 'array-id', 'name': 'array'},
+    }
+
+
+def volume_performance(i):
+    return {
+        'id': 'vol-id-{}'.format(i), 'name': 'vol{}'.format(i), 'time': 1700000000000,
+        'bytes_per_mirrored_write': 0, 'bytes_per_op': 4096, 'bytes_per_read': 8192, 'bytes_per_write': 4096,
+        'mirrored_write_bytes_per_sec': 0, 'mirrored_writes_per_sec': 0,
+        'qos_rate_limit_usec_per_mirrored_write_op': 0, 'qos_rate_limit_usec_per_read_op': 0,
+        'qos_rate_limit_usec_per_write_op': 0, 'queue_usec_per_mirrored_write_op': 0,
+        'queue_usec_per_read_op': 12, 'queue_usec_per_write_op': 15, 'read_bytes_per_sec': 81920 * i,
+        'reads_per_sec': 10 * i, 'san_usec_per_mirrored_write_op': 0, 'san_usec_per_read_op': 40,
+        'san_usec_per_write_op': 45, 'service_usec_per_mirrored_write_op': 0, 'service_usec_per_read_op': 90,
+        'service_usec_per_read_op_cache_reduction': 0.25, 'service_usec_per_write_op': 110,
+        'usec_per_mirrored_write_op': 0, 'usec_per_read_op': 142, 'usec_per_write_op': 170,
+        'write_bytes_per_sec': 40960 * i, 'writes_per_sec': 10 * i,
+        'context': {'id': 'array-id', 'name': 'array'},
+    }
+
+
+def host(i):
+    return {
+        'name': 'host{}'.format(i), 'connection_count': i % 8, 'destroyed': False, 'is_local': True,
+        'personality': None, 'vlan': 'any', 'time_remaining': None,
+        'chap': {'host_password': None, 'host_user': None, 'target_password': None, 'target_user': None},
+        'host_group': {'name': 'hg{}'.format(i // 16)},
+        'iqns': ['iqn.2010-01.com.example:host{}'.format(i)], 'nqns': [],
+        'wwns': ['5001500150{:06X}'.format(2 * i), '5001500150{:06X}'.format(2 * i + 1)],
+        'port_connectivity': {'details': 'redundant', 'status': 'healthy'},
+        'preferred_arrays': [],
+        'space': {'data_reduction': 3.2, 'footprint': 0, 'shared': None, 'snapshots': 512 * i,
+                  'thin_provisioning': 0.6, 'total_physical': 2048 * i, 'total_provisioned': 1073741824,
+                  'total_reduction': 9.1, 'unique': 1536 * i, 'virtual': 4096 * i},
+        'context': {'id': 'array-id', 'name': 'array'},
+    }
+
+
+def file_system(i):
+    return {
+        'id': 'fs-id-{}'.format(i), 'name': 'fs{}'.format(i), 'created': 1700000000000 + i,
+        'destroyed': False, 'provisioned': 1099511627776, 'hard_limit_enabled': False,
+        'fast_remove_directory_enabled': False, 'snapshot_directory_enabled': True, 'writable': True,
+        'default_group_quota': 0, 'default_user_quota': 0, 'group_ownership': 'creator',
+        'promotion_status': 'promoted', 'requested_promotion_state': 'promoted', 'time_remaining': None,
+        'http': {'enabled': False},
+        'multi_protocol': {'access_control_style': 'shared', 'safeguard_acls': True},
+        'nfs': {'export_policy': {'id': 'policy-id', 'name': 'default', 'resource_type': 'nfs-export-policies'},
+                'rules': '', 'v3_enabled': True, 'v4_1_enabled': True},
+        'smb': {'client_policy': {'id': None, 'name': None}, 'continuous_availability_enabled': True,
+                'enabled': False, 'share_policy': {'id': None, 'name': None}},
+        'eradication_config': {'eradication_mode': 'permission-based', 'manual_eradication': 'enabled'},
+        'space': {'available_provisioned': 0, 'data_reduction': 1.8, 'destroyed': 0, 'destroyed_virtual': 0,
+                  'snapshots': 1024 * i, 'total_physical': 4096 * i, 'total_provisioned': 1099511627776,
+                  'total_used': 4096 * i, 'unique': 2048 * i, 'virtual': 8192 * i},
+        'source': {'id': None, 'name': None, 'location': {'id': None, 'name': None}},
+        'storage_class': {'name': 'S500', 'status': 'stable'},
+        'context': {'id': 'blade-id', 'name': 'blade'},
+    }
+
+
+# Collections served under /api/2.x/, with the function building their items
+COLLECTIONS = {
+    'volumes': volume,
+    'volume-snapshots': volume_snapshot,
+    'volumes/performance': volume_performance,
+    'hosts': host,
+    'file-systems': file_system,
+}
+
+
+def _access_token():
+    """An unsigned JWT, which the clients only decode to read its expiration."""
+    def encode(part):
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b'=').decode()
+    return '{}.{}.{}'.format(encode({'alg': 'RS256', 'typ': 'JWT'}),
+                             encode({'sub': 'pureuser', 'exp': int(time.time()) + 86400}), 'signature')
+
+
+class MockArray(object):
+    """
+    The mock server, run by a thread of the process.
+
+    Example:
+        >>> with MockArray(items=10000) as array:
+        ...     configuration.host = array.url
+    """
+
+    def __init__(self, port=0, items=10000, page_size=1000, latency=0.0):
+        """
+        Args:
+            port (int): Port to listen on, any free port if 0.
+            items (int): Number of items of each collection.
+            page_size (int): Maximum number of items of a page, whatever the
+                limit asked for. 0 for no maximum.
+            latency (float): Seconds to wait before answering a request.
+        """
+        self.items = items
+        self.page_size = page_size
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._pages = {}
+        self._access_token = _access_token()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), _handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self._server.server_address[1])
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='mock-array', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def page(self, collection, start, end, total_item_count):
+        """The rendered body of a page of a collection."""
+        key = (collection, start, end, total_item_count)
+        body = self._pages.get(key)
+        if body is None:
+            make_item = COLLECTIONS[collection]
+            more = end < self.items
+            body = json.dumps({
+                'items': [make_item(i) for i in range(start, end)],
+                'continuation_token': str(end) if more else None,
+                'more_items_remaining': more,
+                'total_item_count': self.items if total_item_count else None,
+            }).encode()
+            with self._lock:
+                self._pages[key] = body
+        return body
+
+    def named(self, collection, names):
+        """The rendered body of the items of a collection with the given names."""
+        make_item = COLLECTIONS[collection]
+        items = []
+        for name in names:
+            digits = ''.join(c for c in name if c.isdigit())
+            if digits and int(digits) < self.items:
+                items.append(make_item(int(digits)))
+        return json.dumps({'items': items, 'continuation_token': None, 'more_items_remaining': False,
+                           'total_item_count': len(items)}).encode()
+
+
+def _handler(array):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # the headers and the body are written apart, don't wait for an ACK in between
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body, headers=None):
+            if not isinstance(body, bytes):
+                body = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('X-Request-ID', self.headers.get('X-Request-ID') or 'mock-request-id')
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _start(self):
+            with array._lock:
+                array.requests += 1
+            if array.latency:
+                time.sleep(array.latency)
+            parts = urllib.parse.urlsplit(self.path)
+            return parts.path, dict(urllib.parse.parse_qsl(parts.query))
+
+        def do_GET(self):
+            path, query = self._start()
+            if path == '/api/api_version':
+                return self._send(200, {'version': FA_VERSIONS, 'versions': FB_VERSIONS})
+            parts = path.split('/', 3)
+            collection = parts[3] if len(parts) == 4 and parts[1] == 'api' else None
+            if collection not in COLLECTIONS:
+                return self._send(404, {'errors': [{'message': 'Not found.', 'context': path}]})
+            if query.get('names'):
+                return self._send(200, array.named(collection, query['names'].split(',')))
+            start = int(query.get('continuation_token') or query.get('offset') or 0)
+            limit = int(query.get('limit') or 0) or array.items
+            if array.page_size:
+                limit = min(limit, array.page_size)
+            end = min(start + limit, array.items)
+            return self._send(200, array.page(collection, start, end, query.get('total_item_count') == 'true'))
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            path, _ = self._start()
+            if path == '/oauth2/1.0/token':
+                return self._send(200, {'access_token': array._access_token, 'token_type': 'Bearer',
+                                        'issued_token_type': 'urn:ietf:params:oauth:token-type:access_token',
+                                        'expires_in': 86400})
+            if path.endswith('/login'):
+                return self._send(200, {'items': [{'username': 'pureuser'}]}, {'x-auth-token': 'mock-session'})
+            if path.endswith('/logout'):
+                return self._send(200, {})
+            return self._send(404, {'errors': [{'message': 'Not found.', 'context': path}]})
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8080, help='port to listen on')
+    parser.add_argument('--items', type=int, default=10000, help='number of items of each collection')
+    parser.add_argument('--page-size', type=int, default=1000, help='maximum number of items of a page')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds to wait before answering')
+    args = parser.parse_args()
+    with MockArray(args.port, args.items, args.page_size, args.latency) as array:
+        print('serving on {}'.format(array.url))
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
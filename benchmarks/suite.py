@@ -0,0 +1,247 @@
+"""
+End-to-end benchmark suite of the clients, against a local mock FlashArray
+and FlashBlade (see mock_array.py), so that it runs offline.
+
+Measures the construction of clients, the API calls per second, the items
+per second iterated through ItemIterator, and the peak RSS of each case.
+Every case runs in a fresh interpreter, so that the peak RSS is its own
+and no case warms the caches of another. The mock server runs in the
+process driving the cases.
+
+Results can be saved with --save and compared with a saved run with
+--compare, which lists the cases slower than the threshold and exits with
+status 1 if there are any, e.g. before a release:
+
+    python benchmarks/suite.py --save baseline.json     # on the last release
+    python benchmarks/suite.py --compare baseline.json  # on the candidate
+
+Usage:
+    python benchmarks/suite.py [--items N] [--page-size N] [--calls N]
+                               [--cases NAME ...] [--save FILE]
+                               [--compare FILE] [--threshold R]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..'))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+from mock_array import MockArray  # noqa: E402
+
+try:
+    import resource
+except ImportError:
+    # not on Windows
+    resource = None
+
+
+def _fa_client(url, **kwargs):
+    from pypureclient.flasharray.FA_2_38 import Client
+    return Client(configuration=_configuration(url), **kwargs)
+
+
+def _fb_client(url, **kwargs):
+    from pypureclient.flashblade.FB_2_24 import Client
+    return Client(configuration=_configuration(url), **kwargs)
+
+
+def _configuration(url):
+    from pypureclient.configuration import Configuration
+    from pypureclient._transport.configuration import Configuration as TransportConfiguration
+    configuration = TransportConfiguration.based_on(Configuration())
+    configuration.host = url
+    return configuration
+
+
+def _construct(make_client, count):
+    """Clients built per second, login included."""
+    start = time.perf_counter()
+    for _ in range(count):
+        make_client()
+    return count / (time.perf_counter() - start)
+
+
+def _calls(call, count):
+    """Calls per second, after a first call warming the client up."""
+    call()
+    start = time.perf_counter()
+    for _ in range(count):
+        call()
+    return count / (time.perf_counter() - start)
+
+
+def _iterate(call, expected):
+    """Items per second iterated from the response of a call."""
+    start = time.perf_counter()
+    count = sum(1 for _ in call().items)
+    elapsed = time.perf_counter() - start
+    if count != expected:
+        raise RuntimeError('iterated {} items, expected {}'.format(count, expected))
+    return count / elapsed
+
+
+def _iterate_pages(call, expected, page_size):
+    """Items per second iterated from the pages of a call."""
+    kwargs = {'limit': page_size} if page_size else {}
+    count = 0
+    start = time.perf_counter()
+    while True:
+        response = call(**kwargs)
+        count += sum(1 for _ in response.items)
+        if not response.continuation_token:
+            break
+        kwargs['continuation_token'] = response.continuation_token
+    elapsed = time.perf_counter() - start
+    if count != expected:
+        raise RuntimeError('iterated {} items, expected {}'.format(count, expected))
+    return count / elapsed
+
+
+def _version_negotiation(url, count):
+    from pypureclient._helpers import get_target_versions
+    configuration = _configuration(url)
+    return _construct(lambda: get_target_versions(configuration, 'flasharray', 'version'), count)
+
+
+def _case_functions(args):
+    url = args.url
+    names = ['vol{}'.format(i) for i in range(10)]
+    constructions = max(1, args.calls // 10)
+    return {
+        'version_negotiation': ('calls/s', lambda: _version_negotiation(url, constructions)),
+        'construct_fa_api_token': ('clients/s', lambda: _construct(
+            lambda: _fa_client(url, api_token='token'), constructions)),
+        'construct_fa_id_token': ('clients/s', lambda: _construct(
+            lambda: _fa_client(url, id_token='id-token'), constructions)),
+        'construct_fb_api_token': ('clients/s', lambda: _construct(
+            lambda: _fb_client(url, api_token='token'), constructions)),
+        'call_fa_get_volumes_names': ('calls/s', lambda: _calls_with(
+            _fa_client(url, api_token='token'), 'get_volumes', args.calls, names=names)),
+        'call_fa_get_volumes_performance_names': ('calls/s', lambda: _calls_with(
+            _fa_client(url, api_token='token'), 'get_volumes_performance', args.calls, names=names)),
+        'call_fb_get_file_systems_names': ('calls/s', lambda: _calls_with(
+            _fb_client(url, api_token='token'), 'get_file_systems', args.calls,
+            names=['fs{}'.format(i) for i in range(10)])),
+        'items_fa_volumes': ('items/s', lambda: _iterate_with(
+            _fa_client(url, api_token='token', **_paging(args)), 'get_volumes', args.items)),
+        'items_fa_volume_snapshots': ('items/s', lambda: _iterate_with(
+            _fa_client(url, api_token='token', **_paging(args)), 'get_volume_snapshots', args.items)),
+        'items_fa_volumes_performance': ('items/s', lambda: _iterate_with(
+            _fa_client(url, api_token='token', **_paging(args)), 'get_volumes_performance', args.items)),
+        # FlashBlade iterators stay on their page, the pages are followed by
+        # their continuation token
+        'items_fb_file_systems': ('items/s', lambda: _iterate_pages(
+            _fb_client(url, api_token='token').get_file_systems, args.items, args.page_size)),
+    }
+
+
+def _paging(args):
+    return {'auto_pagination_limit': args.page_size} if args.page_size else {}
+
+
+def _calls_with(client, method, count, **kwargs):
+    return _calls(lambda: getattr(client, method)(**kwargs), count)
+
+
+def _iterate_with(client, method, expected):
+    return _iterate(getattr(client, method), expected)
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024.0 * 1024.0) if sys.platform == 'darwin' else peak / 1024.0
+
+
+def run_case(args):
+    """Runs one case in this interpreter and prints its result as JSON."""
+    unit, function = _case_functions(args)[args.case]
+    # the OAuth2 token manager caches the access token in the working directory
+    os.chdir(tempfile.mkdtemp(prefix='pypureclient-benchmark-'))
+    value = function()
+    print(json.dumps({'case': args.case, 'unit': unit, 'value': value, 'peak_rss_mb': _peak_rss_mb()}))
+
+
+def _spawn(case, url, args):
+    command = [sys.executable, os.path.abspath(__file__), '--case', case, '--url', url,
+               '--items', str(args.items), '--page-size', str(args.page_size), '--calls', str(args.calls)]
+    completed = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    if completed.returncode != 0:
+        raise RuntimeError('case {} failed:\n{}'.format(case, completed.stderr))
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _compare(results, baseline, threshold):
+    """Prints the change of each case from a saved run, returns the regressions."""
+    baseline = {result['case']: result for result in baseline['results']}
+    regressions = []
+    print()
+    print('{:<40}{:>14}{:>14}{:>10}'.format('compared to baseline', 'baseline', 'now', 'change'))
+    for result in results:
+        before = baseline.get(result['case'])
+        if before is None:
+            continue
+        # every unit is a rate, higher is better
+        change = result['value'] / before['value'] - 1.0
+        flag = ''
+        if change < -threshold:
+            regressions.append(result['case'])
+            flag = '  REGRESSION'
+        print('{:<40}{:>14.1f}{:>14.1f}{:>+10.1%}{}'.format(result['case'], before['value'], result['value'],
+                                                           change, flag))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=20000, help='number of items of each collection')
+    parser.add_argument('--page-size', type=int, default=1000, help='items per page, 0 for one page')
+    parser.add_argument('--calls', type=int, default=300, help='number of calls of the call cases')
+    parser.add_argument('--cases', nargs='*', help='cases to run, all by default')
+    parser.add_argument('--save', help='file to save the results to, as JSON')
+    parser.add_argument('--compare', help='results saved by a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='slowdown from the compared run reported as a regression')
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    parser.add_argument('--url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        return run_case(args)
+
+    case_names = list(_case_functions(args))
+    for case in args.cases or ():
+        if case not in case_names:
+            parser.error('unknown case {}, expected one of {}'.format(case, ', '.join(case_names)))
+    results = []
+    with MockArray(items=args.items, page_size=args.page_size) as array:
+        print('{} items per collection, {} per page, {} calls'.format(args.items, args.page_size, args.calls))
+        print('{:<40}{:>14}{:<12}{:>14}'.format('case', 'rate', '', 'peak RSS MB'))
+        for case in args.cases or case_names:
+            result = _spawn(case, array.url, args)
+            results.append(result)
+            print('{:<40}{:>14.1f} {:<11}{:>14}'.format(
+                case, result['value'], result['unit'],
+                '' if result['peak_rss_mb'] is None else '{:.1f}'.format(result['peak_rss_mb'])))
+
+    if args.save:
+        with open(args.save, 'w') as save_file:
+            json.dump({'items': args.items, 'page_size': args.page_size, 'calls': args.calls,
+                       'python': sys.version.split()[0], 'results': results}, save_file, indent=2)
+    if args.compare:
+        with open(args.compare) as compare_file:
+            regressions = _compare(results, json.load(compare_file), args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
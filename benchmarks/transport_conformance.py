@@ -0,0 +1,390 @@
+"""
+Conformance checks of the transport backends of the REST clients, against a
+local HTTP server.
+
+Each backend has to answer requests with responses shaped like urllib3's,
+read or streamed, send JSON, form and multipart bodies, decode compressed
+bodies while counting the bytes transferred, reuse its connections, raise
+connection errors and timeouts as urllib3 errors, and serve a client from
+end to end. A new backend passes them before it is added to
+`pypureclient._transport.backends.BACKENDS`.
+
+The local server speaks HTTP/1.1 only, so HTTP/2 is not exercised here.
+
+Usage:
+    python benchmarks/transport_conformance.py [--backends NAME ...]
+"""
+import argparse
+import gzip
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import urllib.parse
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..'))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+import urllib3  # noqa: E402
+
+from mock_array import MockArray  # noqa: E402
+from pypureclient._transport import rest  # noqa: E402
+from pypureclient._transport.backends import BACKENDS, get_backend_class  # noqa: E402
+from pypureclient._transport.configuration import Configuration  # noqa: E402
+from pypureclient._transport.multipart import MultipartEncoder, UploadFile  # noqa: E402
+from pypureclient.retry_policy import _is_connect_error  # noqa: E402
+
+BIG_BODY = bytes(range(256)) * 4096
+JSON_BODY = {'items': [{'name': 'vol{}'.format(i), 'size': i} for i in range(100)]}
+
+
+class _Server(object):
+    """Local HTTP/1.1 server counting the connections it accepted."""
+
+    def __init__(self):
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _handler(self))
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self._server.server_address[1])
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _handler(server):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            with server._lock:
+                server.connections += 1
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body, content_type='application/json', headers=None):
+            if not isinstance(body, bytes):
+                body = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # the client timed out
+                pass
+
+        def do_GET(self):
+            parts = urllib.parse.urlsplit(self.path)
+            query = dict(urllib.parse.parse_qsl(parts.query))
+            if parts.path == '/json':
+                return self._send(200, JSON_BODY, headers={
+                    'X-Request-ID': self.headers.get('X-Request-ID', ''),
+                    'X-RateLimit-Limit-second': '10', 'x-next-token': 'token'})
+            if parts.path == '/big':
+                return self._send(200, BIG_BODY, 'application/octet-stream')
+            if parts.path == '/gzip':
+                if 'gzip' not in self.headers.get('Accept-Encoding', ''):
+                    return self._send(200, BIG_BODY, 'application/octet-stream')
+                return self._send(200, gzip.compress(BIG_BODY), 'application/octet-stream',
+                                  {'Content-Encoding': 'gzip'})
+            if parts.path.startswith('/status/'):
+                status = int(parts.path.rsplit('/', 1)[1])
+                return self._send(status, {'errors': [{'message': 'status {}'.format(status)}]})
+            if parts.path == '/slow':
+                time.sleep(float(query.get('delay', 1)))
+                return self._send(200, {})
+            return self._send(404, {})
+
+        def do_POST(self):
+            length = self.headers.get('Content-Length')
+            if length is not None:
+                body = self.rfile.read(int(length))
+            else:
+                body = self._read_chunked()
+            self._send(200, {'content_type': self.headers.get('Content-Type'), 'length': len(body),
+                             'body': body.decode('latin-1')})
+
+        def _read_chunked(self):
+            body = b''
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if not size:
+                    self.rfile.readline()
+                    return body
+                body += self.rfile.read(size)
+                self.rfile.readline()
+
+    return Handler
+
+
+def _configuration(**settings):
+    configuration = Configuration()
+    for name, value in settings.items():
+        setattr(configuration, name, value)
+    return configuration
+
+
+def _backend(name, **settings):
+    return get_backend_class(name)(_configuration(**settings), 4, 4)
+
+
+def check_read_response(name, server):
+    backend = _backend(name)
+    r = backend.request('GET', server.url + '/json', fields={}, headers={'X-Request-ID': 'abc'})
+    assert r.status == 200, r.status
+    assert r.reason == 'OK', r.reason
+    assert json.loads(r.data) == JSON_BODY
+    # headers are case insensitive
+    assert r.headers['x-request-id'] == 'abc'
+    assert r.headers.get('X-RATELIMIT-LIMIT-SECOND') == '10'
+    assert r.headers['X-Next-Token'] == 'token'
+    assert r.tell() == len(r.data), (r.tell(), len(r.data))
+    backend.close()
+
+
+def check_error_statuses(name, server):
+    backend = _backend(name)
+    for status in (400, 404, 429, 503):
+        r = backend.request('GET', server.url + '/status/{}'.format(status), fields={})
+        assert r.status == status, r.status
+        assert json.loads(r.data)['errors'][0]['message'] == 'status {}'.format(status)
+    backend.close()
+
+
+def check_stream(name, server):
+    backend = _backend(name)
+    r = backend.request('GET', server.url + '/big', fields={}, preload_content=False)
+    chunks = list(r.stream(65536))
+    assert b''.join(chunks) == BIG_BODY
+    assert len(chunks) >= len(BIG_BODY) // 65536, len(chunks)
+    assert r.tell() == len(BIG_BODY)
+    r.release_conn()
+    r = backend.request('GET', server.url + '/big', fields={}, preload_content=False)
+    read = []
+    while True:
+        chunk = r.read(10000)
+        if not chunk:
+            break
+        assert len(chunk) <= 10000
+        read.append(chunk)
+    assert b''.join(read) == BIG_BODY
+    r.release_conn()
+    backend.close()
+
+
+def check_compressed(name, server):
+    backend = _backend(name)
+    r = backend.request('GET', server.url + '/gzip', fields={}, headers={'Accept-Encoding': 'gzip'})
+    assert r.data == BIG_BODY
+    assert r.tell() < len(BIG_BODY), r.tell()
+    # no compression unless asked for
+    r = backend.request('GET', server.url + '/gzip', fields={})
+    assert r.data == BIG_BODY and r.tell() == len(BIG_BODY)
+    backend.close()
+
+
+def check_bodies(name, server):
+    backend = _backend(name)
+    r = backend.request('POST', server.url + '/echo', body='{"a": 1}',
+                        headers={'Content-Type': 'application/json'})
+    echo = json.loads(r.data)
+    assert echo['body'] == '{"a": 1}' and echo['content_type'] == 'application/json', echo
+    r = backend.request('POST', server.url + '/echo', body=b'\x00\xff',
+                        headers={'Content-Type': 'application/octet-stream'})
+    assert json.loads(r.data)['length'] == 2
+    r = backend.request('POST', server.url + '/echo', fields={'grant_type': 'a b', 'token': 'x&y'},
+                        encode_multipart=False, headers={'Content-Type': 'application/x-www-form-urlencoded'})
+    echo = json.loads(r.data)
+    assert urllib.parse.parse_qs(echo['body']) == {'grant_type': ['a b'], 'token': ['x&y']}, echo
+    backend.close()
+
+
+def check_multipart(name, server):
+    backend = _backend(name)
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        f.write(BIG_BODY)
+    try:
+        for known_length in (True, False):
+            encoder = MultipartEncoder([('file', UploadFile(f.name)), ('name', 'upload')])
+            headers = {'Content-Type': encoder.content_type}
+            if known_length:
+                headers['Content-Length'] = str(encoder.length)
+            r = backend.request('POST', server.url + '/echo', body=encoder, headers=headers)
+            encoder.close()
+            echo = json.loads(r.data)
+            assert echo['content_type'] == encoder.content_type, echo['content_type']
+            assert echo['length'] == encoder.length, (echo['length'], encoder.length)
+            assert BIG_BODY.decode('latin-1') in echo['body']
+    finally:
+        os.remove(f.name)
+    backend.close()
+
+
+def check_connection_reuse(name, server):
+    backend = _backend(name)
+    before = server.connections
+    for _ in range(20):
+        assert backend.request('GET', server.url + '/json', fields={}).status == 200
+    r = backend.request('GET', server.url + '/big', fields={}, preload_content=False)
+    r.read()
+    r.release_conn()
+    assert server.connections - before == 1, server.connections - before
+    stats = backend.pool_stats()
+    assert stats['backend'] == name, stats
+    assert stats['requests'] == 21, stats
+    assert stats['pools'] == 1 and stats['connections'] == 1 and stats['idle_connections'] == 1, stats
+    assert stats['http_version'] in ('HTTP/1.1', 'HTTP/2'), stats
+    backend.close()
+
+
+def check_concurrent(name, server):
+    backend = _backend(name)
+    errors = []
+
+    def call():
+        try:
+            for _ in range(10):
+                assert json.loads(backend.request('GET', server.url + '/json', fields={}).data) == JSON_BODY
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+    assert backend.pool_stats()['requests'] == 80
+    backend.close()
+
+
+def check_connection_error(name, server):
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    backend = _backend(name, retries=False)
+    try:
+        backend.request('GET', 'http://127.0.0.1:{}/json'.format(port), fields={})
+    except urllib3.exceptions.HTTPError as e:
+        assert _is_connect_error(e), repr(e)
+    else:
+        raise AssertionError('no error for a refused connection')
+    backend.close()
+
+
+def check_timeout(name, server):
+    backend = _backend(name, retries=False)
+    start = time.monotonic()
+    try:
+        backend.request('GET', server.url + '/slow?delay=2', fields={},
+                        timeout=urllib3.Timeout(connect=1, read=0.2))
+    except urllib3.exceptions.HTTPError as e:
+        assert not _is_connect_error(e), repr(e)
+    else:
+        raise AssertionError('no error for a read timeout')
+    assert time.monotonic() - start < 1.5
+    r = backend.request('GET', server.url + '/slow?delay=0.1', fields={}, timeout=urllib3.Timeout(total=2))
+    assert r.status == 200
+    backend.close()
+
+
+def check_rest_client(name, server):
+    client = rest.RESTClientObject(_configuration(transport=name, share_connection_pools=False))
+    r = client.request('GET', server.url + '/json')
+    assert json.loads(r.data) == JSON_BODY and r.getheader('x-next-token') == 'token'
+    try:
+        client.request('GET', server.url + '/status/404')
+    except rest.NotFoundException as e:
+        assert e.status == 404 and e.headers is not None
+    else:
+        raise AssertionError('no error for a 404 status')
+    assert client.pool_stats()['requests'] == 2
+    client.close()
+
+
+def check_client(name, server):
+    from pypureclient.flasharray.FA_2_38 import Client
+    cwd = os.getcwd()
+    # the token managers write their cache to the working directory
+    os.chdir(tempfile.mkdtemp())
+    try:
+        with MockArray(items=2500) as array:
+            configuration = _configuration(transport=name, share_connection_pools=False)
+            configuration.host = array.url
+            client = Client(configuration=configuration, api_token='token', auto_pagination_limit=1000)
+            names = [volume.name for volume in client.get_volumes().items]
+            assert names == ['vol{}'.format(i) for i in range(2500)], len(names)
+            stats = client._api_client.rest_client.pool_stats()
+            assert stats['backend'] == name and stats['requests'] == 3, stats
+    finally:
+        os.chdir(cwd)
+
+
+CHECKS = [
+    check_read_response,
+    check_error_statuses,
+    check_stream,
+    check_compressed,
+    check_bodies,
+    check_multipart,
+    check_connection_reuse,
+    check_concurrent,
+    check_connection_error,
+    check_timeout,
+    check_rest_client,
+    check_client,
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--backends', nargs='*', default=sorted(BACKENDS), help='backends to check')
+    parser.add_argument('-v', '--verbose', action='store_true', help='print the traceback of failures')
+    args = parser.parse_args()
+
+    server = _Server()
+    failures = 0
+    try:
+        for name in args.backends:
+            try:
+                _backend(name).close()
+            except Exception as e:
+                print('{:<10}skipped: {}'.format(name, e))
+                continue
+            for check in CHECKS:
+                try:
+                    check(name, server)
+                    result = 'ok'
+                except Exception as e:
+                    failures += 1
+                    result = 'FAILED: {!r}'.format(e)
+                    if args.verbose:
+                        traceback.print_exc()
+                print('{:<10}{:<30}{}'.format(name, check.__name__[len('check_'):], result))
+    finally:
+        server.stop()
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -16,7 +16,11 @@ flasharray = __LazyLoader("pypureclient.flasharray")
 flashblade = __LazyLoader("pypureclient.flashblade")
 pure1      = __LazyLoader("pypureclient.pure1")
 
-from .exceptions import PureError
+from .exceptions import PureError, CircuitOpenError
 from .properties import Property, Filter
 from .responses import ValidResponse, ErrorResponse, ApiError, ResponseHeaders
+from .hooks import ClientHooks, LatencyRecorder
+from .profiling import CallProfile, profile_call
+from .retry_policy import RetryPolicy, RetryBudget, retrying
+from ._transport.circuit_breaker import get_circuit_state
 from ._version import __version__
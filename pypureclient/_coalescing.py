@@ -0,0 +1,251 @@
+import threading
+import time
+
+from concurrent import futures
+from urllib.parse import quote
+
+from .keywords import Parameters
+from .responses import ValidResponse, ItemIterator
+
+# Parameters a coalesced lookup merges, and the item attribute matching them
+_LOOKUP_PARAMETERS = {'names': 'name', 'ids': 'id'}
+# Parameters which make a call ineligible, its items depend on the call
+_PAGING_PARAMETERS = (Parameters.continuation_token, Parameters.limit, Parameters.offset,
+                      'total_only', 'allow_errors')
+# Parameters which may differ between the calls of a batch
+_CALL_PARAMETERS = (Parameters.x_request_id, '_request_timeout')
+# Seconds the calls of a batch key are sent as is after a batch of that key
+# failed, not to send a merged request which fails before each of them
+_UNMERGED_SECONDS = 10.0
+
+_local = threading.local()
+_coalescers_lock = threading.Lock()
+
+
+def coalesce_lookup(client, api_class_name, api_function_name, kwargs):
+    """
+    Send a GET of objects by names or ids along with the concurrent GETs of
+    the same endpoint and parameters, if the configuration of the client
+    enables coalescing.
+
+    Args:
+        client: The generated client making the call.
+        api_class_name (str): Swagger-generated api class to call.
+        api_function_name (str): Swagger-generated function to call.
+        kwargs (dict): kwargs to pass to the function.
+
+    Returns:
+        ValidResponse: The items of the coalesced response the call asked for.
+        None: If the call is to be sent as is.
+    """
+    configuration = client._api_client.configuration
+    if not getattr(configuration, 'coalesce_window', 0) or getattr(_local, 'sending', False):
+        return None
+    coalescer = getattr(client, '_coalescer', None)
+    if coalescer is None:
+        with _coalescers_lock:
+            coalescer = getattr(client, '_coalescer', None)
+            if coalescer is None:
+                coalescer = client._coalescer = RequestCoalescer(
+                    client, configuration.coalesce_window, configuration.coalesce_max_values,
+                    configuration.coalesce_max_query_length)
+    return coalescer.call(api_class_name, api_function_name, kwargs)
+
+
+class RequestCoalescer(object):
+    """
+    Merges the GETs of objects by names or ids which a client makes
+    concurrently to the same endpoint, with the same other parameters, into
+    one request for all of their names or ids.
+
+    The first call of a batch waits for the others during a time window, or
+    until the batch is full, sends the request and hands each call the items
+    it asked for. If the response is an error, or holds items no call asked
+    for, every call is sent on its own instead, and so are the calls with the
+    same batch key for a while, so that a lookup failing, e.g. because one of
+    its names does not exist, doesn't cost a merged request every time.
+    """
+
+    def __init__(self, client, window, max_values, max_query_length):
+        """
+        Initialize a RequestCoalescer.
+
+        Args:
+            client: The generated client sending the requests.
+            window (float): Seconds the first call of a batch waits for others.
+            max_values (int): Maximum number of names or ids of a request.
+            max_query_length (int): Maximum length of the names or ids
+                parameter of a request, once URL encoded.
+        """
+        self._client = client
+        self._window = window
+        self._max_values = max_values
+        self._max_query_length = max_query_length
+        self._lock = threading.Lock()
+        # batch key -> _Batch accepting calls
+        self._batches = {}
+        # batch key -> time until which its calls are sent as is
+        self._unmerged = {}
+
+    def call(self, api_class_name, api_function_name, kwargs):
+        """
+        Add a call to a batch and wait for the response of the batch.
+
+        Returns:
+            ValidResponse: The items of the batch response the call asked for.
+            None: If the call is to be sent as is.
+        """
+        key = _batch_key(api_function_name, kwargs)
+        if key is None or self._is_unmerged(key):
+            return None
+        parameter = key[1]
+        values = kwargs[parameter]
+        values = [values] if isinstance(values, str) else list(values)
+        future = futures.Future()
+        with self._lock:
+            batch = self._batches.get(key)
+            if batch is None or not batch.add(values, future, self._max_values, self._max_query_length):
+                batch = _Batch(parameter)
+                batch.add(values, future, None, None)
+                self._batches[key] = batch
+                leader = True
+            else:
+                leader = False
+        if leader:
+            batch.full.wait(self._window)
+            with self._lock:
+                if self._batches.get(key) is batch:
+                    del self._batches[key]
+            self._send(api_class_name, api_function_name, kwargs, key, batch)
+        return future.result()
+
+    def _is_unmerged(self, key):
+        until = self._unmerged.get(key)
+        if until is None:
+            return False
+        if time.monotonic() < until:
+            return True
+        with self._lock:
+            if self._unmerged.get(key) == until:
+                del self._unmerged[key]
+        return False
+
+    def _send(self, api_class_name, api_function_name, kwargs, key, batch):
+        if len(batch.calls) == 1:
+            # nothing to merge, the call is sent as is
+            batch.calls[0][1].set_result(None)
+            return
+        merged_kwargs = dict(kwargs)
+        merged_kwargs[batch.parameter] = batch.values
+        _local.sending = True
+        try:
+            response = self._client._call_api(api_class_name, api_function_name, merged_kwargs)
+            responses = _split_response(response, batch)
+        except BaseException as e:
+            for _, future in batch.calls:
+                future.set_exception(e)
+            return
+        finally:
+            _local.sending = False
+        if responses is None:
+            with self._lock:
+                self._unmerged[key] = time.monotonic() + _UNMERGED_SECONDS
+        for (_, future), call_response in zip(batch.calls, responses or [None] * len(batch.calls)):
+            future.set_result(call_response)
+
+
+class _Batch(object):
+
+    def __init__(self, parameter):
+        self.parameter = parameter
+        self.values = []
+        self.calls = []
+        self.full = threading.Event()
+        self._seen = set()
+        self._query_length = 0
+
+    def add(self, values, future, max_values, max_query_length):
+        """
+        Add the values of a call, unless the batch would exceed the limits.
+
+        Returns:
+            bool: True if the call was added.
+        """
+        new_values = [v for v in dict.fromkeys(values) if v not in self._seen]
+        query_length = self._query_length + sum(len(quote(str(v), safe='')) + 1 for v in new_values)
+        if max_values is not None and (len(self.values) + len(new_values) > max_values or
+                                       query_length > max_query_length):
+            self.full.set()
+            return False
+        self.values.extend(new_values)
+        self._seen.update(new_values)
+        self._query_length = query_length
+        self.calls.append((values, future))
+        if max_values is not None and len(self.values) >= max_values:
+            self.full.set()
+        return True
+
+
+def _batch_key(api_function_name, kwargs):
+    """The key of the batches a call can join, None if it can't be merged."""
+    if not api_function_name.endswith('_get_with_http_info'):
+        return None
+    parameters = [p for p in _LOOKUP_PARAMETERS if kwargs.get(p)]
+    if len(parameters) != 1 or kwargs.get('_preload_content') is False:
+        return None
+    if any(kwargs.get(p) is not None for p in _PAGING_PARAMETERS):
+        return None
+    try:
+        others = frozenset((k, _freeze(v)) for k, v in kwargs.items()
+                           if k not in _CALL_PARAMETERS and k != parameters[0])
+        hash(others)
+    except TypeError:
+        return None
+    return api_function_name, parameters[0], others
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    return value
+
+
+def _split_response(response, batch):
+    """
+    Build the response of each call of a batch from the batch response.
+
+    Returns:
+        list[ValidResponse]: The responses, in the order of the calls.
+        None: If the calls are to be sent on their own.
+    """
+    if not isinstance(response, ValidResponse) or response.items is None:
+        return None
+    attribute = _LOOKUP_PARAMETERS[batch.parameter]
+    # names are case insensitive
+    normalize = str.casefold if attribute == 'name' else (lambda value: value)
+    call_items = [[] for _ in batch.calls]
+    call_values = [{normalize(str(v)) for v in values} for values, _ in batch.calls]
+    for item in response.items:
+        value = item.get(attribute) if isinstance(item, dict) else getattr(item, attribute, None)
+        matched = False
+        if value is not None:
+            value = normalize(str(value))
+            for items, values in zip(call_items, call_values):
+                if value in values:
+                    items.append(item)
+                    matched = True
+        if not matched:
+            # the items don't map to the parameter, e.g. their names differ
+            return None
+    x_request_id = response.headers.x_request_id if response.headers is not None else None
+    responses = []
+    for items in call_items:
+        call_response = ValidResponse(response.status_code, None, len(items),
+                                      iter(ItemIterator(None, {}, None, len(items), items, x_request_id,
+                                                        more_items_remaining=False)),
+                                      None)
+        call_response.headers = response.headers
+        responses.append(call_response)
+    return responses
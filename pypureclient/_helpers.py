@@ -1,5 +1,4 @@
 import uuid
-import json
 
 from typing import Union, Tuple, Optional
 
@@ -42,7 +41,7 @@ def get_target_versions(configuration: Configuration, target_type, key_to_check,
                                 response_types_map = {'200': "bytearray"},
                                 _request_timeout=timeout,
                                 _return_http_data_only=True)
-            _data = json.loads(_response_data)
+            _data = _client.json_codec.loads(_response_data)
             if key_to_check in _data:
                 return _data[key_to_check]
             else:
@@ -5,12 +5,15 @@ from __future__ import annotations
 import atexit
 import datetime
 from dateutil.parser import parse
+import functools
 import json
 import mimetypes
 from multiprocessing.pool import ThreadPool
 import os
 import re
 import tempfile
+import time
+from typing import Any, Callable, Dict, Tuple
 
 from urllib.parse import quote
 try:
@@ -22,6 +25,18 @@ except ModuleNotFoundError:
 from .configuration import Configuration
 from .api_response import ApiResponse
 from . import rest
+from .json_codec import get_json_codec
+from .json_stream import JSONItemStream, StreamedModel
+from .raw_model import RawModel
+from .lazy_model import LazyModel, lazy_items
+from .compact_model import compact_class, compact_items
+from .download import FileDownload
+from .multipart import UploadFile
+from .rate_limit import get_rate_limiter
+from .hedging import RequestHedger
+from .cassette import CassetteRESTClientObject
+from .. import profiling, tracing
+from ..projection import current_projection
 from .exceptions import ApiValueError, ApiException
 
 
@@ -55,6 +70,8 @@ class ApiClient:
         'object': object,
     }
     _pool = None
+    rest_client = None
+    hedger = None
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
                  cookie=None, pool_threads=1, models_package=None) -> None:
@@ -64,7 +81,7 @@ class ApiClient:
         self.configuration = configuration
         self.pool_threads = pool_threads
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self._create_rest_client(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -73,6 +90,24 @@ class ApiClient:
         self.user_agent = 'pure/py-pure-client'
         self.client_side_validation = configuration.client_side_validation
         self.models_package = models_package
+        self.json_codec = get_json_codec(configuration.json_codec)
+        # (models package, type) -> compiled deserializer
+        self._deserializers: Dict[Tuple[str, Any], Callable] = {}
+        # paces the requests of every client of the target
+        self.rate_limiter = None
+        if configuration.rate_limiting:
+            self.rate_limiter = get_rate_limiter(configuration.host)
+        # sends a duplicate of the GETs whose response is late
+        self.hedger = None
+        if configuration.hedging:
+            self.hedger = RequestHedger(configuration.hedge_percentile, configuration.hedge_min_delay,
+                                        max_workers=2 * (configuration.connection_pool_maxsize or 4))
+
+    def _create_rest_client(self, configuration):
+        """Creates the REST client used to send the requests."""
+        if getattr(configuration, 'cassette', None):
+            return CassetteRESTClientObject(configuration)
+        return rest.RESTClientObject(configuration)
 
     def __enter__(self):
         return self
@@ -84,6 +119,10 @@ class ApiClient:
         self.close()
 
     def close(self):
+        if self.rest_client is not None:
+            self.rest_client.close()
+        if self.hedger is not None:
+            self.hedger.close()
         if self._pool:
             self._pool.close()
             self._pool.join()
@@ -148,6 +187,84 @@ class ApiClient:
             _preload_content=True, _request_timeout=None, _host=None,
             _request_auth=None):
 
+        method, url, header_params, post_params, body = self._build_request(
+            resource_path, method, path_params, query_params, header_params,
+            body, post_params, files, auth_settings, collection_formats,
+            _host, _request_auth)
+        profiling.lap('params')
+
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve()
+            if delay:
+                time.sleep(delay)
+        profiling.skip()
+        with tracing.request_span(self.configuration, method, url, header_params) as span:
+            try:
+                # perform request and return response
+                send = functools.partial(
+                    self.request, method, url,
+                    query_params=query_params,
+                    headers=header_params,
+                    post_params=post_params, body=body,
+                    _preload_content=_preload_content,
+                    _request_timeout=_request_timeout)
+                if self.hedger is not None and method == 'GET' and _preload_content:
+                    # each request gets its own headers, the REST client adds to them
+                    response_data = self.hedger.send(lambda: send(headers=dict(header_params)),
+                                                     may_hedge=self._may_hedge)
+                else:
+                    response_data = send()
+            except ApiException as e:
+                profiling.lap('send')
+                tracing.set_response(span, e.status, e.headers, len(e.body or b''))
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(e.headers)
+                if e.body:
+                    e.body = e.body.decode('utf-8')
+                raise e
+            tracing.set_response(span, response_data.status, response_data.getheaders(),
+                                 getattr(response_data, 'wire_bytes', None))
+        profiling.lap('send')
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response_data.getheaders())
+
+        # files not preloaded may be requested again, from the byte their
+        # transfer was interrupted at
+        reopen = functools.partial(self._reopen_request, method, url, header_params,
+                                   post_params, body, _request_timeout)
+        return self._handle_response(response_data, response_types_map,
+                                     _preload_content, _return_http_data_only,
+                                     reopen=reopen)
+
+    def _may_hedge(self):
+        """Whether a hedge can be sent without waiting for the rate limits."""
+        return self.rate_limiter is None or self.rate_limiter.try_reserve()
+
+    def _reopen_request(self, method, url, header_params, post_params, body,
+                        _request_timeout, extra_headers):
+        """Sends a request again, with extra headers, without reading its body.
+
+        The access token of the client may have been refreshed since the
+        request was sent, its current default headers replace those sent.
+        """
+        headers = dict(header_params or {})
+        headers.update(self.sanitize_for_serialization(self.default_headers))
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        headers.update(extra_headers)
+        return self.request(method, url, headers=headers,
+                            post_params=post_params, body=body,
+                            _preload_content=False,
+                            _request_timeout=_request_timeout)
+
+    def _build_request(self, resource_path, method, path_params, query_params,
+                       header_params, body, post_params, files, auth_settings,
+                       collection_formats, _host, _request_auth):
+        """Builds the url, headers and payload of a request.
+
+        :return: tuple of method, url, header parameters, post parameters
+            and body, ready to be passed to the REST client.
+        """
         config = self.configuration
 
         # header parameters
@@ -200,33 +317,50 @@ class ApiClient:
         # query parameters
         if query_params:
             query_params = self.sanitize_for_serialization(query_params)
+            profiling.lap('params')
             url_query = self.parameters_to_url_query(query_params,
                                                      collection_formats)
+            profiling.lap('url_encode')
             url += "?" + url_query
 
-        try:
-            # perform request and return response
-            response_data = self.request(
-                method, url,
-                query_params=query_params,
-                headers=header_params,
-                post_params=post_params, body=body,
-                _preload_content=_preload_content,
-                _request_timeout=_request_timeout)
-        except ApiException as e:
-            if e.body:
-                e.body = e.body.decode('utf-8')
-            raise e
+        return method, url, header_params, post_params, body
 
+    def _handle_response(self, response_data, response_types_map,
+                         _preload_content, _return_http_data_only, reopen=None):
+        """Decodes and deserializes a successful response.
+
+        :param response_data: RESTResponse returned by the REST client.
+        :param reopen: function sending the request again with extra headers,
+            used to resume the download of a file.
+        :return: deserialized data if _return_http_data_only is set,
+            ApiResponse otherwise.
+        """
         self.last_response = response_data
 
+        if not _preload_content:
+            response_type = self._get_response_type(response_data, response_types_map)
+            if (response_type in ("bytearray", "file") or
+                    'application/octet-stream' == response_data.getheader('content-type')):
+                # files are written by the caller, chunk by chunk
+                return_data = FileDownload(response_data, reopen, self.configuration.temp_folder_path)
+            elif self.configuration.stream_items:
+                # list responses are decoded item by item as they are read
+                return_data = self.deserialize_stream(response_data, response_type)
+            else:
+                return_data = None
+            if return_data is not None:
+                if _return_http_data_only:
+                    return return_data
+                return ApiResponse(status_code = response_data.status,
+                                   data = return_data,
+                                   headers = response_data.getheaders(),
+                                   raw_data = None)
+
         return_data = None # assuming deserialization is not needed
+        raw_data_encoding = None
         # data needs deserialization or returns HTTP data (deserialized) only
         if _preload_content or _return_http_data_only:
-          response_type = response_types_map.get(str(response_data.status), None)
-          if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
-              # if not found, look for '1XX', '2XX', etc.
-              response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
+          response_type = self._get_response_type(response_data, response_types_map)
 
           if response_type == "bytearray" or 'application/octet-stream' == response_data.getheader('content-type'):
               response_data.data = response_data.data
@@ -236,7 +370,14 @@ class ApiClient:
               if content_type is not None:
                   match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
               encoding = match.group(1) if match else "utf-8"
-              response_data.data = response_data.data.decode(encoding)
+              if response_type and encoding.lower() in ('utf-8', 'utf8'):
+                  # the JSON codec decodes UTF-8 bytes, don't copy the body
+                  # into a str, the raw data is decoded only if accessed
+                  raw_data_encoding = encoding
+              else:
+                  profiling.skip()
+                  response_data.data = response_data.data.decode(encoding)
+                  profiling.lap('decode')
 
           # deserialize response data
           if response_type == "bytearray":
@@ -252,7 +393,21 @@ class ApiClient:
             return ApiResponse(status_code = response_data.status,
                            data = return_data,
                            headers = response_data.getheaders(),
-                           raw_data = response_data.data)
+                           raw_data = response_data.data,
+                           raw_data_encoding = raw_data_encoding)
+
+    def _get_response_type(self, response_data, response_types_map):
+        """Looks up the type a response is deserialized to by its status.
+
+        :param response_data: RESTResponse returned by the REST client.
+        :param response_types_map: dict of status to type name.
+        :return: type name, None if the response is not deserialized.
+        """
+        response_type = response_types_map.get(str(response_data.status), None)
+        if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
+            # if not found, look for '1XX', '2XX', etc.
+            response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
+        return response_type
 
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
@@ -315,12 +470,134 @@ class ApiClient:
             return self.__deserialize_file(response)
 
         # fetch data from response object
+        profiling.skip()
         try:
-            data = json.loads(response.data)
+            data = self.json_codec.loads(response.data)
         except ValueError:
             data = response.data
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+        profiling.lap('json')
+
+        projection = current_projection()
+        if projection is not None:
+            items_class = self.__items_class(response_type)
+            if items_class is not None:
+                projection.validate(items_class)
+            # fields left out are not deserialized
+            data = projection.project_body(data)
+
+        if self.configuration.raw_items:
+            raw_model = self.__raw_model(data, response_type)
+            if raw_model is not None:
+                profiling.lap('models')
+                return raw_model
+        elif self.configuration.lazy_items:
+            lazy_model = self.__lazy_model(data, response_type)
+            if lazy_model is not None:
+                profiling.lap('models')
+                return lazy_model
+        elif self.configuration.compact_items:
+            compact_model = self.__compact_model(data, response_type)
+            if compact_model is not None:
+                profiling.lap('models')
+                return compact_model
+        result = self.__deserialize(data, response_type)
+        profiling.lap('models')
+        return result
+
+    def deserialize_stream(self, response, response_type):
+        """Deserializes a JSON response into a model whose `items` are
+        decoded one at a time while the body is read.
+
+        :param response: urllib3.HTTPResponse read with preload_content=False.
+        :param response_type: string of class name.
+
+        :return: StreamedModel, None if the response has no items to stream.
+        """
+        if not isinstance(response_type, str) or response_type in self.NATIVE_TYPES_MAPPING:
+            return None
+        content_type = response.getheader('content-type')
+        if content_type is None or not re.search('json', content_type, re.IGNORECASE):
+            return None
+        klass = getattr(self.models_package, response_type, None)
+        items_field = getattr(klass, '__fields__', {}).get('items')
+        if items_field is None:
+            return None
+        match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
+        encoding = match.group(1) if match else "utf-8"
+        item_deserializer = None
+        if not self.configuration.raw_items:
+            if self.configuration.lazy_items and hasattr(items_field.type_, '__fields__'):
+                item_deserializer = lazy_items(items_field.type_)
+            elif self.configuration.compact_items and hasattr(items_field.type_, '__fields__'):
+                item_deserializer = compact_items(items_field.type_)
+            else:
+                item_deserializer = getattr(items_field.type_, 'from_dict', None)
+        projection = current_projection()
+        if projection is not None:
+            if hasattr(items_field.type_, '__fields__'):
+                projection.validate(items_field.type_)
+            item_deserializer = projection.wrap(item_deserializer)
+        return StreamedModel(klass, JSONItemStream(response, encoding, item_deserializer,
+                                                   getattr(self.rest_client, 'transfer_counters', None)))
+
+    def __items_class(self, response_type):
+        """Looks up the model class of the items of a response type.
+
+        :return: the model class, None if the response type has no items
+            or they are not models.
+        """
+        if not isinstance(response_type, str):
+            return None
+        klass = getattr(self.models_package, response_type, None)
+        items_field = getattr(klass, '__fields__', {}).get('items')
+        if items_field is None or not hasattr(items_field.type_, '__fields__'):
+            return None
+        return items_field.type_
 
-        return self.__deserialize(data, response_type)
+    def __raw_model(self, data, response_type):
+        """Wraps a decoded body in a RawModel, leaving its items undeserialized.
+
+        :return: RawModel, None if the response type has no items.
+        """
+        if not isinstance(data, dict) or not isinstance(response_type, str):
+            return None
+        klass = getattr(self.models_package, response_type, None)
+        if 'items' not in getattr(klass, '__fields__', {}):
+            return None
+        return RawModel(klass, data)
+
+    def __lazy_model(self, data, response_type):
+        """Wraps a decoded body in a LazyModel, whose items are built as
+        LazyModels when first accessed.
+
+        :return: LazyModel, None if the response type has no items.
+        """
+        if not isinstance(data, dict) or not isinstance(response_type, str):
+            return None
+        klass = getattr(self.models_package, response_type, None)
+        if 'items' not in getattr(klass, '__fields__', {}):
+            return None
+        return LazyModel(klass, data)
+
+    def __compact_model(self, data, response_type):
+        """Wraps a decoded body in a RawModel whose items are read-only
+        records, see `compact_class`.
+
+        :return: RawModel, None if the response type has no items.
+        """
+        if not isinstance(data, dict) or not isinstance(response_type, str):
+            return None
+        klass = getattr(self.models_package, response_type, None)
+        items_field = getattr(klass, '__fields__', {}).get('items')
+        if items_field is None:
+            return None
+        items = data.get('items')
+        if isinstance(items, list) and hasattr(items_field.type_, '__fields__'):
+            record_class = compact_class(items_field.type_)
+            data['items'] = [record_class(item) if isinstance(item, dict) else item for item in items]
+        return RawModel(klass, data)
 
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
@@ -333,16 +610,37 @@ class ApiClient:
         if data is None:
             return None
 
+        key = (self.models_package, klass)
+        deserializer = self._deserializers.get(key)
+        if deserializer is None:
+            deserializer = self._deserializers[key] = self.__compile_deserializer(klass)
+        return deserializer(self, data)
+
+    def __compile_deserializer(self, klass):
+        """Resolves a type once into a function deserializing data of that type,
+        so the type string is not parsed and the model is not looked up again
+        for every element of a list.
+
+        :param klass: class literal, or string of class name.
+
+        :return: function of the api client and the dict, list or str to
+            deserialize, returning the object. The api client is passed
+            rather than bound so the cache does not reference it.
+        """
         if isinstance(klass, str):
             if klass.startswith('List['):
                 sub_kls = re.match(r'List\[(.*)]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                sub_deserializer = self.__compile_deserializer(sub_kls)
+                return lambda api_client, data: [
+                    None if sub_data is None else sub_deserializer(api_client, sub_data)
+                    for sub_data in data]
 
             if klass.startswith('Dict['):
                 sub_kls = re.match(r'Dict\[([^,]*), (.*)]', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                sub_deserializer = self.__compile_deserializer(sub_kls)
+                return lambda api_client, data: {
+                    k: None if v is None else sub_deserializer(api_client, v)
+                    for k, v in data.items()}
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -351,15 +649,15 @@ class ApiClient:
                 klass = getattr(self.models_package, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return lambda api_client, data: api_client.__deserialize_primitive(data, klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            return lambda api_client, data: api_client.__deserialize_object(data)
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return lambda api_client, data: api_client.__deserialize_date(data)
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return lambda api_client, data: api_client.__deserialize_datetime(data)
         else:
-            return self.__deserialize_model(data, klass)
+            return lambda api_client, data: api_client.__deserialize_model(data, klass)
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
@@ -391,6 +689,9 @@ class ApiClient:
         :param _preload_content: if False, the ApiResponse.data will
                                  be set to none and raw_data will store the
                                  HTTP response body without reading/decoding.
+                                 A file is a FileDownload in ApiResponse.data,
+                                 and with `Configuration.stream_items` a list
+                                 response a StreamedModel, raw_data being None.
                                  Default is True.
         :param collection_formats: dict of collection formats for path, query,
             header, and post parameters.
@@ -574,13 +875,18 @@ class ApiClient:
                     continue
                 file_names = v if type(v) is list else [v]
                 for n in file_names:
-                    with open(n, 'rb') as f:
-                        filename = os.path.basename(f.name)
-                        filedata = f.read()
-                        mimetype = (mimetypes.guess_type(filename)[0] or
-                                    'application/octet-stream')
-                        params.append(
-                            tuple([k, tuple([filename, filedata, mimetype])]))
+                    if hasattr(n, 'read'):
+                        # file object, read from its current position
+                        filename = os.path.basename(getattr(n, 'name', k))
+                        filedata = n
+                    else:
+                        filename = os.path.basename(n)
+                        filedata = UploadFile(n)
+                    mimetype = (mimetypes.guess_type(filename)[0] or
+                                'application/octet-stream')
+                    # the files are read in chunks while the request is sent
+                    params.append(
+                        tuple([k, tuple([filename, filedata, mimetype])]))
 
         return params
 
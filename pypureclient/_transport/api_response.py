@@ -15,14 +15,29 @@ class ApiResponse:
     status_code: Optional[StrictInt] = Field(None, description="HTTP status code")
     headers: Optional[Dict[StrictStr, StrictStr]] = Field(None, description="HTTP headers")
     data: Optional[Any] = Field(None, description="Deserialized data given the data type")
-    raw_data: Optional[Any] = Field(None, description="Raw data (HTTP response body)")
 
     def __init__(self,
                  status_code=None,
                  headers=None,
                  data=None,
-                 raw_data=None) -> None:
+                 raw_data=None,
+                 raw_data_encoding=None) -> None:
         self.status_code = status_code
         self.headers = headers
         self.data = data
-        self.raw_data = raw_data
\ No newline at end of file
+        self._raw_data = raw_data
+        self._raw_data_encoding = raw_data_encoding
+
+    @property
+    def raw_data(self) -> Optional[Any]:
+        """Raw data (HTTP response body). A body kept as bytes to be
+        deserialized is decoded on first access."""
+        if self._raw_data_encoding is not None:
+            self._raw_data = self._raw_data.decode(self._raw_data_encoding)
+            self._raw_data_encoding = None
+        return self._raw_data
+
+    @raw_data.setter
+    def raw_data(self, value) -> None:
+        self._raw_data = value
+        self._raw_data_encoding = None
\ No newline at end of file
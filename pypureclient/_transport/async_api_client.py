@@ -0,0 +1,105 @@
+# coding: utf-8
+
+from __future__ import annotations
+
+import asyncio
+
+from .api_client import ApiClient
+from .async_rest import AsyncRESTClientObject
+from .. import profiling, tracing
+from .exceptions import ApiException
+
+
+class AsyncApiClient(ApiClient):
+    """asyncio flavour of ApiClient.
+
+    Request building and response deserialization are shared with ApiClient,
+    only the transport differs: `call_api` returns a coroutine which sends the
+    request through AsyncRESTClientObject. Generated API classes return the
+    result of `call_api` as is, so every `*_with_http_info` method of an API
+    instance bound to this client becomes awaitable.
+    """
+
+    def _create_rest_client(self, configuration):
+        """Creates the non-blocking REST client used to send the requests."""
+        return AsyncRESTClientObject(configuration)
+
+    def call_api(self, resource_path, method,
+                 path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None,
+                 response_types_map=None, auth_settings=None,
+                 async_req=None, _return_http_data_only=None,
+                 collection_formats=None, _preload_content=True,
+                 _request_timeout=None, _host=None, _request_auth=None):
+        """Makes the HTTP request and returns a coroutine resolving to the
+        deserialized data. See ApiClient.call_api for the parameters,
+        `async_req` is ignored.
+        """
+        return self.__call_api(
+            resource_path, method, path_params, query_params, header_params,
+            body, post_params, files, response_types_map, auth_settings,
+            _return_http_data_only, collection_formats, _preload_content,
+            _request_timeout, _host, _request_auth)
+
+    async def __call_api(
+            self, resource_path, method, path_params=None,
+            query_params=None, header_params=None, body=None, post_params=None,
+            files=None, response_types_map=None, auth_settings=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=True, _request_timeout=None, _host=None,
+            _request_auth=None):
+
+        method, url, header_params, post_params, body = self._build_request(
+            resource_path, method, path_params, query_params, header_params,
+            body, post_params, files, auth_settings, collection_formats,
+            _host, _request_auth)
+        profiling.lap('params')
+
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        profiling.skip()
+        with tracing.request_span(self.configuration, method, url, header_params) as span:
+            try:
+                # perform request and return response
+                response_data = await self.request(
+                    method, url,
+                    query_params=query_params,
+                    headers=header_params,
+                    post_params=post_params, body=body,
+                    _preload_content=_preload_content,
+                    _request_timeout=_request_timeout)
+            except ApiException as e:
+                profiling.lap('send')
+                tracing.set_response(span, e.status, e.headers, len(e.body or b''))
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(e.headers)
+                if e.body:
+                    e.body = e.body.decode('utf-8')
+                raise e
+            tracing.set_response(span, response_data.status, response_data.getheaders(),
+                                 response_data.wire_bytes)
+        profiling.lap('send')
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response_data.getheaders())
+
+        return self._handle_response(response_data, response_types_map,
+                                     _preload_content, _return_http_data_only)
+
+    def deserialize_stream(self, response, response_type):
+        """Responses are read entirely by AsyncRESTClientObject, there is
+        nothing to stream."""
+        return None
+
+    def request(self, method, url, query_params=None, headers=None,
+                post_params=None, body=None, _preload_content=True,
+                _request_timeout=None):
+        """Makes the HTTP request using AsyncRESTClientObject, returns a coroutine."""
+        return self.rest_client.request(method, url,
+                                        query_params=query_params,
+                                        headers=headers,
+                                        post_params=post_params,
+                                        body=body,
+                                        _preload_content=_preload_content,
+                                        _request_timeout=_request_timeout)
@@ -0,0 +1,363 @@
+# coding: utf-8
+
+import asyncio
+import collections
+import json
+import logging
+import re
+import ssl
+import time
+import zlib
+
+from typing import Deque, Dict, Tuple
+
+from urllib.parse import urlencode, urlsplit
+
+from urllib3._collections import HTTPHeaderDict
+
+from .exceptions import ApiConnectionError, ApiException, ApiValueError
+from .json_codec import get_json_codec
+from .multipart import MultipartEncoder
+from .. import profiling
+from ..hooks import current_endpoint, fire_hooks
+from .circuit_breaker import FAILURE_STATUSES, get_circuit_breaker
+from .rest import RESTResponse, TransferCounters, raise_for_status
+
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+class _RawResponse:
+    """Fully read HTTP response, shaped like the urllib3 response RESTResponse wraps."""
+
+    def __init__(self, status, reason, headers, data, wire_bytes) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+        self._wire_bytes = wire_bytes
+
+    def tell(self):
+        """Returns the size of the body as transferred."""
+        return self._wire_bytes
+
+
+class _Connection:
+
+    def __init__(self, reader, writer) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        try:
+            self.writer.close()
+        except RuntimeError:
+            # the event loop owning the connection is already closed
+            pass
+
+
+class AsyncRESTClientObject:
+    """Non-blocking HTTP/1.1 client built on asyncio streams.
+
+    It mirrors RESTClientObject.request, but keeps its own per host pool of
+    keep-alive connections, bounded by `connection_pool_maxsize`, so a single
+    event loop can keep many requests in flight without one thread each.
+    """
+
+    def __init__(self, configuration, maxsize=None) -> None:
+        if configuration.proxy:
+            raise ApiValueError("Proxies are not supported by the asyncio transport.")
+
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+        self.maxsize = maxsize
+        self.server_hostname = configuration.tls_server_name
+        self.ssl_context = self._create_ssl_context(configuration)
+        self.socket_options = configuration.socket_options
+        self.json_codec = get_json_codec(configuration.json_codec)
+        # bodies are decompressed with zlib once read, True accepts what it
+        # decodes, and like urllib3 no compression is accepted by default
+        self.accept_encoding = 'identity'
+        if configuration.accept_encoding is True:
+            self.accept_encoding = 'gzip, deflate'
+        elif configuration.accept_encoding:
+            self.accept_encoding = configuration.accept_encoding
+        self.transfer_counters = TransferCounters()
+        self.upload_progress = configuration.upload_progress
+        self.hooks = list(configuration.hooks or ())
+        # fails the requests fast while the target is down
+        self.circuit_breaker = None
+        if configuration.circuit_breaker_threshold:
+            self.circuit_breaker = get_circuit_breaker(configuration.host, configuration.circuit_breaker_threshold,
+                                                       configuration.circuit_breaker_reset_timeout)
+        # (scheme, host, port) -> deque of idle connections
+        self._idle: Dict[Tuple[str, str, int], Deque] = collections.defaultdict(collections.deque)
+        # (scheme, host, port) -> semaphore limiting connections in use
+        self._slots: Dict[Tuple[str, str, int], asyncio.Semaphore] = {}
+
+    @staticmethod
+    def _create_ssl_context(configuration):
+        context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if not configuration.verify_ssl:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif configuration.assert_hostname is False:
+            context.check_hostname = False
+        if configuration.cert_file:
+            context.load_cert_chain(configuration.cert_file, configuration.key_file)
+        return context
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url, including the query string
+        :param query_params: ignored, url already contains the query string
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _preload_content: accepted for compatibility, the body is
+                                 always read before returning.
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        headers = dict(headers or {})
+        request_body = self._encode_body(method, headers, body, post_params or {})
+
+        connect_timeout = read_timeout = total_timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                total_timeout = _request_timeout
+            elif (isinstance(_request_timeout, tuple) and
+                  len(_request_timeout) == 2):
+                connect_timeout, read_timeout = _request_timeout
+
+        probe = self.circuit_breaker.acquire() if self.circuit_breaker is not None else False
+        endpoint = current_endpoint() if self.hooks else None
+        if self.hooks:
+            fire_hooks(self.hooks, 'on_request', endpoint, method, url)
+        start = time.monotonic()
+        try:
+            r = await asyncio.wait_for(
+                self._send(method, url, headers, request_body, connect_timeout, read_timeout),
+                total_timeout)
+        except ssl.SSLError as e:
+            self._request_failed(probe, True, endpoint, method, url, start)
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+        except ApiConnectionError:
+            self._request_failed(probe, True, endpoint, method, url, start)
+            raise
+        except (OSError, EOFError, asyncio.TimeoutError) as e:
+            # the request may have been sent
+            self._request_failed(probe, True, endpoint, method, url, start)
+            raise ApiConnectionError(_describe(e))
+        except BaseException:
+            self._request_failed(probe, None, endpoint, method, url, start)
+            raise
+
+        r = RESTResponse(r)
+        self.transfer_counters.record(r.wire_bytes, r.content_bytes)
+        self._release_circuit(probe, r.status in FAILURE_STATUSES)
+        if self.hooks:
+            fire_hooks(self.hooks, 'on_response', endpoint, method, url, r.status,
+                       time.monotonic() - start, r.wire_bytes, len(request_body))
+
+        # log response body
+        logger.debug("response body: %s", r.data)
+
+        raise_for_status(r)
+
+        return r
+
+    def _request_failed(self, probe, failed, endpoint, method, url, start):
+        self._release_circuit(probe, failed)
+        if self.hooks:
+            fire_hooks(self.hooks, 'on_response', endpoint, method, url, None, time.monotonic() - start, 0, 0)
+
+    def _release_circuit(self, probe, failed):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(probe, failed)
+
+    def _encode_body(self, method, headers, body, post_params):
+        if method not in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            return b''
+        # no content type provided or payload is json
+        if not headers.get('Content-Type') or re.search('json', headers['Content-Type'], re.IGNORECASE):
+            return self.json_codec.dumps(body) if body is not None else b''
+        if headers['Content-Type'] == 'application/x-www-form-urlencoded':
+            return urlencode(post_params).encode('utf-8')
+        if headers['Content-Type'] == 'multipart/form-data':
+            # Ensures that dict objects are serialized
+            post_params = [(a, json.dumps(b)) if isinstance(b, dict) else (a, b) for a, b in post_params]
+            # the request is written at once, files are read entirely
+            encoder = MultipartEncoder(post_params, progress=self.upload_progress)
+            headers['Content-Type'] = encoder.content_type
+            try:
+                return encoder.read()
+            finally:
+                encoder.close()
+        # Pass a `string` parameter directly in the body to support
+        # other content types than Json when `body` argument is
+        # provided in serialized form
+        if isinstance(body, str):
+            return body.encode('utf-8')
+        if isinstance(body, bytes):
+            return body
+        # Cannot generate the request from given parameters
+        msg = """Cannot prepare a request message for provided
+                 arguments. Please check that your arguments match
+                 declared content type."""
+        raise ApiException(status=0, reason=msg)
+
+    async def _send(self, method, url, headers, body, connect_timeout, read_timeout):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        key = (scheme, parts.hostname, parts.port or _DEFAULT_PORTS[scheme])
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+
+        head = ['{} {} HTTP/1.1'.format(method, target), 'Host: {}'.format(parts.netloc)]
+        headers.setdefault('Accept-Encoding', self.accept_encoding)
+        for name, value in headers.items():
+            head.append('{}: {}'.format(name, value))
+        if body or method in ['POST', 'PUT', 'PATCH']:
+            head.append('Content-Length: {}'.format(len(body)))
+        payload = ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body
+
+        slots = self._slots.get(key)
+        if slots is None:
+            slots = self._slots[key] = asyncio.Semaphore(self.maxsize)
+        async with slots:
+            idle = self._idle[key]
+            while True:
+                reused = bool(idle)
+                conn = idle.popleft() if reused else await self._connect_new(key, connect_timeout)
+                try:
+                    conn.writer.write(payload)
+                    await conn.writer.drain()
+                    response, keep_alive = await self._read_response(conn.reader, method, read_timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    conn.close()
+                    # the server may have dropped an idle keep-alive connection
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+                if keep_alive:
+                    idle.append(conn)
+                else:
+                    conn.close()
+                return response
+
+    async def _connect_new(self, key, connect_timeout):
+        try:
+            return await asyncio.wait_for(self._connect(key), connect_timeout)
+        except ssl.SSLError:
+            raise
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ApiConnectionError(_describe(e), connected=False)
+
+    async def _connect(self, key):
+        scheme, host, port = key
+        if scheme == 'https':
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=self.ssl_context,
+                server_hostname=self.server_hostname or host)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        if self.socket_options:
+            sock = writer.get_extra_info('socket')
+            for option in self.socket_options:
+                sock.setsockopt(*option)
+        return _Connection(reader, writer)
+
+    async def _read_response(self, reader, method, read_timeout):
+        status_line = await asyncio.wait_for(reader.readuntil(b'\r\n'), read_timeout)
+        version, status, reason = (status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+        status = int(status)
+        headers = HTTPHeaderDict()
+        while True:
+            line = await asyncio.wait_for(reader.readuntil(b'\r\n'), read_timeout)
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers.add(name.strip(), value.strip())
+        profiling.lap('send')
+
+        keep_alive = (version != 'HTTP/1.0' and
+                      headers.get('Connection', '').lower() != 'close')
+        if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            data = b''
+        elif 'chunked' in headers.get('Transfer-Encoding', '').lower():
+            data = await asyncio.wait_for(self._read_chunked(reader), read_timeout)
+        elif headers.get('Content-Length') is not None:
+            data = await asyncio.wait_for(reader.readexactly(int(headers['Content-Length'])), read_timeout)
+        else:
+            data = await asyncio.wait_for(reader.read(), read_timeout)
+            keep_alive = False
+        response = _RawResponse(status, reason, headers, self._decompress(headers, data), len(data))
+        profiling.lap('body_read')
+        return response, keep_alive
+
+    @staticmethod
+    def _decompress(headers, data):
+        encoding = headers.get('Content-Encoding', '').strip().lower()
+        if not data or encoding in ('', 'identity'):
+            return data
+        if encoding in ('gzip', 'x-gzip'):
+            return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+        if encoding == 'deflate':
+            try:
+                return zlib.decompress(data)
+            except zlib.error:
+                # raw deflate stream, without the zlib header
+                return zlib.decompress(data, -zlib.MAX_WBITS)
+        raise ApiException(status=0, reason="Unsupported Content-Encoding: {}".format(encoding))
+
+    @staticmethod
+    async def _read_chunked(reader):
+        chunks = []
+        while True:
+            size_line = await reader.readuntil(b'\r\n')
+            size = int(size_line.split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                # skip trailers
+                while await reader.readuntil(b'\r\n') != b'\r\n':
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    def close(self):
+        for idle in self._idle.values():
+            while idle:
+                idle.popleft().close()
+        self._idle.clear()
+
+
+def _describe(error):
+    return "{0}\n{1}".format(type(error).__name__, str(error))
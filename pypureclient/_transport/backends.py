@@ -0,0 +1,408 @@
+# coding: utf-8
+
+import logging
+import ssl
+import threading
+
+from typing import Optional
+from urllib.parse import urlencode
+
+import urllib3
+from urllib3._collections import HTTPHeaderDict
+
+from .exceptions import ApiValueError
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    h2 = None
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
+
+
+def is_socks_proxy_url(url):
+    if url is None:
+        return False
+    split_section = url.split("://")
+    if len(split_section) < 2:
+        return False
+    else:
+        return split_section[0].lower() in SUPPORTED_SOCKS_PROXIES
+
+
+def get_backend_class(transport):
+    """Returns the backend class of the `transport` setting of a configuration.
+
+    :param transport: 'urllib3', 'httpx', or a TransportBackend subclass.
+    :return: the TransportBackend subclass.
+    """
+    if isinstance(transport, type) and issubclass(transport, TransportBackend):
+        return transport
+    backend_class = BACKENDS.get(transport)
+    if backend_class is None:
+        raise ApiValueError("unknown transport {!r}, expected one of {} or a TransportBackend subclass"
+                            .format(transport, ', '.join(sorted(BACKENDS))))
+    return backend_class
+
+
+class TransportBackend(object):
+    """Sends the requests of a RESTClientObject over connections it pools.
+
+    A backend is built from the configuration of a client, the number of
+    hosts it keeps connections to, and the number of connections it keeps
+    per host. Its responses are shaped like urllib3.HTTPResponse: `status`,
+    `reason`, `headers`, and the body either read in `data`, or streamed
+    with `read(amt)` and `stream(amt)` until `release_conn()`, with `tell()`
+    giving the number of bytes transferred. Connection errors are raised as
+    urllib3.exceptions.HTTPError, so that retries and circuit breakers treat
+    them alike whatever the backend.
+
+    See benchmarks/transport_conformance.py for the behaviour a backend has
+    to conform to.
+    """
+
+    name: Optional[str] = None
+    """Name of the backend, as set in `Configuration.transport`."""
+
+    def __init__(self, configuration, num_pools, maxsize) -> None:
+        """
+        :param configuration: the configuration of the client.
+        :param num_pools: number of hosts connections are kept to.
+        :param maxsize: number of connections kept per host.
+        """
+        self._requests_lock = threading.Lock()
+        self.requests = 0
+
+    def request(self, method, url, body=None, fields=None, encode_multipart=True,
+                preload_content=True, timeout=None, headers=None):
+        """Sends a request.
+
+        :param method: HTTP method.
+        :param url: URL, query string included.
+        :param body: body of the request, bytes, str, or a file-like object
+            such as a MultipartEncoder.
+        :param fields: form fields of the request, sent URL encoded unless
+            `encode_multipart`.
+        :param encode_multipart: whether `fields` are sent as
+            multipart/form-data.
+        :param preload_content: whether the body of the response is read
+            before returning.
+        :param timeout: urllib3.Timeout, or None.
+        :param headers: headers of the request.
+        :return: the response.
+        """
+        raise NotImplementedError()
+
+    def pool_stats(self):
+        """Returns the state of the connection pools.
+
+        :return: dict of the `backend` name, the `http_version` of the last
+            response, the number of `pools`, of `connections` open and of
+            `idle_connections` among them, and of `requests` sent.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """Closes every connection of the pools."""
+        raise NotImplementedError()
+
+    def _count_request(self):
+        with self._requests_lock:
+            self.requests += 1
+
+
+class Urllib3Backend(TransportBackend):
+    """HTTP/1.1 backend, built on a urllib3 pool manager."""
+
+    name = 'urllib3'
+
+    def __init__(self, configuration, num_pools, maxsize) -> None:
+        super().__init__(configuration, num_pools, maxsize)
+        # urllib3.PoolManager will pass all kw parameters to connectionpool
+        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
+        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
+        # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
+        # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
+
+        # cert_reqs
+        if configuration.verify_ssl:
+            cert_reqs = ssl.CERT_REQUIRED
+        else:
+            cert_reqs = ssl.CERT_NONE
+
+        addition_pool_args = {}
+        if configuration.assert_hostname is not None:
+            addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
+
+        if configuration.retries is not None:
+            addition_pool_args['retries'] = configuration.retries
+
+        if configuration.tls_server_name:
+            addition_pool_args['server_hostname'] = configuration.tls_server_name
+
+        if configuration.socket_options is not None:
+            addition_pool_args['socket_options'] = configuration.socket_options
+
+        self.pool_manager = self._create_pool_manager(configuration, num_pools, maxsize,
+                                                      cert_reqs, addition_pool_args)
+
+    @staticmethod
+    def _create_pool_manager(configuration, pools_size, maxsize, cert_reqs, addition_pool_args):
+        # https pool manager
+        if configuration.proxy:
+            if is_socks_proxy_url(configuration.proxy):
+                from urllib3.contrib.socks import SOCKSProxyManager
+                return SOCKSProxyManager(
+                        cert_reqs=cert_reqs,
+                        ca_certs=configuration.ssl_ca_cert,
+                        cert_file=configuration.cert_file,
+                        key_file=configuration.key_file,
+                        proxy_url=configuration.proxy,
+                        headers=configuration.proxy_headers,
+                        **addition_pool_args
+                    )
+            else:
+                return urllib3.ProxyManager(
+                    num_pools=pools_size,
+                    maxsize=maxsize,
+                    cert_reqs=cert_reqs,
+                    ca_certs=configuration.ssl_ca_cert,
+                    cert_file=configuration.cert_file,
+                    key_file=configuration.key_file,
+                    proxy_url=configuration.proxy,
+                    proxy_headers=configuration.proxy_headers,
+                    **addition_pool_args
+                )
+        else:
+            return urllib3.PoolManager(
+                num_pools=pools_size,
+                maxsize=maxsize,
+                cert_reqs=cert_reqs,
+                ca_certs=configuration.ssl_ca_cert,
+                cert_file=configuration.cert_file,
+                key_file=configuration.key_file,
+                **addition_pool_args
+            )
+
+    def request(self, method, url, body=None, fields=None, encode_multipart=True,
+                preload_content=True, timeout=None, headers=None):
+        self._count_request()
+        if fields is not None:
+            # encode_multipart only applies to the methods sending a body
+            form = {} if encode_multipart else {'encode_multipart': False}
+            return self.pool_manager.request(method, url, fields=fields, preload_content=preload_content,
+                                             timeout=timeout, headers=headers, **form)
+        return self.pool_manager.request(method, url, body=body, preload_content=preload_content,
+                                         timeout=timeout, headers=headers)
+
+    def pool_stats(self):
+        pools = [self.pool_manager.pools.get(key) for key in self.pool_manager.pools.keys()]
+        pools = [pool for pool in pools if pool is not None]
+        connections = idle = 0
+        for pool in pools:
+            queued = list(pool.pool.queue) if pool.pool is not None else []
+            pool_idle = sum(1 for connection in queued if connection is not None)
+            # the queue holds a connection, or None, for each one not in use
+            in_use = pool.pool.maxsize - len(queued) if pool.pool is not None else 0
+            connections += pool_idle + in_use
+            idle += pool_idle
+        return {'backend': self.name, 'http_version': 'HTTP/1.1', 'pools': len(pools),
+                'connections': connections, 'idle_connections': idle, 'requests': self.requests}
+
+    def close(self):
+        self.pool_manager.clear()
+
+
+class HttpxBackend(TransportBackend):
+    """Backend built on httpx, which multiplexes the concurrent requests to a
+    host over a single HTTP/2 connection when `h2` is installed, i.e. with
+    `pip install httpx[http2]`, and the target negotiates HTTP/2 over TLS.
+    Falls back to HTTP/1.1 otherwise.
+
+    Requests are sent through one httpx.Client, keeping up to
+    `num_pools * maxsize` connections. `Configuration.retries` sets the number of
+    connection attempts retried, when an int.
+    """
+
+    name = 'httpx'
+
+    def __init__(self, configuration, num_pools, maxsize) -> None:
+        if httpx is None:
+            raise ApiValueError("the httpx transport requires httpx, install it with "
+                                "`pip install httpx[http2]`")
+        super().__init__(configuration, num_pools, maxsize)
+        self.http2 = h2 is not None
+        self.http_version = None
+        self._server_hostname = configuration.tls_server_name
+        transport_args = {}
+        if isinstance(configuration.retries, int):
+            transport_args['retries'] = configuration.retries
+        if configuration.socket_options is not None:
+            transport_args['socket_options'] = configuration.socket_options
+        if configuration.proxy:
+            transport_args['proxy'] = httpx.Proxy(configuration.proxy, headers=configuration.proxy_headers)
+        transport = httpx.HTTPTransport(
+            verify=self._create_ssl_context(configuration),
+            http2=self.http2,
+            limits=httpx.Limits(max_connections=num_pools * maxsize, max_keepalive_connections=num_pools * maxsize),
+            **transport_args)
+        self.client = httpx.Client(transport=transport, timeout=None, trust_env=False)
+        # bodies are compressed only if asked for, see Configuration.accept_encoding
+        del self.client.headers['Accept-Encoding']
+
+    @staticmethod
+    def _create_ssl_context(configuration):
+        context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if not configuration.verify_ssl:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif configuration.assert_hostname is False:
+            context.check_hostname = False
+        if configuration.cert_file:
+            context.load_cert_chain(configuration.cert_file, configuration.key_file)
+        return context
+
+    def request(self, method, url, body=None, fields=None, encode_multipart=True,
+                preload_content=True, timeout=None, headers=None):
+        self._count_request()
+        headers = dict(headers or {})
+        content = body
+        if fields:
+            if encode_multipart:
+                raise ApiValueError("the httpx transport sends multipart bodies as a MultipartEncoder")
+            content = urlencode(fields)
+        elif hasattr(body, 'read'):
+            # e.g. a MultipartEncoder, sent in chunks
+            content = iter(body)
+        extensions = {}
+        if self._server_hostname:
+            extensions['sni_hostname'] = self._server_hostname
+        try:
+            request = self.client.build_request(method, url, content=content, headers=headers,
+                                                timeout=_to_httpx_timeout(timeout), extensions=extensions)
+            response = self.client.send(request, stream=True)
+        except httpx.TransportError as error:
+            raise _to_urllib3_error(error, url)
+        self.http_version = response.http_version
+        return HttpxResponse(response, url, preload_content)
+
+    def pool_stats(self):
+        pool = getattr(self.client._transport, '_pool', None)
+        connections = list(getattr(pool, 'connections', ()))
+        return {'backend': self.name, 'http_version': self.http_version,
+                'pools': len({str(connection._origin) for connection in connections if hasattr(connection, '_origin')}),
+                'connections': len(connections),
+                'idle_connections': sum(1 for connection in connections if connection.is_idle()),
+                'requests': self.requests}
+
+    def close(self):
+        self.client.close()
+
+
+class HttpxResponse(object):
+    """httpx response shaped like the urllib3.HTTPResponse of the other
+    backends."""
+
+    def __init__(self, response, url, preload_content) -> None:
+        self._response = response
+        self._url = url
+        self._chunks = None
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.version = response.http_version
+        self.headers = HTTPHeaderDict(response.headers.multi_items())
+        self._data = None
+        if preload_content:
+            self._data = self._read_all()
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self._read_all()
+        return self._data
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def read(self, amt=None, decode_content=True):
+        if amt is None:
+            return self.data
+        if self._chunks is None:
+            self._chunks = self.stream(amt)
+        return next(self._chunks, b'')
+
+    def stream(self, amt=2 ** 16, decode_content=True):
+        try:
+            for chunk in self._response.iter_bytes(amt):
+                yield chunk
+        except httpx.TransportError as error:
+            raise _to_urllib3_error(error, self._url)
+        finally:
+            self._response.close()
+
+    def tell(self):
+        """Returns the size of the body transferred so far."""
+        return self._response.num_bytes_downloaded
+
+    def release_conn(self):
+        self._response.close()
+
+    def close(self):
+        self._response.close()
+
+    def _read_all(self):
+        try:
+            return self._response.read()
+        except httpx.TransportError as error:
+            raise _to_urllib3_error(error, self._url)
+        finally:
+            self._response.close()
+
+
+def _to_httpx_timeout(timeout):
+    if timeout is None:
+        return None
+
+    def seconds(value):
+        return value if isinstance(value, (int, float)) else None
+    # the read timeout of a total timeout is what is left once connected
+    timeout = timeout.clone()
+    timeout.start_connect()
+    read = seconds(timeout.read_timeout)
+    return httpx.Timeout(connect=seconds(timeout.connect_timeout), read=read, write=read, pool=None)
+
+
+def _to_urllib3_error(error, url):
+    """The urllib3 error matching an httpx one, which the retry policies and
+    circuit breakers know."""
+    message = '{}: {}'.format(type(error).__name__, error)
+    if isinstance(error, httpx.ConnectTimeout):
+        result = urllib3.exceptions.ConnectTimeoutError(message)
+    elif isinstance(error, httpx.ConnectError):
+        # the request was not sent, NewConnectionError is a ConnectTimeoutError
+        result = urllib3.exceptions.NewConnectionError(None, message)
+    elif isinstance(error, httpx.TimeoutException):
+        result = urllib3.exceptions.ReadTimeoutError(None, url, message)
+    elif isinstance(error, httpx.ProxyError):
+        result = urllib3.exceptions.ProxyError(message, error)
+    else:
+        result = urllib3.exceptions.ProtocolError(message, error)
+    result.__cause__ = error
+    return result
+
+
+# Backends by name, see Configuration.transport
+BACKENDS = {
+    Urllib3Backend.name: Urllib3Backend,
+    HttpxBackend.name: HttpxBackend,
+}
@@ -0,0 +1,314 @@
+# coding: utf-8
+
+import atexit
+import base64
+import collections
+import gzip
+import io
+import json
+import logging
+import re
+import threading
+import time
+
+from typing import Counter, DefaultDict, Dict, List, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import urllib3
+from urllib3._collections import HTTPHeaderDict
+
+from ..profiling import current_profile
+from .exceptions import ApiValueError
+from .rest import RESTClientObject, RESTResponse
+
+logger = logging.getLogger(__name__)
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+# Cassettes of the process, by path
+_cassettes: Dict[str, 'Cassette'] = {}
+_cassettes_lock = threading.Lock()
+
+# Headers of the recorded responses which no longer apply, the bodies being
+# recorded decoded
+_DROPPED_HEADERS = ('content-encoding', 'transfer-encoding', 'content-length', 'connection', 'set-cookie')
+
+# Session tokens of the login responses are not recorded, the replayed
+# clients send them back without them being checked
+_SESSION_TOKEN_HEADER = 'x-auth-token'
+_REDACTED_SESSION_TOKEN = 'recorded-session-token'
+
+# Signature of the access tokens of the OAuth2 token exchanges, which are
+# not recorded. The clients only decode the claims.
+_ACCESS_TOKEN = re.compile(r'("access_token"\s*:\s*"[\w-]+\.[\w-]+\.)[\w-]+(")')
+
+
+def get_cassette(path, mode):
+    """Returns the cassette shared by the clients of the process recording to,
+    or replaying, a file.
+
+    :param path: path of the cassette file, gzipped if it ends with `.gz`.
+    :param mode: 'record' or 'replay'.
+    :return: Cassette
+    """
+    if mode not in (RECORD, REPLAY):
+        raise ApiValueError("cassette mode must be '{}' or '{}', not {!r}".format(RECORD, REPLAY, mode))
+    with _cassettes_lock:
+        cassette = _cassettes.get(path)
+        if cassette is None or cassette.mode != mode:
+            if cassette is not None:
+                cassette.close()
+            cassette = _cassettes[path] = Cassette(path, mode)
+        return cassette
+
+
+def close_cassettes():
+    """Closes the files of the cassettes being recorded and forgets every
+    cassette, so that they are read again when next replayed."""
+    with _cassettes_lock:
+        cassettes = list(_cassettes.values())
+        _cassettes.clear()
+    for cassette in cassettes:
+        cassette.close()
+
+
+atexit.register(close_cassettes)
+
+
+class Interaction(object):
+    """A request and its response, as recorded."""
+
+    __slots__ = ('method', 'url', 'status', 'reason', 'headers', 'data', 'elapsed')
+
+    def __init__(self, method, url, status, reason, headers, data, elapsed) -> None:
+        """
+        :param method: HTTP method of the request.
+        :param url: path and query string of the request.
+        :param status: HTTP status of the response.
+        :param reason: reason phrase of the response.
+        :param headers: list of (name, value) response headers.
+        :param data: body of the response, decoded.
+        :param elapsed: seconds from sending the request to reading the body.
+        """
+        self.method = method
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+        self.elapsed = elapsed
+
+    def to_dict(self):
+        try:
+            body, encoding = self.data.decode('utf-8'), 'utf-8'
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(self.data).decode('ascii'), 'base64'
+        return {'method': self.method, 'url': self.url, 'status': self.status, 'reason': self.reason,
+                'headers': self.headers, 'body': body, 'encoding': encoding,
+                'elapsed': round(self.elapsed, 6)}
+
+    @classmethod
+    def from_dict(cls, d):
+        if d.get('encoding') == 'base64':
+            data = base64.b64decode(d['body'])
+        else:
+            data = d['body'].encode('utf-8')
+        return cls(d['method'], d['url'], d['status'], d.get('reason', ''),
+                   [tuple(header) for header in d['headers']], data, d.get('elapsed', 0.0))
+
+    def to_response(self, preload_content):
+        """Returns the response as a urllib3.HTTPResponse, read if
+        `preload_content`."""
+        headers = HTTPHeaderDict(self.headers)
+        headers['Content-Length'] = str(len(self.data))
+        return urllib3.HTTPResponse(body=io.BytesIO(self.data), headers=headers, status=self.status,
+                                    reason=self.reason, preload_content=preload_content,
+                                    decode_content=False)
+
+
+class Cassette(object):
+    """Requests and responses of the clients, recorded to a file to be
+    replayed later without a target.
+
+    A cassette file holds an interaction per line, as JSON: the method and
+    the path and query string of the request, the status, headers and body
+    of its response, and the time it took. The request headers and bodies
+    are not recorded, the authentication being sent in them, nor are the
+    session tokens of logins and the signatures of OAuth2 access tokens.
+
+    Replayed requests are matched on their method, path and query string,
+    or on their method and path only when nothing recorded matches the query
+    string, e.g. for time ranges. Requests matching the same interactions
+    are answered with them in the recorded order, over again once they are
+    all played.
+    """
+
+    def __init__(self, path, mode) -> None:
+        """
+        :param path: path of the cassette file, gzipped if it ends with `.gz`.
+        :param mode: 'record' to append the interactions to the file,
+            'replay' to read them from it.
+        """
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._file = None
+        # interactions by (method, url), and by (method, path), with the
+        # index of the next one to play
+        self._by_url: DefaultDict[Tuple[str, str], List[Interaction]] = collections.defaultdict(list)
+        self._by_path: DefaultDict[Tuple[str, str], List[Interaction]] = collections.defaultdict(list)
+        self._next: Counter[Tuple[str, str]] = collections.Counter()
+        if mode == REPLAY:
+            self._load()
+
+    def __len__(self):
+        return sum(len(interactions) for interactions in self._by_url.values())
+
+    def record(self, interaction):
+        """Appends an interaction to the file."""
+        line = json.dumps(interaction.to_dict(), separators=(',', ':')).encode('utf-8') + b'\n'
+        with self._lock:
+            if self._file is None:
+                self._file = self._open('ab')
+            self._file.write(line)
+            self._file.flush()
+
+    def play(self, method, url):
+        """Returns the next interaction recorded for a request.
+
+        :param method: HTTP method of the request.
+        :param url: URL of the request.
+        :return: Interaction
+        :raises ApiValueError: if no interaction matches the request.
+        """
+        url = _strip_host(url)
+        key = (method, url)
+        interactions = self._by_url.get(key)
+        if not interactions:
+            key = (method, urlsplit(url).path)
+            interactions = self._by_path.get(key)
+        if not interactions:
+            raise ApiValueError("no response recorded in {} for {} {}".format(self.path, method, url))
+        with self._lock:
+            index = self._next[key]
+            self._next[key] = (index + 1) % len(interactions)
+        return interactions[index]
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _open(self, mode):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, mode)
+        return open(self.path, mode)
+
+    def _load(self):
+        with self._open('rb') as cassette_file:
+            for line in cassette_file:
+                if not line.strip():
+                    continue
+                interaction = Interaction.from_dict(json.loads(line))
+                self._by_url[(interaction.method, interaction.url)].append(interaction)
+                self._by_path[(interaction.method, urlsplit(interaction.url).path)].append(interaction)
+        logger.debug("replaying %d responses from %s", len(self), self.path)
+
+
+class CassetteRESTClientObject(RESTClientObject):
+    """REST client recording the responses to its requests to a cassette, or
+    answering them from a cassette without sending them.
+
+    Replayed responses go through the same processing as the responses of a
+    target, from the rate limit headers to the deserialization of their
+    bodies, and take the recorded time, or `cassette_latency`, so that the
+    work of the client can be profiled against real payloads offline.
+    """
+
+    def __init__(self, configuration, pools_size=None, maxsize=None) -> None:
+        super().__init__(configuration, pools_size=pools_size, maxsize=maxsize)
+        self.cassette = get_cassette(configuration.cassette, configuration.cassette_mode)
+        self.latency = configuration.cassette_latency
+
+    def _request(self, method, url, headers, body, post_params,
+                 _preload_content, _request_timeout):
+        if self.cassette.mode == RECORD:
+            return self._record(method, url, headers, body, post_params,
+                                _preload_content, _request_timeout)
+        return self._replay(method, url, headers, body, post_params, _preload_content)
+
+    def _record(self, method, url, headers, body, post_params,
+                _preload_content, _request_timeout):
+        start = time.monotonic()
+        r, request_bytes = super()._request(method, url, headers, body, post_params,
+                                            _preload_content, _request_timeout)
+        if _preload_content:
+            data = r.data
+            response_headers = r.getheaders()
+        else:
+            # read the body to record it, the caller reads it from a copy
+            data = r.read(decode_content=True)
+            response_headers = r.headers
+            r.release_conn()
+        interaction = Interaction(method.upper(), _strip_host(url), r.status, r.reason,
+                                  _recorded_headers(response_headers), _redact(data),
+                                  time.monotonic() - start)
+        self.cassette.record(interaction)
+        if not _preload_content:
+            r = interaction.to_response(False)
+        return r, request_bytes
+
+    def _replay(self, method, url, headers, body, post_params, _preload_content):
+        # the request body is encoded as it would be sent
+        request_bytes = 0
+        if isinstance(body, (str, bytes)):
+            request_bytes = len(body)
+        elif body is not None:
+            request_bytes = len(self.json_codec.dumps(body))
+        elif post_params and (headers or {}).get('Content-Type') == 'application/x-www-form-urlencoded':
+            request_bytes = len(urlencode(post_params))
+        interaction = self.cassette.play(method.upper(), url)
+        latency = interaction.elapsed if self.latency is None else self.latency
+        if latency > 0:
+            time.sleep(latency)
+        profile = current_profile() if _preload_content else None
+        if profile is not None:
+            profile.lap('send')
+        r = interaction.to_response(_preload_content)
+        if _preload_content:
+            r = RESTResponse(r)
+            if profile is not None:
+                profile.lap('body_read')
+            self.transfer_counters.record(r.wire_bytes, r.content_bytes)
+        return r, request_bytes
+
+
+def _strip_host(url):
+    """Path and query string of a URL, so that a cassette is replayed
+    whatever the host of the target."""
+    parts = urlsplit(url)
+    return parts.path + ('?' + parts.query if parts.query else '')
+
+
+def _recorded_headers(headers):
+    recorded = []
+    for name, value in headers.items():
+        lower_name = name.lower()
+        if lower_name in _DROPPED_HEADERS:
+            continue
+        if lower_name == _SESSION_TOKEN_HEADER:
+            value = _REDACTED_SESSION_TOKEN
+        recorded.append((name, value))
+    return recorded
+
+
+def _redact(data):
+    if b'access_token' not in data:
+        return data
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data
+    return _ACCESS_TOKEN.sub(r'\1redacted\2', text).encode('utf-8')
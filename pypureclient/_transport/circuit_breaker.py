@@ -0,0 +1,140 @@
+# coding: utf-8
+
+import logging
+import threading
+import time
+
+from typing import Dict
+
+import urllib3
+
+from ..exceptions import CircuitOpenError
+from .exceptions import ApiException
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+# Statuses telling the target can't serve requests for now
+FAILURE_STATUSES = (502, 503, 504)
+
+# Circuit breakers of the process, by target
+_circuit_breakers: Dict[str, 'CircuitBreaker'] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(target, failure_threshold, reset_timeout):
+    """Returns the circuit breaker shared by the clients of a target.
+
+    :param target: host URL of the target.
+    :param failure_threshold: number of requests failing in a row which open
+        the circuit, if the breaker is created.
+    :param reset_timeout: seconds the circuit stays open, if the breaker is
+        created.
+    :return: CircuitBreaker
+    """
+    with _circuit_breakers_lock:
+        circuit_breaker = _circuit_breakers.get(target)
+        if circuit_breaker is None:
+            circuit_breaker = _circuit_breakers[target] = CircuitBreaker(target, failure_threshold, reset_timeout)
+        return circuit_breaker
+
+
+def get_circuit_state(target):
+    """Returns the state of the circuit to a target, so that callers can skip
+    the targets which are down.
+
+    :param target: IP or hostname of the target, or its host URL.
+    :return: 'closed' if requests are sent, 'open' if they fail without being
+        sent, 'half-open' if the next request is sent to try the target
+        again. 'closed' for targets no client with a circuit breaker talked to.
+    """
+    if '://' not in target:
+        target = 'https://{}'.format(target)
+    with _circuit_breakers_lock:
+        circuit_breaker = _circuit_breakers.get(target)
+    return circuit_breaker.state if circuit_breaker is not None else CLOSED
+
+
+def is_failure(error):
+    """Whether an error of a request counts against the target, i.e. the
+    target could not be reached or could not serve it."""
+    if isinstance(error, urllib3.exceptions.HTTPError):
+        return True
+    return isinstance(error, ApiException) and (error.status == 0 or error.status in FAILURE_STATUSES)
+
+
+class CircuitBreaker(object):
+    """Stops sending requests to a target which failed too many of them in a
+    row, so that callers fail fast instead of waiting for timeouts.
+
+    The circuit is closed while requests are sent. It opens after
+    `failure_threshold` requests failed in a row, and requests then raise
+    CircuitOpenError without being sent. Once `reset_timeout` seconds have
+    passed it is half-open: a single request is sent to try the target, which
+    closes the circuit if it succeeds, and opens it again otherwise.
+    """
+
+    def __init__(self, target, failure_threshold, reset_timeout) -> None:
+        self.target = target
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now):
+        if self._opened_at is None:
+            return CLOSED
+        if now - self._opened_at < self.reset_timeout:
+            return OPEN
+        return HALF_OPEN
+
+    def acquire(self):
+        """Lets a request through, or raises if the circuit is open.
+
+        :return: True if the request tries the target while half-open, to be
+            passed to `release`.
+        :raises CircuitOpenError: if the request is not to be sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now)
+            if state == CLOSED:
+                return False
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            retry_after = max(0.0, self._opened_at + self.reset_timeout - now)
+        raise CircuitOpenError(self.target, retry_after)
+
+    def release(self, probe, failed):
+        """Records the outcome of a request let through.
+
+        :param probe: what `acquire` returned.
+        :param failed: True if the target failed the request, False if it
+            served it, None if the request failed before reaching it.
+        """
+        with self._lock:
+            if probe:
+                self._probing = False
+            if failed is None:
+                return
+            if not failed:
+                if self._opened_at is not None:
+                    logger.info("circuit to %s closed", self.target)
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if probe or (self._opened_at is None and self._failures >= self.failure_threshold):
+                logger.warning("circuit to %s open after %d failed requests", self.target, self._failures)
+                self._opened_at = time.monotonic()
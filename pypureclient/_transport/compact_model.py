@@ -0,0 +1,192 @@
+# coding: utf-8
+
+import pprint
+
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+
+from .lazy_model import _LIST, _MAPPING, _MODEL, _get_field_readers, _should_raise_on_none
+
+# Compact classes built for the model classes, by model class
+_compact_classes: Dict[type, type] = {}
+
+
+class CompactModel(object):
+    """Base of the read-only records standing for the models of the items of
+    responses, see `compact_class`.
+
+    A record holds the fields of its model in `__slots__`, without the
+    `__dict__`, `__fields_set__` and validation of pydantic models, so a
+    record takes a fraction of the memory of its model, e.g. to cache large
+    inventories. Fields are accessed as on the model, `None` values included,
+    and `to_dict` returns the same dict. Lists are held in tuples, and dicts
+    in read-only mappings, so that records are hashable. Records can't be
+    changed; `to_model` builds the model to change.
+    """
+
+    __slots__ = ()
+
+    # Model class of the record
+    _model_class = None
+
+    # (name, alias, kind, compact class of the values) of each field
+    _fields: Tuple[Tuple[str, str, int, Optional[type]], ...] = ()
+
+    def __init__(self, data) -> None:
+        setter = object.__setattr__
+        for name, alias, kind, sub_class in self._fields:
+            value = data.get(alias)
+            if value is None:
+                # unset slots are read as None, see __getattr__
+                continue
+            if sub_class is None:
+                if isinstance(value, (list, dict)):
+                    value = _freeze(value)
+            elif kind == _MODEL:
+                if isinstance(value, dict):
+                    value = sub_class(value)
+            elif kind == _LIST:
+                value = tuple(sub_class(v) if isinstance(v, dict) else _freeze(v) for v in value)
+            elif kind == _MAPPING:
+                value = MappingProxyType({k: sub_class(v) if isinstance(v, dict) else _freeze(v)
+                                          for k, v in value.items()})
+            setter(self, name, value)
+
+    @classmethod
+    def from_dict(cls, obj):
+        """Create a record from a dict"""
+        if obj is None:
+            return None
+        return cls(obj)
+
+    def __getattr__(self, name):
+        # only called for unset slots, i.e. None fields, and unknown names
+        if name not in self._model_class.__fields__:
+            raise AttributeError(name)
+        if _should_raise_on_none(self._model_class):
+            raise AttributeError(name)
+        return None
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is read-only".format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is read-only".format(type(self).__name__))
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            if key in self._model_class.__fields__:
+                return None
+            raise
+
+    def _values(self):
+        return tuple(getattr(self, name, None) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash((type(self), _hashable(self._values())))
+
+    def __reduce__(self):
+        # the classes are built at runtime, records are pickled as dicts
+        return _compact_from_dict, (self._model_class, self.to_dict())
+
+    def __dir__(self):
+        return sorted(set(object.__dir__(self)) | set(self.__slots__))
+
+    def to_dict(self, include_readonly=True):
+        """Returns the dictionary representation of the model using alias, as
+        the model does."""
+        if not include_readonly:
+            return self.to_model().to_dict(include_readonly=False)
+        result = {}
+        for name, alias, _, _ in self._fields:
+            value = getattr(self, name, None)
+            if value is not None:
+                result[alias] = _thaw(value)
+        return result
+
+    def as_request_dict(self):
+        return self.to_dict(include_readonly=False)
+
+    def to_model(self):
+        """Returns the model, built from the record."""
+        return self._model_class.from_dict(self.to_dict())
+
+    def to_str(self):
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.to_dict(include_readonly=True))
+
+    def __str__(self):
+        return self.to_str()
+
+    def __repr__(self):
+        return self.to_str()
+
+
+def compact_class(model_class):
+    """Returns the record class of a model class, built once.
+
+    The record class has a slot per field of the model, holding its value,
+    and records of the record classes of its nested models.
+    """
+    cls = _compact_classes.get(model_class)
+    if cls is None:
+        readers = _get_field_readers(model_class)
+        cls = type(model_class.__name__, (CompactModel,), {
+            '__slots__': tuple(readers),
+            '__module__': __name__,
+            '__doc__': 'Read-only record of {}'.format(model_class.__name__),
+            '_model_class': model_class,
+        })
+        # registered first, models may hold models of their own class
+        _compact_classes[model_class] = cls
+        cls._fields = tuple((name, alias, kind, None if sub_class is None else compact_class(sub_class))
+                            for name, (alias, kind, sub_class) in readers.items())
+    return cls
+
+
+def compact_items(model_class):
+    """Returns the function building the records of the decoded items of a
+    model class."""
+    cls = compact_class(model_class)
+    return lambda data: cls(data) if isinstance(data, dict) else data
+
+
+def _compact_from_dict(model_class, data):
+    return compact_class(model_class)(data)
+
+
+def _freeze(value):
+    """A decoded value, its lists as tuples and its dicts as read-only
+    mappings."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+def _thaw(value):
+    """A value of a record, as decoded from JSON."""
+    if isinstance(value, CompactModel):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+def _hashable(value):
+    """A value of a record, its mappings as frozensets of their items."""
+    if isinstance(value, tuple):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, MappingProxyType):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+    return value
@@ -0,0 +1,216 @@
+# coding: utf-8
+
+import logging
+import os
+import re
+import tempfile
+
+import urllib3
+
+from .exceptions import ApiException
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class FileDownload(object):
+    """File returned by an endpoint called with `_preload_content=False`.
+
+    The body is not read until `save` writes it, one chunk at a time, to a
+    path or a file object. If the server accepts byte ranges, an interrupted
+    transfer is resumed from the last byte written, and a partial file left
+    by a previous attempt can be completed. Once the body is read, saving the
+    file again requests it again.
+    """
+
+    def __init__(self, response, reopen=None, temp_folder_path=None) -> None:
+        """
+        :param response: urllib3.HTTPResponse read with preload_content=False,
+            or any response object holding its body in `data`.
+        :param reopen: function sending the request again with the extra
+            headers it is given, returning a response read with
+            preload_content=False. None if the request can't be sent again.
+        :param temp_folder_path: folder the file is saved to when `save` is
+            given no destination.
+        """
+        self._response = response
+        self._reopen = reopen
+        self._temp_folder_path = temp_folder_path
+        self.filename = _get_filename(response)
+        """Name of the file from the Content-Disposition header, None if not sent."""
+        self.size = _get_size(response)
+        """Size of the file in bytes, None if not known."""
+        self.accepts_ranges = _get_header(response, 'Accept-Ranges').lower() == 'bytes'
+        """Whether the transfer can be resumed."""
+
+    def save(self, destination=None, progress=None, resume=False, max_resumes=3, chunk_size=CHUNK_SIZE):
+        """Writes the file.
+
+        :param destination: path of the file, or a binary file object open for
+            writing. None for a file in the temporary folder named after the
+            Content-Disposition header.
+        :param progress: function called with the number of bytes written so
+            far and the size of the file, or None if not known, after each
+            chunk.
+        :param resume: if True, the bytes already held by the destination, the
+            size of the file at the path or the position of the file object,
+            are kept and only the rest of the file is requested. The file is
+            written again from its start if the server ignores the range.
+        :param max_resumes: number of times an interrupted transfer is resumed.
+        :param chunk_size: size of the buffer the body is read through.
+        :return: the path, or the file object.
+        :raises ApiException: if the body was read or closed already and the
+            request can't be sent again.
+        """
+        if self._response is None and self._reopen is None:
+            # checked before a destination path is truncated
+            raise ApiException(status=0, reason="Cannot save the file again, its body was read already "
+                                                "and the request can't be sent again")
+        if destination is None:
+            destination = self._temp_path()
+        if isinstance(destination, (str, os.PathLike)):
+            offset = os.path.getsize(destination) if resume and os.path.exists(destination) else 0
+            with open(destination, 'r+b' if offset else 'wb') as f:
+                f.seek(offset)
+                self._write(f, offset, progress, max_resumes, chunk_size)
+                # the server may have sent the whole file again, shorter
+                f.truncate()
+            return destination
+        offset = destination.tell() if resume else 0
+        self._write(destination, offset, progress, max_resumes, chunk_size)
+        return destination
+
+    def close(self):
+        """Releases the connection without reading the body."""
+        if self._response is not None:
+            _close(self._response, complete=False)
+            self._response = None
+
+    def _write(self, f, offset, progress, max_resumes, chunk_size):
+        # position of the first byte of the file in f, None if f can't seek
+        base = f.tell() - offset if f.seekable() else None
+        written = offset
+        if offset and self._reopen is not None:
+            written = self._resume(f, base, offset)
+        elif offset:
+            # the request can't be sent again, write the file from its start
+            if base is None:
+                raise ApiException(status=0, reason="Cannot resume the download, the destination can't seek")
+            f.seek(base)
+            written = 0
+        elif self._response is None:
+            # the body was read by a previous save
+            self._response = self._reopen({})
+            self.size = _get_size(self._response) or self.size
+        resumes = 0
+        while self._response is not None:
+            try:
+                for chunk in _iter_chunks(self._response, chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+                    if progress is not None:
+                        progress(written, self.size)
+                _close(self._response, complete=True)
+                self._response = None
+            except urllib3.exceptions.HTTPError as e:
+                _close(self._response, complete=False)
+                self._response = None
+                if resumes >= max_resumes or not self.accepts_ranges or self._reopen is None:
+                    raise
+                resumes += 1
+                logger.debug("download interrupted at %d bytes, resuming: %s", written, e)
+                written = self._resume(f, base, written)
+
+    def _resume(self, f, base, offset):
+        """Requests the file from offset on, in place of the current response.
+
+        :return: the offset of the next byte received, 0 if the server sent
+            the whole file again.
+        """
+        if self._response is not None:
+            _close(self._response, complete=False)
+            self._response = None
+        if self.size is not None and offset >= self.size:
+            # nothing left to receive
+            return offset
+        try:
+            response = self._reopen({'Range': 'bytes={}-'.format(offset)})
+        except ApiException as e:
+            if e.status != 416:
+                raise
+            # Range Not Satisfiable, the file is complete
+            return offset
+        start = 0
+        if response.status == 206:
+            match = re.match(r'bytes (\d+)-', _get_header(response, 'Content-Range'))
+            start = int(match.group(1)) if match else 0
+        if start != offset and (start > offset or base is None):
+            _close(response, complete=False)
+            raise ApiException(status=0, reason="Cannot resume the download at byte {}, the server sent it from byte {}"
+                               .format(offset, start))
+        self._response = response
+        self.size = _get_size(response) or self.size
+        if start != offset:
+            f.seek(base + start)
+        return start
+
+    def _temp_path(self):
+        folder = tempfile.mkdtemp(dir=self._temp_folder_path)
+        return os.path.join(folder, self.filename or 'download')
+
+    def __del__(self):
+        self.close()
+
+    def __repr__(self):
+        return 'FileDownload(filename={!r}, size={!r})'.format(self.filename, self.size)
+
+
+def _get_header(response, name):
+    # urllib3 responses hold their headers in `headers`, RESTResponse returns them
+    headers = response.headers if hasattr(response, 'headers') else response.getheaders()
+    return headers.get(name) or ''
+
+
+def _get_filename(response):
+    content_disposition = _get_header(response, 'Content-Disposition')
+    if content_disposition:
+        match = re.search(r'filename=[\'"]?([^\'"\s]+)[\'"]?', content_disposition)
+        if match:
+            # don't let the server pick the folder
+            return os.path.basename(match.group(1))
+    return None
+
+
+def _get_size(response):
+    """Size of the whole file, from Content-Range or Content-Length."""
+    match = re.match(r'bytes \d+-\d+/(\d+)', _get_header(response, 'Content-Range'))
+    if match:
+        return int(match.group(1))
+    if _get_header(response, 'Content-Encoding').lower() not in ('', 'identity'):
+        # Content-Length is the compressed size
+        return None
+    length = _get_header(response, 'Content-Length')
+    return int(length) if length.isdigit() else None
+
+
+def _iter_chunks(response, chunk_size):
+    if not hasattr(response, 'stream'):
+        # body read already, by the asyncio transport
+        data = memoryview(response.data)
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+        return
+    while True:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _close(response, complete):
+    """Releases the connection, discarding it along with a partially read body."""
+    if not complete and hasattr(response, 'close'):
+        response.close()
+    if hasattr(response, 'release_conn'):
+        response.release_conn()
@@ -143,6 +143,23 @@ class ServiceException(ApiException):
         super(ServiceException, self).__init__(status, reason, http_resp)
 
 
+class ApiConnectionError(ApiException):
+
+    def __init__(self, reason=None, connected=True) -> None:
+        """ Raised when the connection to the target failed, or broke
+        before the response was read
+
+        Args:
+            reason (str): the exception message
+
+        Keyword Args:
+            connected (bool): False if the connection could not be made, the
+                request was not sent
+        """
+        super(ApiConnectionError, self).__init__(status=0, reason=reason)
+        self.connected = connected
+
+
 def render_path(path_to_item):
     """Returns a string representation of a path"""
     result = ""
@@ -0,0 +1,193 @@
+# coding: utf-8
+
+import collections
+import contextvars
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from concurrent import futures
+from typing import Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Number of latencies the hedge delay is computed from, and the number needed
+# before requests are hedged
+LATENCY_SAMPLES = 200
+MIN_LATENCY_SAMPLES = 20
+
+
+class HedgeCounters(object):
+    """Requests sent by a RequestHedger, the hedges it sent because a response
+    was late, and the hedges whose response came first."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedged = 0
+        self.won = 0
+
+    def record(self, hedged, won):
+        with self._lock:
+            self.requests += 1
+            self.hedged += hedged
+            self.won += won
+
+    def __repr__(self):
+        return 'HedgeCounters(requests={}, hedged={}, won={})'.format(self.requests, self.hedged, self.won)
+
+
+class RequestHedger(object):
+    """Sends a duplicate of a request whose response is late, i.e. slower than
+    a percentile of the latencies of the previous requests.
+
+    The request is sent on the thread of the caller, which waits for it. The
+    duplicate is sent from an executor, and its response is returned in place
+    of that of the request if it came first, or if the request failed. A
+    duplicate whose response comes last is left to finish in the executor,
+    and its response is dropped.
+
+    Only for requests which may be sent twice, i.e. GETs.
+    """
+
+    def __init__(self, percentile, min_delay, max_workers) -> None:
+        """
+        :param percentile: percentile of the latencies after which a request
+            is hedged, between 0 and 100.
+        :param min_delay: minimum time in seconds before a request is hedged.
+        :param max_workers: number of duplicates sent concurrently.
+        """
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.counters = HedgeCounters()
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = collections.deque(maxlen=LATENCY_SAMPLES)
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                    thread_name_prefix='hedged-request')
+        # (time, sequence number, _Hedge) of the duplicates to send, and the
+        # thread sending them on time
+        self._condition = threading.Condition()
+        self._scheduled: List[Tuple[float, int, '_Hedge']] = []
+        self._sequence = itertools.count()
+        self._scheduler: Optional[threading.Thread] = None
+        self._closed = False
+
+    def delay(self):
+        """Seconds after which a request is hedged, None until enough
+        latencies are known."""
+        with self._lock:
+            if len(self._latencies) < MIN_LATENCY_SAMPLES:
+                return None
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100.0))
+        return max(self.min_delay, latencies[index])
+
+    def send(self, send, may_hedge=None):
+        """Sends a request, and a hedge if its response is late.
+
+        :param send: function sending the request, returning the response or
+            raising an error. The hedge runs it in a copy of the context of
+            the caller, so the hooks and the profile of the call see both
+            requests.
+        :param may_hedge: function telling whether a hedge may be sent now,
+            e.g. within the rate limits. Always if None.
+        :return: the first response received.
+        :raises: the error of the request if the hedge was not sent or
+            failed too.
+        """
+        delay = self.delay()
+        if delay is None:
+            response = self._timed(send)
+            self.counters.record(False, False)
+            return response
+        hedge = self._schedule(delay, send, may_hedge)
+        try:
+            response = self._timed(send)
+        except Exception as error:
+            future = self._cancel(hedge)
+            if future is None:
+                self.counters.record(False, False)
+                raise
+            try:
+                response = future.result()
+            except Exception:
+                # both requests failed
+                self.counters.record(True, False)
+                raise error
+            self.counters.record(True, True)
+            return response
+        except BaseException:
+            self.counters.record(self._cancel(hedge) is not None, False)
+            raise
+        future = self._cancel(hedge)
+        # the request wins a tie
+        won = future is not None and future.done() and not future.cancelled() and future.exception() is None
+        self.counters.record(future is not None, won)
+        return future.result() if won else response
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._scheduled = []
+            self._condition.notify()
+        self._executor.shutdown(wait=False)
+
+    def _schedule(self, delay, send, may_hedge):
+        """Schedules the hedge of a request sent now."""
+        hedge = _Hedge(send, may_hedge)
+        with self._condition:
+            heapq.heappush(self._scheduled, (time.monotonic() + delay, next(self._sequence), hedge))
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(target=self._run_scheduler, name='hedge-scheduler',
+                                                   daemon=True)
+                self._scheduler.start()
+            self._condition.notify()
+        return hedge
+
+    def _cancel(self, hedge):
+        """Cancels a hedge not sent yet.
+
+        :return: the future of the hedge, None if it was not sent.
+        """
+        with self._condition:
+            hedge.cancelled = True
+            return hedge.future
+
+    def _run_scheduler(self):
+        with self._condition:
+            while not self._closed:
+                if not self._scheduled:
+                    self._condition.wait()
+                    continue
+                at, _, hedge = self._scheduled[0]
+                wait = at - time.monotonic()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                heapq.heappop(self._scheduled)
+                if hedge.cancelled or (hedge.may_hedge is not None and not hedge.may_hedge()):
+                    continue
+                logger.debug("no response after %.3fs, hedging the request", at - hedge.sent_at)
+                hedge.future = self._executor.submit(hedge.context.run, self._timed, hedge.send)
+
+    def _timed(self, send):
+        start = time.monotonic()
+        try:
+            return send()
+        finally:
+            with self._lock:
+                self._latencies.append(time.monotonic() - start)
+
+
+class _Hedge(object):
+    """Duplicate of a request, sent unless cancelled before its time."""
+
+    def __init__(self, send, may_hedge) -> None:
+        self.send = send
+        self.may_hedge = may_hedge
+        self.context = contextvars.copy_context()
+        self.sent_at = time.monotonic()
+        self.cancelled = False
+        self.future: Optional[futures.Future] = None
@@ -0,0 +1,121 @@
+# coding: utf-8
+
+import json
+import logging
+import warnings
+
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# Codecs tried, in order, by the 'auto' codec
+_AUTO_CODECS = ('orjson', 'msgspec', 'ujson')
+
+
+class JSONCodec(object):
+    """JSON codec of the standard library.
+
+    A codec decodes JSON from bytes or str, and encodes an object to UTF-8
+    bytes. Decoding errors are raised as ValueError whatever the library.
+    """
+
+    name = 'json'
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, obj):
+        return json.dumps(obj).encode('utf-8')
+
+
+class OrjsonCodec(JSONCodec):
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+
+class MsgspecCodec(JSONCodec):
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self._decode_error = msgspec.DecodeError
+
+    def loads(self, data):
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e))
+
+    def dumps(self, obj):
+        return self._encoder.encode(obj)
+
+
+class UjsonCodec(JSONCodec):
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+_CODEC_CLASSES = {codec_class.name: codec_class
+                  for codec_class in (JSONCodec, OrjsonCodec, MsgspecCodec, UjsonCodec)}
+# codec name -> codec selected for it
+_codecs: Dict[str, JSONCodec] = {}
+
+
+def get_json_codec(codec=None):
+    """Returns the JSON codec selected by a configuration.
+
+    :param codec: None or 'json' for the standard library, 'orjson',
+        'msgspec' or 'ujson' for these libraries, 'auto' for the first of
+        them which is installed, or any object with `loads` and `dumps`
+        methods like JSONCodec. A library which is not installed falls back
+        to the standard library.
+    :return: the codec.
+    """
+    if codec is None:
+        codec = JSONCodec.name
+    if not isinstance(codec, str):
+        return codec
+    if codec not in _codecs:
+        if codec == 'auto':
+            names = _AUTO_CODECS
+        elif codec in _CODEC_CLASSES:
+            names = (codec,)
+        else:
+            raise ValueError("Unknown JSON codec '{}', expected one of {}".format(
+                codec, ', '.join(['auto'] + list(_CODEC_CLASSES))))
+        selected = None
+        for name in names:
+            try:
+                selected = _CODEC_CLASSES[name]()
+                break
+            except ImportError:
+                logger.debug("JSON codec '%s' is not installed", name)
+        if selected is None:
+            selected = JSONCodec()
+            if codec != 'auto':
+                warnings.warn("JSON codec '{}' is not installed, falling back to 'json'".format(codec))
+        _codecs[codec] = selected
+    return _codecs[codec]
@@ -0,0 +1,212 @@
+# coding: utf-8
+
+import codecs
+import json
+
+from typing import Any, Dict
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+# Parser states
+_BEFORE_OBJECT = 0
+_IN_OBJECT = 1
+_IN_ITEMS = 2
+_DONE = 3
+
+
+class JSONItemStream(object):
+    """Iterator over the `items` array of a JSON response body, decoding it
+    incrementally from the HTTP stream.
+
+    Only the item being decoded and the chunk being read are kept in memory.
+    The other members of the top level object are collected as they are met,
+    so the ones which follow the array, e.g. `continuation_token` or
+    `total_item_count`, are known once the items are consumed.
+    """
+
+    def __init__(self, response, encoding='utf-8', item_deserializer=None, transfer_counters=None) -> None:
+        """
+        :param response: urllib3.HTTPResponse read with preload_content=False,
+            or any response object holding its body in `data`.
+        :param encoding: charset of the body.
+        :param item_deserializer: function applied to each decoded item.
+        :param transfer_counters: TransferCounters to which the size of the
+            body read is added once the stream is closed.
+        """
+        self._response = response
+        if hasattr(response, 'stream'):
+            self._chunks = response.stream(CHUNK_SIZE)
+        else:
+            self._chunks = iter([response.data])
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._json_decoder = json.JSONDecoder()
+        self._item_deserializer = item_deserializer
+        self._transfer_counters = transfer_counters
+        self.content_bytes = 0
+        """Size of the body read so far, decompressed."""
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._state = _BEFORE_OBJECT
+        self.fields: Dict[str, Any] = {}
+        """Members of the top level object decoded so far, items excepted."""
+        self.count = 0
+        """Number of items decoded so far."""
+        self.body = None
+        """StreamedModel the items belong to."""
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self._state in (_BEFORE_OBJECT, _IN_OBJECT):
+            self._parse_member()
+        while self._state == _IN_ITEMS:
+            char = self._peek()
+            if char == ',':
+                self._pos += 1
+            elif char == ']':
+                self._pos += 1
+                self._state = _IN_OBJECT
+                # decode the tail of the object
+                while self._state == _IN_OBJECT:
+                    self._parse_member()
+            else:
+                item = self._decode_value()
+                self.count += 1
+                if self._item_deserializer is not None:
+                    return self._item_deserializer(item)
+                return item
+        raise StopIteration
+
+    def __len__(self):
+        return self.count
+
+    def field(self, name):
+        """Returns the value of a top level member, decoding the body up to it
+        or up to the start of the items, whichever comes first.
+
+        :param name: name of the member.
+        :return: the decoded value, None if it is not known (yet).
+        """
+        while name not in self.fields and self._state in (_BEFORE_OBJECT, _IN_OBJECT):
+            self._parse_member()
+        return self.fields.get(name)
+
+    def close(self):
+        """Releases the connection. A partially read body is discarded along
+        with the connection it was read from.
+        """
+        if self._response is None:
+            return
+        if self._transfer_counters is not None:
+            wire_bytes = self._response.tell() if hasattr(self._response, 'tell') else self.content_bytes
+            self._transfer_counters.record(wire_bytes, self.content_bytes)
+        if self._state != _DONE and hasattr(self._response, 'close'):
+            self._response.close()
+        if hasattr(self._response, 'release_conn'):
+            self._response.release_conn()
+        self._response = None
+
+    def _parse_member(self):
+        char = self._peek()
+        if self._state == _BEFORE_OBJECT:
+            if char != '{':
+                self._fail("Expecting '{'")
+            self._pos += 1
+            self._state = _IN_OBJECT
+            return
+        if char == ',':
+            self._pos += 1
+            char = self._peek()
+        if char == '}':
+            self._pos += 1
+            self._state = _DONE
+            self.close()
+            return
+        key = self._decode_value()
+        if self._peek() != ':':
+            self._fail("Expecting ':'")
+        self._pos += 1
+        if key == 'items' and self._peek() == '[':
+            self._pos += 1
+            self._state = _IN_ITEMS
+        else:
+            self.fields[key] = self._decode_value()
+
+    def _peek(self):
+        """Skips whitespace and returns the next character, None at the end."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number may go on in the next chunk
+            if end == len(self._buffer) and isinstance(value, (int, float)) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _fill(self):
+        """Appends the next chunk to the buffer, dropping what was decoded.
+
+        :return: False if the body was read entirely.
+        """
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            text = self._text_decoder.decode(b'', final=True)
+        else:
+            self.content_bytes += len(chunk)
+            text = self._text_decoder.decode(chunk)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def _fail(self, message):
+        self.close()
+        raise json.JSONDecodeError(message, self._buffer, self._pos)
+
+
+class StreamedModel(object):
+    """Stands for a response model whose `items` are decoded on demand from a
+    JSONItemStream. Other fields are decoded when first accessed, they are
+    None until the stream reaches them.
+    """
+
+    def __init__(self, model_class, stream) -> None:
+        self._model_class = model_class
+        self._stream = stream
+        stream.body = self
+
+    @property
+    def items(self):
+        return self._stream
+
+    def __getattr__(self, name):
+        fields = self.__dict__['_model_class'].__fields__
+        if name.startswith('_') or name not in fields:
+            raise AttributeError(name)
+        value = self._stream.field(fields[name].alias)
+        if value is None:
+            return None
+        return getattr(self._model_class.from_dict({fields[name].alias: value}), name)
+
+    def __repr__(self):
+        return '{}(streamed)'.format(self._model_class.__name__)
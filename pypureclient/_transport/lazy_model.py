@@ -0,0 +1,192 @@
+# coding: utf-8
+
+import pprint
+import sys
+
+from typing import Dict, Optional, Tuple
+
+try:
+    from pydantic.v1.fields import MAPPING_LIKE_SHAPES, SHAPE_SINGLETON
+except ModuleNotFoundError:
+    from pydantic.fields import MAPPING_LIKE_SHAPES, SHAPE_SINGLETON
+
+# How the fields of each model class are read from a dict, by class
+_field_readers: Dict[type, Dict[str, Tuple[str, int, Optional[type]]]] = {}
+
+# Kinds of fields
+_VALUE = 0      # left as decoded
+_MODEL = 1      # a model
+_LIST = 2       # a list of models
+_MAPPING = 3    # a dict of models
+
+
+class LazyModel(object):
+    """Stands for a model, e.g. an item of a list response, holding the dict
+    decoded from the JSON body. Its fields are read from the dict when first
+    accessed, and the models they hold are built then, lazily as well, so a
+    listing costs little more than decoding its body when only a few fields
+    of the items are read.
+
+    Fields are accessed as on the model, `None` values included, and
+    `to_dict` returns the same dict. A LazyModel is not an instance of the
+    model class; `to_model` builds one.
+    """
+
+    __slots__ = ('_model_class', '_data', '__dict__')
+
+    def __init__(self, model_class, data) -> None:
+        object.__setattr__(self, '_model_class', model_class)
+        object.__setattr__(self, '_data', data)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            # e.g. a slot not set yet, while copied or unpickled
+            raise AttributeError(name)
+        readers = _get_field_readers(self._model_class)
+        reader = readers.get(name)
+        if reader is None:
+            raise AttributeError(name)
+        value = _read(reader, self._data)
+        if value is None:
+            if _should_raise_on_none(self._model_class):
+                raise AttributeError(name)
+            return None
+        # fields are not expected to change, don't read them again
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        if name not in _get_field_readers(self._model_class):
+            raise AttributeError(name)
+        if value is None:
+            self.__dict__.pop(name, None)
+        else:
+            self.__dict__[name] = value
+        self._data[self._model_class.__fields__[name].alias] = _to_data(value)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            if key in _get_field_readers(self._model_class):
+                return None
+            raise
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        setattr(self, key, None)
+
+    # without __hash__, unhashable like the models
+    def __eq__(self, other):
+        if isinstance(other, LazyModel):
+            return self._model_class is other._model_class and self.to_dict() == other.to_dict()
+        if isinstance(other, self._model_class):
+            return self.to_model() == other
+        return NotImplemented
+
+    def __reduce__(self):
+        return LazyModel, (self._model_class, self._data)
+
+    def __dir__(self):
+        return sorted(set(object.__dir__(self)) | set(_get_field_readers(self._model_class)))
+
+    def to_dict(self, include_readonly=True):
+        """Returns the dictionary representation of the model using alias, as
+        the model does."""
+        if not include_readonly:
+            return self.to_model().to_dict(include_readonly=False)
+        return _to_dict(self._model_class, self._data)
+
+    def as_request_dict(self):
+        return self.to_dict(include_readonly=False)
+
+    def to_model(self):
+        """Returns the model, built from the dict."""
+        return self._model_class.from_dict(self._data)
+
+    def to_str(self):
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.to_dict(include_readonly=True))
+
+    def __str__(self):
+        return self.to_str()
+
+    def __repr__(self):
+        return self.to_str()
+
+
+def lazy_items(model_class):
+    """Returns the function wrapping the decoded items of a model class."""
+    return lambda data: LazyModel(model_class, data) if isinstance(data, dict) else data
+
+
+def _get_field_readers(model_class):
+    """Resolves once how each field of a model class is read from a dict.
+
+    :return: dict of field name to (alias, kind, model class of the values).
+    """
+    readers = _field_readers.get(model_class)
+    if readers is None:
+        readers = {}
+        for name, field in model_class.__fields__.items():
+            sub_class = field.type_
+            if not (isinstance(sub_class, type) and hasattr(sub_class, 'from_dict')
+                    and hasattr(sub_class, '__fields__')):
+                readers[name] = (field.alias, _VALUE, None)
+            elif field.shape == SHAPE_SINGLETON:
+                readers[name] = (field.alias, _MODEL, sub_class)
+            elif field.shape in MAPPING_LIKE_SHAPES:
+                readers[name] = (field.alias, _MAPPING, sub_class)
+            else:
+                readers[name] = (field.alias, _LIST, sub_class)
+        _field_readers[model_class] = readers
+    return readers
+
+
+def _read(reader, data):
+    alias, kind, sub_class = reader
+    value = data.get(alias)
+    if value is None or kind == _VALUE:
+        return value
+    if kind == _MODEL:
+        return LazyModel(sub_class, value) if isinstance(value, dict) else value
+    if kind == _LIST:
+        return [LazyModel(sub_class, v) if isinstance(v, dict) else v for v in value]
+    return {k: LazyModel(sub_class, v) if isinstance(v, dict) else v for k, v in value.items()}
+
+
+def _to_dict(model_class, data):
+    """The fields of a dict known to a model class, without None values,
+    their models converted alike."""
+    result = {}
+    for alias, kind, sub_class in _get_field_readers(model_class).values():
+        value = data.get(alias)
+        if value is None:
+            continue
+        if kind == _MODEL and isinstance(value, dict):
+            value = _to_dict(sub_class, value)
+        elif kind == _LIST:
+            value = [_to_dict(sub_class, v) if isinstance(v, dict) else v for v in value]
+        elif kind == _MAPPING:
+            value = {k: _to_dict(sub_class, v) if isinstance(v, dict) else v for k, v in value.items()}
+        result[alias] = value
+    return result
+
+
+def _to_data(value):
+    if isinstance(value, LazyModel):
+        return value._data
+    if hasattr(value, 'to_dict') and hasattr(value, '__fields__'):
+        return value.to_dict(include_readonly=True)
+    if isinstance(value, list):
+        return [_to_data(v) for v in value]
+    return value
+
+
+def _should_raise_on_none(model_class):
+    """Whether the model raises AttributeError for fields set to None, see
+    `model_attribute_error_on_none` of the clients."""
+    should_raise = getattr(sys.modules.get(model_class.__module__), '_should_raise_on_none', None)
+    return should_raise is not None and should_raise()
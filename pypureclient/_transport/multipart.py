@@ -0,0 +1,179 @@
+# coding: utf-8
+
+import io
+import logging
+import os
+import time
+
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadFile(object):
+    """File sent by path in a multipart body. It is opened when its part is
+    reached, and read in chunks."""
+
+    def __init__(self, path) -> None:
+        self.path = path
+        # fail before sending anything if the file can't be read
+        self.size = os.path.getsize(path)
+
+    def open(self):
+        return open(self.path, 'rb')
+
+    def __repr__(self):
+        return 'UploadFile({!r})'.format(self.path)
+
+
+class MultipartEncoder(object):
+    """`multipart/form-data` body read as a file, so that the parts holding
+    files are read from them in chunks while the request is sent instead of
+    being loaded in memory first.
+
+    Fields are those of `urllib3.encode_multipart_formdata`, i.e. (name,
+    value) or (name, (filename, data[, mimetype])) tuples. The data of a file
+    may be bytes, a str, an UploadFile or a binary file object, read from its
+    current position.
+    """
+
+    def __init__(self, fields, boundary=None, progress=None) -> None:
+        """
+        :param fields: list of form fields.
+        :param boundary: multipart boundary, random if None.
+        :param progress: function called with the number of bytes sent, the
+            length of the body, or None if not known, and the throughput in
+            bytes per second, as the body is read.
+        """
+        self.boundary = boundary or choose_boundary()
+        self.content_type = 'multipart/form-data; boundary={}'.format(self.boundary)
+        self._progress = progress
+        # bytes, or (UploadFile or file object, start position, size or None)
+        self._segments = []
+        for name, value in fields:
+            field = RequestField.from_tuples(name, value)
+            self._segments.append('--{}\r\n'.format(self.boundary).encode('latin-1') +
+                                  field.render_headers().encode('utf-8'))
+            data = field.data
+            if isinstance(data, int):
+                data = str(data)
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            if isinstance(data, bytes):
+                self._segments[-1] += data + b'\r\n'
+            else:
+                self._segments.append(_file_segment(data))
+                self._segments.append(b'\r\n')
+        self._segments.append('--{}--\r\n'.format(self.boundary).encode('latin-1'))
+        self.length = None
+        """Length of the body, None if a file object doesn't tell its size."""
+        if all(isinstance(segment, bytes) or segment[2] is not None for segment in self._segments):
+            self.length = sum(len(segment) if isinstance(segment, bytes) else segment[2]
+                              for segment in self._segments)
+        self.sent = 0
+        """Number of bytes read so far."""
+        self._index = 0
+        self._offset = 0
+        self._file = None
+        self._started = None
+
+    def read(self, size=-1):
+        """Returns up to `size` bytes of the body, b'' once it is read."""
+        if size is None or size < 0:
+            return b''.join(iter(lambda: self.read(CHUNK_SIZE), b''))
+        chunk = b''
+        while not chunk and self._index < len(self._segments):
+            segment = self._segments[self._index]
+            if isinstance(segment, bytes):
+                chunk = segment[self._offset:self._offset + size]
+            else:
+                chunk = self._read_file(segment, size)
+            self._offset += len(chunk)
+            if not chunk or self._offset == _segment_size(segment):
+                self._next_segment()
+        if chunk:
+            self._sent(len(chunk))
+        return chunk
+
+    def __iter__(self):
+        return iter(lambda: self.read(CHUNK_SIZE), b'')
+
+    def __len__(self):
+        if self.length is None:
+            raise TypeError("the length of the body is not known")
+        return self.length
+
+    def tell(self):
+        return self.sent
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Rewinds the body, so that urllib3 can send it again on retries."""
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("the body can only be rewound to its start")
+        self.close()
+        self._index = 0
+        self._offset = 0
+        self.sent = 0
+        self._started = None
+        return 0
+
+    def close(self):
+        """Closes the file being read, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_file(self, segment, size):
+        source, start, length = segment
+        if self._offset == 0:
+            if isinstance(source, UploadFile):
+                self._file = source.open()
+            elif start is not None:
+                source.seek(start)
+        f = self._file if self._file is not None else source
+        if length is not None:
+            size = min(size, length - self._offset)
+        return f.read(size) if size else b''
+
+    def _next_segment(self):
+        self.close()
+        self._index += 1
+        self._offset = 0
+
+    def _sent(self, count):
+        now = time.monotonic()
+        if self._started is None:
+            self._started = now
+        self.sent += count
+        elapsed = now - self._started
+        throughput = self.sent / elapsed if elapsed > 0 else None
+        if self._progress is not None:
+            self._progress(self.sent, self.length, throughput)
+        if self._index == len(self._segments):
+            logger.debug("multipart body of %d bytes sent in %.3fs", self.sent, elapsed)
+
+
+def _file_segment(data):
+    if isinstance(data, UploadFile):
+        return (data, None, data.size)
+    start = size = None
+    try:
+        if data.seekable():
+            start = data.tell()
+            size = os.fstat(data.fileno()).st_size - start
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        # not a regular file, e.g. BytesIO
+        try:
+            start = data.tell()
+            size = data.seek(0, io.SEEK_END) - start
+            data.seek(start)
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            start = size = None
+    return (data, start, size)
+
+
+def _segment_size(segment):
+    return len(segment) if isinstance(segment, bytes) else segment[2]
@@ -0,0 +1,170 @@
+# coding: utf-8
+
+import bisect
+import logging
+import threading
+import time
+
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Rate limiters of the process, by target
+_rate_limiters: Dict[str, 'RateLimiter'] = {}
+_rate_limiters_lock = threading.Lock()
+
+# (limit header, remaining header, period in seconds) of each bucket
+_BUCKET_HEADERS = (
+    ('X-RateLimit-Limit-second', 'X-RateLimit-Remaining-second', 1.0),
+    ('X-RateLimit-Limit-minute', 'X-RateLimit-Remaining-minute', 60.0),
+)
+
+
+def get_rate_limiter(target):
+    """Returns the rate limiter shared by the clients of a target.
+
+    :param target: host URL of the target.
+    :return: RateLimiter
+    """
+    with _rate_limiters_lock:
+        rate_limiter = _rate_limiters.get(target)
+        if rate_limiter is None:
+            rate_limiter = _rate_limiters[target] = RateLimiter()
+        return rate_limiter
+
+
+class _TokenBucket(object):
+    """Bucket of `limit` tokens, where a token taken is put back one period
+    later. No more than `limit` requests are then sent in any period, so the
+    limit is not exceeded whether the target counts requests in sliding or
+    fixed windows.
+    """
+
+    def __init__(self, period) -> None:
+        self.period = period
+        self.limit = None
+        # times the tokens held were taken at, sorted, and the number of
+        # tokens taken up to each of them since the bucket was created, so
+        # that tokens taken at once are a single entry
+        self.times: List[float] = []
+        self.totals: List[int] = []
+        # number of tokens put back since the bucket was created
+        self.put_back_total = 0
+
+    def wait_time(self, now):
+        """Seconds until a token is available."""
+        if self.limit is None:
+            return 0.0
+        held = self._total(len(self.times)) - self.put_back_total
+        if held < self.limit:
+            return 0.0
+        # wait for the limit-th latest token to be put back
+        i = bisect.bisect_left(self.totals, self.put_back_total + held - self.limit + 1)
+        return max(0.0, self.times[i] + self.period - now)
+
+    def take(self, at, count=1):
+        """Takes `count` tokens at time `at`."""
+        if self.limit is None:
+            return
+        i = bisect.bisect_right(self.times, at)
+        self.times.insert(i, at)
+        self.totals.insert(i, self._total(i) + count)
+        # taken before the tokens of a later request, rarely
+        for j in range(i + 1, len(self.totals)):
+            self.totals[j] += count
+
+    def put_back(self, now):
+        """Puts back the tokens taken more than a period ago."""
+        i = bisect.bisect_right(self.times, now - self.period)
+        if i:
+            self.put_back_total = self.totals[i - 1]
+            del self.times[:i]
+            del self.totals[:i]
+
+    def used(self, now):
+        """Number of tokens taken during the last period, up to now."""
+        return (self._total(bisect.bisect_right(self.times, now)) -
+                self._total(bisect.bisect_right(self.times, now - self.period)))
+
+    def _total(self, i):
+        """Number of tokens taken before the i-th entry since the bucket was
+        created."""
+        return self.totals[i - 1] if i else self.put_back_total
+
+
+class RateLimiter(object):
+    """Token buckets pacing the requests sent to a target, one per rate limit
+    window of the target.
+
+    The buckets are sized from the X-RateLimit-Limit-* headers of the
+    responses. When the X-RateLimit-Remaining-* counts show the target
+    counted more requests than were sent from here, e.g. by other processes,
+    the difference is taken from the buckets. Requests are not paced until
+    the target has sent its limits.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets = [_TokenBucket(period) for _, _, period in _BUCKET_HEADERS]
+
+    def reserve(self):
+        """Takes a token from every bucket.
+
+        :return: seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            for bucket in self._buckets:
+                bucket.put_back(now)
+                wait = max(wait, bucket.wait_time(now))
+            for bucket in self._buckets:
+                bucket.take(now + wait)
+        if wait:
+            logger.debug("rate limit reached, delaying the request by %.3fs", wait)
+        return wait
+
+    def try_reserve(self):
+        """Takes a token from every bucket if none of them is empty.
+
+        :return: True if the request can be sent now.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for bucket in self._buckets:
+                bucket.put_back(now)
+                if bucket.wait_time(now):
+                    return False
+            for bucket in self._buckets:
+                bucket.take(now)
+        return True
+
+    def update(self, headers):
+        """Corrects the buckets from the rate limit headers of a response.
+
+        :param headers: response headers, may be None.
+        """
+        if not headers:
+            return
+        with self._lock:
+            now = time.monotonic()
+            for bucket, (limit_header, remaining_header, _) in zip(self._buckets, _BUCKET_HEADERS):
+                limit = _get_int(headers, limit_header)
+                if limit is None or limit <= 0:
+                    continue
+                bucket.limit = limit
+                bucket.put_back(now)
+                remaining = _get_int(headers, remaining_header)
+                if remaining is not None:
+                    # requests counted by the target but not sent from here
+                    missing = limit - remaining - bucket.used(now)
+                    if missing > 0:
+                        bucket.take(now, missing)
+
+
+def _get_int(headers, name):
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,36 @@
+# coding: utf-8
+
+
+class RawModel(object):
+    """Stands for a response model whose `items` are left as decoded from
+    the JSON body, i.e. dicts, lists and primitive values, or built as
+    read-only records with `compact_items`. Other fields are deserialized to
+    their types when first accessed.
+    """
+
+    def __init__(self, model_class, data) -> None:
+        self._model_class = model_class
+        self._data = data
+
+    @property
+    def items(self):
+        return self._data.get('items')
+
+    def __getattr__(self, name):
+        fields = self.__dict__['_model_class'].__fields__
+        if name.startswith('_') or name not in fields:
+            raise AttributeError(name)
+        value = self._data.get(fields[name].alias)
+        if value is None:
+            return None
+        value = getattr(self._model_class.from_dict({fields[name].alias: value}), name)
+        # fields are not expected to change, don't deserialize them again
+        self.__dict__[name] = value
+        return value
+
+    def to_dict(self):
+        """Returns the body as decoded from JSON."""
+        return self._data
+
+    def __repr__(self):
+        return '{}(raw)'.format(self._model_class.__name__)
@@ -4,27 +4,93 @@ import io
 import json
 import logging
 import re
-import ssl
+import threading
+import time
 
+from typing import Dict
 from urllib.parse import urlencode, quote_plus
 import urllib3
 
+from .json_codec import get_json_codec
+from .multipart import MultipartEncoder
+from .backends import SUPPORTED_SOCKS_PROXIES, TransportBackend, get_backend_class, is_socks_proxy_url  # noqa: F401
+from ..hooks import current_endpoint, fire_hooks
+from ..profiling import current_profile
+from .circuit_breaker import FAILURE_STATUSES, get_circuit_breaker, is_failure
 from .exceptions import ApiException, UnauthorizedException, ForbiddenException, NotFoundException, ServiceException, ApiValueError, BadRequestException
 
 
 logger = logging.getLogger(__name__)
 
-SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
+# Transport backends shared by the REST clients of the process, keyed by
+# their TLS, proxy and pool settings. A backend keeps one pool per host.
+_shared_backends: Dict[tuple, TransportBackend] = {}
+_shared_backends_lock = threading.Lock()
+# Number of hosts a shared backend keeps pools for, before closing the
+# least recently used one
+_SHARED_NUM_POOLS = 64
 
 
-def is_socks_proxy_url(url):
-    if url is None:
-        return False
-    split_section = url.split("://")
-    if len(split_section) < 2:
-        return False
-    else:
-        return split_section[0].lower() in SUPPORTED_SOCKS_PROXIES
+def _freeze(value):
+    """Turns dicts and lists into tuples, so settings can be part of a key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def clear_shared_pool_managers():
+    """Closes the connections of every shared transport backend and forgets
+    them."""
+    with _shared_backends_lock:
+        backends = list(_shared_backends.values())
+        _shared_backends.clear()
+    for backend in backends:
+        backend.close()
+
+
+def raise_for_status(r):
+    """Raises the ApiException matching a non 2XX response status.
+
+    :param r: RESTResponse or urllib3.HTTPResponse object.
+    """
+    if not 200 <= r.status <= 299:
+        if r.status == 400:
+            raise BadRequestException(http_resp=r)
+
+        if r.status == 401:
+            raise UnauthorizedException(http_resp=r)
+
+        if r.status == 403:
+            raise ForbiddenException(http_resp=r)
+
+        if r.status == 404:
+            raise NotFoundException(http_resp=r)
+
+        if 500 <= r.status <= 599:
+            raise ServiceException(http_resp=r)
+
+        raise ApiException(http_resp=r)
+
+
+class TransferCounters(object):
+    """Bytes of response bodies received by a REST client, as transferred
+    and once decompressed."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.wire_bytes = 0
+        self.content_bytes = 0
+
+    def record(self, wire_bytes, content_bytes):
+        """Adds the body sizes of a response."""
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire_bytes
+            self.content_bytes += content_bytes
+        logger.debug("response body: %d bytes, %d bytes transferred", content_bytes, wire_bytes)
 
 
 class RESTResponse(io.IOBase):
@@ -34,6 +100,10 @@ class RESTResponse(io.IOBase):
         self.status = resp.status
         self.reason = resp.reason
         self.data = resp.data
+        self.content_bytes = len(self.data)
+        """Size of the body, decompressed"""
+        self.wire_bytes = resp.tell() if hasattr(resp, 'tell') else self.content_bytes
+        """Size of the body as transferred"""
 
     def getheaders(self):
         """Returns a dictionary of the response headers."""
@@ -46,32 +116,9 @@ class RESTResponse(io.IOBase):
 
 class RESTClientObject:
 
-    def __init__(self, configuration, pools_size=4, maxsize=None) -> None:
-        # urllib3.PoolManager will pass all kw parameters to connectionpool
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
-        # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
-        # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
-
-        # cert_reqs
-        if configuration.verify_ssl:
-            cert_reqs = ssl.CERT_REQUIRED
-        else:
-            cert_reqs = ssl.CERT_NONE
-
-        addition_pool_args = {}
-        if configuration.assert_hostname is not None:
-            addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
-
-        if configuration.retries is not None:
-            addition_pool_args['retries'] = configuration.retries
-
-        if configuration.tls_server_name:
-            addition_pool_args['server_hostname'] = configuration.tls_server_name
-
-
-        if configuration.socket_options is not None:
-            addition_pool_args['socket_options'] = configuration.socket_options
+    def __init__(self, configuration, pools_size=None, maxsize=None) -> None:
+        if pools_size is None:
+            pools_size = configuration.connection_pools or 4
 
         if maxsize is None:
             if configuration.connection_pool_maxsize is not None:
@@ -79,41 +126,49 @@ class RESTClientObject:
             else:
                 maxsize = 4
 
-        # https pool manager
-        if configuration.proxy:
-            if is_socks_proxy_url(configuration.proxy):
-                from urllib3.contrib.socks import SOCKSProxyManager
-                self.pool_manager = SOCKSProxyManager(
-                        cert_reqs=cert_reqs,
-                        ca_certs=configuration.ssl_ca_cert,
-                        cert_file=configuration.cert_file,
-                        key_file=configuration.key_file,
-                        proxy_url=configuration.proxy,
-                        headers=configuration.proxy_headers,
-                        **addition_pool_args
-                    )
-            else:
-                self.pool_manager = urllib3.ProxyManager(
-                    num_pools=pools_size,
-                    maxsize=maxsize,
-                    cert_reqs=cert_reqs,
-                    ca_certs=configuration.ssl_ca_cert,
-                    cert_file=configuration.cert_file,
-                    key_file=configuration.key_file,
-                    proxy_url=configuration.proxy,
-                    proxy_headers=configuration.proxy_headers,
-                    **addition_pool_args
-                )
+        self.json_codec = get_json_codec(configuration.json_codec)
+        self.accept_encoding = None
+        if configuration.accept_encoding is True:
+            self.accept_encoding = urllib3.util.make_headers(accept_encoding=True)['accept-encoding']
+        elif configuration.accept_encoding:
+            self.accept_encoding = configuration.accept_encoding
+        self.transfer_counters = TransferCounters()
+        self.upload_progress = configuration.upload_progress
+        self.hooks = list(configuration.hooks or ())
+        # fails the requests fast while the target is down
+        self.circuit_breaker = None
+        if configuration.circuit_breaker_threshold:
+            self.circuit_breaker = get_circuit_breaker(configuration.host, configuration.circuit_breaker_threshold,
+                                                       configuration.circuit_breaker_reset_timeout)
+
+        backend_class = get_backend_class(configuration.transport)
+        self.shared = configuration.share_connection_pools
+        if self.shared:
+            key = _freeze((backend_class, configuration.proxy, configuration.proxy_headers,
+                           pools_size, maxsize, bool(configuration.verify_ssl), configuration.ssl_ca_cert,
+                           configuration.cert_file, configuration.key_file, configuration.assert_hostname,
+                           configuration.retries, configuration.tls_server_name, configuration.socket_options))
+            try:
+                hash(key)
+            except TypeError:
+                # settings which cannot be compared, don't share
+                self.shared = False
+        if self.shared:
+            with _shared_backends_lock:
+                self.backend = _shared_backends.get(key)
+                if self.backend is None:
+                    self.backend = backend_class(configuration, max(pools_size, _SHARED_NUM_POOLS), maxsize)
+                    _shared_backends[key] = self.backend
         else:
-            self.pool_manager = urllib3.PoolManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=configuration.ssl_ca_cert,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                **addition_pool_args
-            )
+            self.backend = backend_class(configuration, pools_size, maxsize)
+        # the urllib3 pool manager of the urllib3 backend, None otherwise
+        self.pool_manager = getattr(self.backend, 'pool_manager', None)
+
+    def pool_stats(self):
+        """Returns the state of the connection pools of the transport backend,
+        see `TransportBackend.pool_stats`. Shared pools count the connections
+        and requests of every client sharing them."""
+        return self.backend.pool_stats()
 
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
@@ -136,6 +191,40 @@ class RESTClientObject:
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
         """
+        probe = self.circuit_breaker.acquire() if self.circuit_breaker is not None else False
+        endpoint = current_endpoint() if self.hooks else None
+        if self.hooks:
+            fire_hooks(self.hooks, 'on_request', endpoint, method, url)
+        start = time.monotonic()
+        failed = None
+        try:
+            r, request_bytes = self._request(method, url, headers, body, post_params,
+                                             _preload_content, _request_timeout)
+            failed = r.status in FAILURE_STATUSES
+        except Exception as e:
+            if is_failure(e):
+                failed = True
+            if self.hooks:
+                fire_hooks(self.hooks, 'on_response', endpoint, method, url, None,
+                           time.monotonic() - start, 0, 0)
+            raise
+        finally:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release(probe, failed)
+        if self.hooks:
+            fire_hooks(self.hooks, 'on_response', endpoint, method, url, r.status,
+                       time.monotonic() - start, getattr(r, 'wire_bytes', 0), request_bytes)
+
+        raise_for_status(r)
+
+        return r
+
+    def _request(self, method, url, headers, body, post_params,
+                 _preload_content, _request_timeout):
+        """Sends a request, see `request`.
+
+        :return: the response, and the size of the request body.
+        """
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
                           'PATCH', 'OPTIONS']
@@ -146,7 +235,11 @@ class RESTClientObject:
             )
 
         post_params = post_params or {}
-        headers = headers or {}
+        # the headers of the caller are not modified
+        headers = dict(headers or {})
+        if self.accept_encoding and 'Accept-Encoding' not in headers:
+            # urllib3 decompresses the body as it is read
+            headers['Accept-Encoding'] = self.accept_encoding
         # url already contains the URL query string
         # so reset query_params to empty dict
         query_params = {}
@@ -160,6 +253,11 @@ class RESTClientObject:
                 timeout = urllib3.Timeout(
                     connect=_request_timeout[0], read=_request_timeout[1])
 
+        # a profiled response is read apart, to time the wait and the read
+        profile = current_profile() if _preload_content else None
+        preload_content = _preload_content and profile is None
+
+        request_bytes = 0
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
@@ -168,44 +266,51 @@ class RESTClientObject:
                 if not headers.get('Content-Type') or re.search('json', headers['Content-Type'], re.IGNORECASE):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
-                    r = self.pool_manager.request(
+                        request_body = self.json_codec.dumps(body)
+                        request_bytes = len(request_body)
+                    r = self.backend.request(
                         method, url,
                         body=request_body,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
-                    r = self.pool_manager.request(
+                    request_bytes = len(urlencode(post_params))
+                    r = self.backend.request(
                         method, url,
                         fields=post_params,
                         encode_multipart=False,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
                     # Ensures that dict objects are serialized
                     post_params = [(a, json.dumps(b)) if isinstance(b, dict) else (a,b) for a, b in post_params]
-                    r = self.pool_manager.request(
-                        method, url,
-                        fields=post_params,
-                        encode_multipart=True,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
+                    # files are read in chunks while the body is sent
+                    request_body = MultipartEncoder(post_params, progress=self.upload_progress)
+                    headers['Content-Type'] = request_body.content_type
+                    if request_body.length is not None:
+                        headers['Content-Length'] = str(request_body.length)
+                    try:
+                        r = self.backend.request(
+                            method, url,
+                            body=request_body,
+                            preload_content=preload_content,
+                            timeout=timeout,
+                            headers=headers)
+                    finally:
+                        request_body.close()
+                    request_bytes = request_body.sent
                 # Pass a `string` parameter directly in the body to support
                 # other content types than Json when `body` argument is
                 # provided in serialized form
                 elif isinstance(body, str) or isinstance(body, bytes):
                     request_body = body
-                    r = self.pool_manager.request(
+                    request_bytes = len(request_body)
+                    r = self.backend.request(
                         method, url,
                         body=request_body,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
                         headers=headers)
                 else:
@@ -216,40 +321,27 @@ class RESTClientObject:
                     raise ApiException(status=0, reason=msg)
             # For `GET`, `HEAD`
             else:
-                r = self.pool_manager.request(method, url,
-                                              fields={},
-                                              preload_content=_preload_content,
-                                              timeout=timeout,
-                                              headers=headers)
+                r = self.backend.request(method, url,
+                                         fields={},
+                                         preload_content=preload_content,
+                                         timeout=timeout,
+                                         headers=headers)
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
 
+        if profile is not None:
+            profile.lap('send')
         if _preload_content:
             r = RESTResponse(r)
+            if profile is not None:
+                profile.lap('body_read')
+            self.transfer_counters.record(r.wire_bytes, r.content_bytes)
 
             # log response body
             logger.debug("response body: %s", r.data)
 
-        if not 200 <= r.status <= 299:
-            if r.status == 400:
-                raise BadRequestException(http_resp=r)
-
-            if r.status == 401:
-                raise UnauthorizedException(http_resp=r)
-
-            if r.status == 403:
-                raise ForbiddenException(http_resp=r)
-
-            if r.status == 404:
-                raise NotFoundException(http_resp=r)
-
-            if 500 <= r.status <= 599:
-                raise ServiceException(http_resp=r)
-
-            raise ApiException(http_resp=r)
-
-        return r
+        return r, request_bytes
 
     def get_request(self, url, headers=None, query_params=None, _preload_content=True,
             _request_timeout=None):
@@ -317,5 +409,6 @@ class RESTClientObject:
                             body=body)
 
     def close(self):
-        if self.pool_manager:
-            self.pool_manager.close()
+        """Closes the connections of the transport backend, unless it is shared."""
+        if self.backend is not None and not self.shared:
+            self.backend.close()
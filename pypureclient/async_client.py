@@ -0,0 +1,196 @@
+import asyncio
+import copy
+import functools
+import inspect
+import uuid
+import warnings
+
+from typing import Dict
+
+from .exceptions import PureError
+from .hooks import call_endpoint, get_endpoint
+from .keywords import Parameters
+from .profiling import profiled
+from .projection import ProjectedFunction, get_projection
+from .tracing import traced
+from .responses import ItemIterator, AsyncItemIterator
+from .retry_policy import RETRY, REFRESH_AUTH, RETURN_ERROR
+
+from ._transport.async_api_client import AsyncApiClient
+from ._transport.exceptions import ApiConnectionError
+from ._transport.rest import ApiException
+
+
+class AsyncClientMixin(object):
+    """
+    Turns a generated FlashArray, FlashBlade or Pure1 client into an asyncio
+    client. Every generated `get_*`, `post_*`, `patch_*`, `put_*` and
+    `delete_*` method returns a coroutine, the HTTP requests are sent through
+    a non-blocking transport and the items of a ValidResponse are an
+    AsyncItemIterator to be consumed with `async for`.
+    """
+
+    # Status which triggers an access token refresh, and statuses which are
+    # returned as an ErrorResponse without retrying, set on each client by
+    # `to_async_client`
+    _auth_error_status = 401
+    _final_error_statuses = (400, 403, 404)
+
+    def _call_api(self, api_class_name, api_function_name, kwargs, response_creator=None, fields=None):
+        """
+        Schedule the API call, see `_async_call_api`.
+
+        Returns:
+            coroutine: Resolving to a ValidResponse or an ErrorResponse.
+        """
+        return self._async_call_api(api_class_name, api_function_name, kwargs, response_creator, fields)
+
+    @traced
+    @profiled
+    async def _async_call_api(self, api_class_name, api_function_name, kwargs, response_creator=None,
+                              fields=None):
+        """
+        Await the API function and process the response. May call the API
+        repeatedly if the request failed for a reason that may not persist in
+        the next call. Follows the same retry rules as the synchronous client.
+
+        Args:
+            api_class_name (str): Swagger-generated api class to call.
+            api_function_name (str): Swagger-generated function to call.
+            kwargs (dict): kwargs to pass to the function.
+            response_creator: optional method to generate a ValidResponse from a non-standard endpoint.
+            fields (list[str or Property]): The fields of the items to
+                deserialize, see `pypureclient.projection.Projection`.
+
+        Returns:
+            ValidResponse: If the call was successful.
+            ErrorResponse: If the call was not successful.
+
+        Raises:
+            PureError: If calling the API fails.
+            ValueError: If a parameter is of an invalid type.
+            TypeError: If invalid or missing parameters are used.
+        """
+        kwargs['_request_timeout'] = self._timeout
+        if Parameters.x_request_id in kwargs and not kwargs[Parameters.x_request_id]:
+            kwargs[Parameters.x_request_id] = str(uuid.uuid4())
+
+        iterator_stop_on_limit = True
+        auto_pagination_limit = getattr(self, '_Client__auto_pagination_limit', None)
+        if Parameters.limit in kwargs and not kwargs[Parameters.limit] and auto_pagination_limit:
+            kwargs[Parameters.limit] = auto_pagination_limit
+            iterator_stop_on_limit = False
+
+        if kwargs.get('authorization') is not None:
+            warnings.warn("authorization parameter is deprecated, and will be removed soon.", DeprecationWarning)
+        original_auth_error = None
+        api_function = getattr(self._Client__get_api_instance(api_class_name), api_function_name)
+        projection = get_projection(fields, api_function_name, self._api_client.configuration)
+        if projection is not None:
+            api_function = ProjectedFunction(api_function, projection)
+        retry = self._retry_policy.start(self._api_client.configuration.hooks, get_endpoint(api_function))
+        while True:
+            try:
+                response = await call_endpoint(api_function, kwargs)
+                # Call was successful (200)
+                return self._create_async_valid_response(response, api_function, iterator_stop_on_limit,
+                                                         kwargs, response_creator)
+            except ApiConnectionError as error:
+                # If the connection failed, wait and try again unless the
+                # request may have been processed already
+                delay = retry.connection_error_delay(error, idempotent=api_function_name.endswith('_get_with_http_info'))
+                if delay is None:
+                    raise PureError(error)
+                await asyncio.sleep(delay)
+            except ApiException as error:
+                action, delay = retry.status_error_action(error.status, error.headers,
+                                                          auth_error_status=self._auth_error_status,
+                                                          final_error_statuses=self._final_error_statuses)
+                # If rate limit or server error the policy retries, wait and try again
+                if action == RETRY:
+                    await asyncio.sleep(delay)
+                # If authentication error, reset access token and retry once
+                elif action == REFRESH_AUTH:
+                    original_auth_error = error
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, functools.partial(self._set_auth_header, refresh=True))
+                # If the call will never work, or is out of retries, return the error
+                elif action == RETURN_ERROR:
+                    return self._create_error_response(original_auth_error or error)
+                # If error with the swagger client, raise the error
+                else:
+                    raise PureError(error)
+
+    def _create_async_valid_response(self, response, endpoint, iterator_stop_on_limit, kwargs, response_creator):
+        """
+        Create a ValidResponse with the generated response creators and make its
+        items asynchronously iterable.
+
+        Returns:
+            ValidResponse
+        """
+        if response_creator:
+            valid_response = response_creator(response, endpoint, kwargs)
+        elif 'iterator_stop_on_limit' in inspect.signature(self._create_valid_response).parameters:
+            valid_response = self._create_valid_response(response, endpoint, iterator_stop_on_limit, kwargs)
+        else:
+            valid_response = self._create_valid_response(response, endpoint, kwargs)
+        if isinstance(valid_response.items, ItemIterator):
+            valid_response.items = AsyncItemIterator.from_item_iterator(valid_response.items)
+        return valid_response
+
+    def close(self):
+        """
+        Close the connections of this client.
+        """
+        self._api_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Async client class of each generated client class
+__async_client_classes: Dict[type, type] = {}
+
+
+def to_async_client(client, auth_error_status=401, final_error_statuses=(400, 403, 404)):
+    """
+    Convert a generated client into its asyncio counterpart. The synchronous
+    transport of the client is closed and replaced by a non-blocking one,
+    authentication headers are carried over.
+
+    Args:
+        client: A generated versioned FlashArray, FlashBlade or Pure1 client.
+        auth_error_status (int): The status for which the access token is refreshed.
+        final_error_statuses (tuple): The statuses returned without retrying.
+
+    Returns:
+        The same client object, now an instance of AsyncClientMixin.
+    """
+    client_class = type(client)
+    async_class = __async_client_classes.get(client_class)
+    if async_class is None:
+        async_class = type('AsyncClient', (AsyncClientMixin, client_class), {
+            '__module__': client_class.__module__,
+        })
+        __async_client_classes[client_class] = async_class
+
+    sync_api_client = client._api_client
+    configuration = copy.deepcopy(sync_api_client.configuration)
+    # pages of an AsyncItemIterator are awaited on demand
+    configuration.prefetch_pages = 0
+    configuration.parallel_pages = 0
+    async_api_client = AsyncApiClient(configuration=configuration,
+                                      models_package=sync_api_client.models_package)
+    async_api_client.default_headers = dict(sync_api_client.default_headers)
+    sync_api_client.close()
+    client._api_client = async_api_client
+    # API instances are bound to the api client, let them be recreated
+    client._Client__apis_instances = {}
+    client.__class__ = async_class
+    client._auth_error_status = auth_error_status
+    client._final_error_statuses = tuple(final_error_statuses)
+    return client
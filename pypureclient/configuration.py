@@ -7,6 +7,11 @@ import urllib3
 
 import http.client as httplib
 
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from .hooks import ClientHooks
+
 class Configuration:
     """This class contains various settings of the API client.
 
@@ -74,6 +79,43 @@ class Configuration:
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
         """
+        self.accept_encoding = None
+        """Compressions accepted for response bodies, as the value of the
+           Accept-Encoding header, e.g. 'gzip, deflate'. True accepts every
+           compression urllib3 can decode, i.e. gzip and deflate, and br or
+           zstd when brotli or zstandard are installed, and gzip and deflate
+           with the asyncio client. Bodies are decoded as they are read,
+           streamed responses included.
+        """
+        self.upload_progress = None
+        """Function called as the body of a multipart upload is sent, with
+           the number of bytes sent, the size of the body, or None if not
+           known, and the throughput in bytes per second, or None until it
+           can be measured. Files are read in chunks, not loaded in memory.
+        """
+        self.connection_pools = 4
+        """Number of hosts connections are kept to by a client, or by the
+           clients sharing their connection pools, at least 64 then.
+        """
+        self.transport = 'urllib3'
+        """Library the blocking clients send their requests with: 'urllib3',
+           over HTTP/1.1, or 'httpx', which multiplexes concurrent requests
+           over a single HTTP/2 connection per target when installed with
+           `pip install httpx[http2]`. A subclass of
+           `pypureclient._transport.backends.TransportBackend` is also
+           accepted. The state of the connection pools is returned by
+           `client._api_client.rest_client.pool_stats()`.
+        """
+        self.share_connection_pools = False
+        """Share urllib3 pool managers with the other clients of the process
+           using the same TLS, proxy and pool settings, which set it too.
+           Connections opened to check the REST versions or to get an access
+           token are then reused by the client instead of being handshaken
+           again, and so are the connections of the other clients, kept alive
+           between their requests. Shared pools are not closed with a client;
+           `pypureclient._transport.rest.clear_shared_pool_managers` closes
+           them, e.g. after the target restarted.
+        """
 
         self.proxy = None
         """Proxy URL
@@ -102,6 +144,180 @@ class Configuration:
         """date format
         """
 
+        self.json_codec = 'json'
+        """JSON library used to encode request bodies and decode responses:
+           'json' for the standard library, 'orjson', 'msgspec' or 'ujson'
+           when installed, or 'auto' for the first of these installed.
+           Falls back to the standard library. An object with `loads` and
+           `dumps` methods, like `_transport.json_codec.JSONCodec`, is also
+           accepted.
+        """
+
+        self.prefetch_pages = 0
+        """Number of pages of a paginated GET response fetched ahead on a
+           background thread while the current page is consumed.
+           0 disables prefetching. It can also be enabled for a single
+           response with `response.items.prefetch(pages)`.
+        """
+
+        self.parallel_pages = 0
+        """Number of pages of a paginated GET response requested concurrently
+           when its total item count is known, i.e. when it was called with
+           `total_item_count=True`. The remaining offset range is split into
+           pages of the size of the first one. 0 disables parallel fetching.
+           It can also be enabled for a single response with
+           `response.items.parallel(pages)`.
+        """
+
+        self.parallel_pages_ordered = True
+        """Whether pages fetched in parallel are returned in the order of the
+           collection, or as soon as they are received.
+        """
+
+        self.rate_limiting = False
+        """Pace the requests sent to the target so that they stay within the
+           rate limits it sends in the X-RateLimit-* headers of its responses.
+           The pace is shared by every client of the process talking to the
+           same host which sets it too, and corrected from each response.
+           Requests are delayed only once a limit is about to be reached,
+           instead of being rejected with a 429 status.
+        """
+
+        self.hooks: List['ClientHooks'] = []
+        """`pypureclient.hooks.ClientHooks` called as the requests of the
+           clients are sent, retried and paginated, with their endpoint and
+           timings. `pypureclient.hooks.LatencyRecorder` keeps a latency
+           histogram and the byte, retry and 429 counts of each endpoint.
+        """
+
+        self.profiling = False
+        """Break the time of every API call into phases, from processing its
+           parameters to building the models of its response, set as the
+           `profile` of the response. See `pypureclient.profiling`, whose
+           `profile_call` profiles the calls of a block instead.
+        """
+
+        self.tracing = True
+        """Trace the API calls with OpenTelemetry, if `opentelemetry-api` is
+           installed: a span per call, with a child span per HTTP request,
+           retries included, and per page of items fetched. See
+           `pypureclient.tracing`.
+        """
+
+        self.circuit_breaker_threshold = 0
+        """Number of requests to a target failing in a row, because it could
+           not be reached or answered 502, 503 or 504, after which requests
+           to it raise `CircuitOpenError` without being sent. Once
+           `circuit_breaker_reset_timeout` has passed, a single request tries
+           the target again and closes the circuit if it succeeds. The
+           circuit is shared by every client of the process talking to the
+           same host, its state is returned by
+           `pypureclient.get_circuit_state(target)`. 0 disables the breaker.
+        """
+        self.circuit_breaker_reset_timeout = 30.0
+        """Time, in seconds, the circuit stays open before the target is
+           tried again.
+        """
+
+        self.hedging = False
+        """Send a duplicate of a GET request, with the same X-Request-ID, on
+           another connection when its response is late. The request is still
+           sent and waited for on the thread of the caller, the response of
+           the duplicate is used if it came first, or if the request failed,
+           e.g. on a connection the target dropped. A response is late once it
+           is slower than `hedge_percentile` of the recent GETs of the client,
+           and than `hedge_min_delay`. Hedging starts once 20 latencies are
+           known, and is skipped when the rate limits would delay the
+           duplicate. The counts of hedges sent and won are in
+           `client._api_client.hedger.counters`.
+        """
+        self.hedge_percentile = 95.0
+        """Percentile of the GET latencies after which a request is hedged.
+        """
+        self.hedge_min_delay = 0.1
+        """Minimum time, in seconds, before a request is hedged.
+        """
+
+        self.coalesce_window = 0
+        """Time, in seconds, a GET of objects by `names` or `ids` waits for
+           the GETs the client makes concurrently to the same endpoint, with
+           the same other parameters, to send them as a single request for
+           all of their names or ids. Each call still gets only the items it
+           asked for. Calls with `limit`, `offset`, `continuation_token` or
+           `total_only` are sent as is. 0 disables coalescing.
+           If the merged request fails, e.g. because one of the names does
+           not exist, each of its N calls is then sent on its own, N + 1
+           requests in the worst case, and the calls to the same endpoint
+           with the same other parameters are sent as is for 10 seconds.
+        """
+        self.coalesce_max_values = 100
+        """Maximum number of names or ids of a coalesced request.
+        """
+        self.coalesce_max_query_length = 4096
+        """Maximum length of the names or ids parameter of a coalesced
+           request, once URL encoded.
+        """
+
+        self.raw_items = False
+        """Leave the items of responses as decoded from the JSON body, i.e.
+           dicts, instead of deserializing them to models. Pagination and
+           the other fields of the responses are unchanged. It saves the
+           cost of building models which are only converted back to dicts.
+        """
+        self.lazy_items = False
+        """Leave the items of responses as decoded from the JSON body until
+           their fields are accessed, see
+           `pypureclient._transport.lazy_model.LazyModel`. Items have the
+           fields and `to_dict` of their models, whose nested models are
+           built only when first accessed, so listings cost little more than
+           decoding their bodies when few fields are read. Items are not
+           instances of their model classes. Ignored with `raw_items`.
+        """
+        self.compact_items = False
+        """Deserialize the items of responses to read-only records instead
+           of models, see `pypureclient._transport.compact_model.CompactModel`.
+           Records have the fields and `to_dict` of their models, held in
+           `__slots__`, and take a fraction of their memory, e.g. to cache
+           large inventories. Their lists are tuples, and they can't be
+           changed. Items are not instances of their model classes. Ignored
+           with `raw_items` or `lazy_items`.
+        """
+        self.stream_items = False
+        """Decode the items of list responses one at a time as the body is
+           read, for the calls made with `_preload_content=False`: the data
+           of their ApiResponse is a StreamedModel, and their raw_data None.
+           Peak memory is one item and one read chunk instead of the whole
+           body and every model. Otherwise `_preload_content=False` leaves
+           the body unread in raw_data. Blocking clients only.
+        """
+        self.default_fields = None
+        """Fields of the items of the responses to the GETs of the clients
+           which don't set `fields`, see `pypureclient.projection.Projection`.
+           The other fields are dropped from the decoded bodies, and left
+           unset on the models, as if the target had not sent them. Names
+           are dotted for the fields of nested objects, e.g.
+           'space.total_physical', or given as the Property of a model, e.g.
+           `flasharray.Volume.name`. Projected calls are not coalesced.
+        """
+
+        self.cassette = None
+        """Path of a cassette file the requests of the clients are recorded
+           to, or replayed from, see `cassette_mode`. A cassette holds the
+           responses, with their headers and timings, to be replayed without
+           a target, e.g. to profile the client offline. It is gzipped if
+           its path ends with `.gz`. Request headers and bodies, session
+           tokens and access token signatures are not recorded. Blocking
+           clients only.
+        """
+        self.cassette_mode = 'replay'
+        """'record' to send the requests and append their responses to the
+           cassette, 'replay' to answer them from the cassette instead.
+        """
+        self.cassette_latency = None
+        """Time, in seconds, a replayed response takes. None for the time it
+           took when recorded.
+        """
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         result = cls.__new__(cls)
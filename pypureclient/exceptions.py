@@ -9,3 +9,17 @@ class PureError(Exception):
 
     def __str__(self):
         return 'PureError: {}'.format(self.reason)
+
+
+class CircuitOpenError(PureError):
+    """
+    Exception type raised when a request is not sent because the target
+    failed too many requests in a row. The target is tried again once
+    `retry_after` seconds have passed.
+    """
+
+    def __init__(self, target, retry_after):
+        self.target = target
+        self.retry_after = retry_after
+        super(CircuitOpenError, self).__init__(
+            "The circuit to {} is open after repeated failures, retry in {:.1f}s".format(target, retry_after))
@@ -1,4 +1,3 @@
-import json
 import time
 import urllib3
 import uuid
@@ -16,11 +15,17 @@ except ModuleNotFoundError:
 from pypureclient.reference_type import ReferenceType
 from pypureclient.api_token_manager import APITokenManager
 from pypureclient.exceptions import PureError
+from pypureclient.hooks import call_endpoint, get_endpoint
 from pypureclient.keywords import Headers, Responses, Parameters
+from pypureclient.profiling import profiled
+from pypureclient.projection import ProjectedFunction, get_projection
 from pypureclient.properties import Property, Filter
 from pypureclient.responses import ValidResponse, ErrorResponse, ApiError, ItemIterator, ResponseHeaders
+from pypureclient.retry_policy import RetryPolicy, RETRY, REFRESH_AUTH, RETURN_ERROR
 from pypureclient.token_manager import TokenManager
+from pypureclient.tracing import traced
 
+from pypureclient._coalescing import coalesce_lookup
 from pypureclient._helpers import create_api_client
 
 from pypureclient._transport.api_client import ApiClient
@@ -46,7 +51,7 @@ class Client(object):
                  key_id: str = None,
                  issuer: str = None,
                  api_token: str = None,
-                 retries: int = None,
+                 retries: Union[int, RetryPolicy] = None,
                  timeout: Union[int, Tuple[float, float]] = None,
                  user_agent: str = None,
                  auto_pagination_limit: int = None):
@@ -86,8 +91,8 @@ class Client(object):
         :type api_token: str, optional
 
         :param retries: The number of times to retry an API call if it fails for a
-            non-blocking reason
-        :type retries: int, optional
+            non-blocking reason, or the RetryPolicy of the calls
+        :type retries: int or RetryPolicy, optional
 
         :param timeout: The timeout duration in seconds, either in total time or
             (connect and read) times. Defaults to None.
@@ -139,7 +144,7 @@ class Client(object):
         self._set_auth_header()
 
         # Read timeout and retries
-        self._retries = retries
+        self._retry_policy = RetryPolicy.from_retries(retries)
         self._timeout = timeout
 
         self.__auto_pagination_limit = auto_pagination_limit
@@ -284,6 +289,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         volume_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the volume specified. Enter multiple names in comma-separated format. For example, `vol01,vol02`. A request cannot include a mix of multiple objects with multiple names. For example, a request cannot include a mix of multiple volume names and host names; instead, at least one of the objects (e.g., `volume_names`) must be set to only one name (e.g., `vol01`).")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -360,6 +366,11 @@ class Client(object):
                             one of the objects (e.g., `volume_names`) must be set to only one name
                             (e.g., `vol01`).
         :type volume_names: List[str]
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -406,7 +417,7 @@ class Client(object):
         _process_references(protocol_endpoints, ['protocol_endpoint_names'], kwargs)
         _process_references(volumes, ['volume_names'], kwargs)
         _fixup_list_type_params(['host_group_names', 'host_names', 'protocol_endpoint_names', 'sort', 'volume_names'], kwargs)
-        return self._call_api('ConnectionsApi', 'api20_connections_get_with_http_info', kwargs)
+        return self._call_api('ConnectionsApi', 'api20_connections_get_with_http_info', kwargs, fields=fields)
 
     def post_connections(
         self,
@@ -573,6 +584,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -618,6 +630,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -658,7 +675,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api20_host_groups_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api20_host_groups_get_with_http_info', kwargs, fields=fields)
 
     def get_host_groups_hosts(
         self,
@@ -673,6 +690,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -725,6 +743,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -767,7 +790,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api20_host_groups_hosts_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api20_host_groups_hosts_get_with_http_info', kwargs, fields=fields)
 
     def patch_host_groups(
         self,
@@ -845,6 +868,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -895,6 +919,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -936,7 +965,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api20_host_groups_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api20_host_groups_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_host_groups_performance(
         self,
@@ -950,6 +979,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1000,6 +1030,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1041,7 +1076,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api20_host_groups_performance_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api20_host_groups_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_host_groups(
         self,
@@ -1174,6 +1209,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1219,6 +1255,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1259,7 +1300,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api20_hosts_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api20_hosts_get_with_http_info', kwargs, fields=fields)
 
     def get_hosts_host_groups(
         self,
@@ -1274,6 +1315,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1326,6 +1368,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1368,7 +1415,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api20_hosts_host_groups_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api20_hosts_host_groups_get_with_http_info', kwargs, fields=fields)
 
     def patch_hosts(
         self,
@@ -1446,6 +1493,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1496,6 +1544,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1537,7 +1590,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api20_hosts_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api20_hosts_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_hosts_performance(
         self,
@@ -1551,6 +1604,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1601,6 +1655,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1642,7 +1701,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api20_hosts_performance_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api20_hosts_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_hosts(
         self,
@@ -1791,6 +1850,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1857,6 +1917,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1903,7 +1968,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('VolumeSnapshotsApi', 'api20_volume_snapshots_get_with_http_info', kwargs)
+        return self._call_api('VolumeSnapshotsApi', 'api20_volume_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def patch_volume_snapshots(
         self,
@@ -2066,6 +2131,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2132,6 +2198,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2178,7 +2249,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('VolumeSnapshotsApi', 'api20_volume_snapshots_transfer_get_with_http_info', kwargs)
+        return self._call_api('VolumeSnapshotsApi', 'api20_volume_snapshots_transfer_get_with_http_info', kwargs, fields=fields)
 
     def delete_volumes(
         self,
@@ -2260,6 +2331,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2318,6 +2390,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2361,7 +2438,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api20_volumes_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api20_volumes_get_with_http_info', kwargs, fields=fields)
 
     def patch_volumes(
         self,
@@ -2462,6 +2539,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2562,6 +2640,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2608,7 +2691,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api20_volumes_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api20_volumes_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_volumes_performance(
         self,
@@ -2627,6 +2710,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2727,6 +2811,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2773,7 +2862,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api20_volumes_performance_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api20_volumes_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_volumes(
         self,
@@ -2863,6 +2952,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2963,6 +3053,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3009,7 +3104,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api20_volumes_space_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api20_volumes_space_get_with_http_info', kwargs, fields=fields)
 
     def _set_auth_header(self, refresh=False):
         """
@@ -3030,7 +3125,9 @@ class Client(object):
             self._api_client.set_default_header(Headers.x_auth_token,
                                                 self._token_man.get_session_token(refresh=refresh))
 
-    def _call_api(self, api_class_name, api_function_name, kwargs):
+    @traced
+    @profiled
+    def _call_api(self, api_class_name, api_function_name, kwargs, fields=None):
         """
         Call the API function and process the response. May call the API
         repeatedly if the request failed for a reason that may not persist in
@@ -3040,6 +3137,8 @@ class Client(object):
             api_class_name (str): Swagger-generated api class to call.
             api_function_name (str): Swagger-generated function to call.
             kwargs (dict): kwargs to pass to the function.
+            fields (list[str or Property]): The fields of the items to
+                deserialize, see `pypureclient.projection.Projection`.
 
         Returns:
             ValidResponse: If the call was successful.
@@ -3050,6 +3149,14 @@ class Client(object):
             ValueError: If a parameter is of an invalid type.
             TypeError: If invalid or missing parameters are used.
         """
+        projection = get_projection(fields, api_function_name, self._api_client.configuration)
+        # Concurrent lookups by names or ids may be sent as a single request,
+        # unless their items are projected
+        if projection is None:
+            response = coalesce_lookup(self, api_class_name, api_function_name, kwargs)
+            if response is not None:
+                return response
+
         kwargs['_request_timeout'] = self._timeout
         if Parameters.x_request_id in kwargs and not kwargs[Parameters.x_request_id]:
             kwargs[Parameters.x_request_id] = str(uuid.uuid4())
@@ -3061,44 +3168,40 @@ class Client(object):
 
         if kwargs.get('authorization') is not None:
             warnings.warn("authorization parameter is deprecated, and will be removed soon.", DeprecationWarning)
-        retries = self._retries
         original_auth_error = None
         api_function = getattr(self.__get_api_instance(api_class_name), api_function_name)
+        if projection is not None:
+            api_function = ProjectedFunction(api_function, projection)
+        retry = self._retry_policy.start(self._api_client.configuration.hooks, get_endpoint(api_function))
         while True:
             try:
-                response = api_function(**kwargs)
+                response = call_endpoint(api_function, kwargs)
                 # Call was successful (200)
                 return self._create_valid_response(response, api_function, _iterator_stop_on_limit, kwargs)
             except ApiException as error:
-                # If no chance for retries, return the error
-                if retries == 0:
-                    return self._create_error_response(original_auth_error or error)
-                # If bad request, forbidden, or not found, return the error (it will never work)
-                elif error.status in [400, 403, 404]:
-                    return self._create_error_response(error)
+                action, delay = retry.status_error_action(error.status, error.headers,
+                                                          auth_error_status=401,
+                                                          final_error_statuses=(400, 403, 404))
+                # If rate limit or server error the policy retries, wait and try again
+                if action == RETRY:
+                    time.sleep(delay)
                 # If authentication error, reset access token and retry once
-                elif error.status == 401:
+                elif action == REFRESH_AUTH:
                     original_auth_error = error
-                    retries = 1
                     self._set_auth_header(refresh=True)
-                # If rate limit error, wait the proper time and try again
-                elif error.status == 429:
-                    # If the the minute limit hit, wait that long
-                    if (int(error.headers.get(Headers.x_ratelimit_remaining_min))
-                            == int(error.headers.get(Headers.x_ratelimit_min))):
-                        time.sleep(60)
-                    # Otherwise it was the second limit and only wait a second
-                    time.sleep(1)
-                # If some internal server error we know nothing about, return
-                elif error.status == 500:
-                    return self._create_error_response(error)
-                # If internal server errors that has to do with timeouts, try again
-                elif error.status > 500:
-                    pass
+                # If the call will never work, or is out of retries, return the error
+                elif action == RETURN_ERROR:
+                    return self._create_error_response(original_auth_error or error)
                 # If error with the swagger client, raise the error
                 else:
                     raise PureError(error)
-            retries = retries - 1
+            except urllib3.exceptions.HTTPError as error:
+                # If the connection failed, wait and try again unless the
+                # request may have been processed already
+                delay = retry.connection_error_delay(error, idempotent=api_function_name.endswith('_get_with_http_info'))
+                if delay is None:
+                    raise
+                time.sleep(delay)
 
     def __get_api_instance(self, api_class):
         """
@@ -3143,7 +3246,8 @@ class Client(object):
                                       body.items,
                                       headers.get(Headers.x_request_id, None),
                                       more_items_remaining or False,
-                                      iterator_stop_on_limit))
+                                      iterator_stop_on_limit,
+                                      configuration=self._api_client.configuration))
         return ValidResponse(response.status_code, continuation_token, total_item_count,
                              items, headers, total, more_items_remaining, errors=errors)
 
@@ -3160,7 +3264,7 @@ class Client(object):
         """
         status = error.status
         try:
-            body = json.loads(error.body)
+            body = self._api_client.json_codec.loads(error.body)
         except Exception:
             errors = [ApiError(None, "Response is not a valid JSON")]
             return ErrorResponse(status, errors, headers=error.headers)
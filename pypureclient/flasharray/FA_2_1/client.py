@@ -1,4 +1,3 @@
-import json
 import time
 import urllib3
 import uuid
@@ -16,11 +15,17 @@ except ModuleNotFoundError:
 from pypureclient.reference_type import ReferenceType
 from pypureclient.api_token_manager import APITokenManager
 from pypureclient.exceptions import PureError
+from pypureclient.hooks import call_endpoint, get_endpoint
 from pypureclient.keywords import Headers, Responses, Parameters
+from pypureclient.profiling import profiled
+from pypureclient.projection import ProjectedFunction, get_projection
 from pypureclient.properties import Property, Filter
 from pypureclient.responses import ValidResponse, ErrorResponse, ApiError, ItemIterator, ResponseHeaders
+from pypureclient.retry_policy import RetryPolicy, RETRY, REFRESH_AUTH, RETURN_ERROR
 from pypureclient.token_manager import TokenManager
+from pypureclient.tracing import traced
 
+from pypureclient._coalescing import coalesce_lookup
 from pypureclient._helpers import create_api_client
 
 from pypureclient._transport.api_client import ApiClient
@@ -46,7 +51,7 @@ class Client(object):
                  key_id: str = None,
                  issuer: str = None,
                  api_token: str = None,
-                 retries: int = None,
+                 retries: Union[int, RetryPolicy] = None,
                  timeout: Union[int, Tuple[float, float]] = None,
                  user_agent: str = None,
                  auto_pagination_limit: int = None):
@@ -86,8 +91,8 @@ class Client(object):
         :type api_token: str, optional
 
         :param retries: The number of times to retry an API call if it fails for a
-            non-blocking reason
-        :type retries: int, optional
+            non-blocking reason, or the RetryPolicy of the calls
+        :type retries: int or RetryPolicy, optional
 
         :param timeout: The timeout duration in seconds, either in total time or
             (connect and read) times. Defaults to None.
@@ -139,7 +144,7 @@ class Client(object):
         self._set_auth_header()
 
         # Read timeout and retries
-        self._retries = retries
+        self._retry_policy = RetryPolicy.from_retries(retries)
         self._timeout = timeout
 
         self.__auto_pagination_limit = auto_pagination_limit
@@ -255,6 +260,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -304,6 +310,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -345,7 +356,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('APIClientsApi', 'api21_api_clients_get_with_http_info', kwargs)
+        return self._call_api('APIClientsApi', 'api21_api_clients_get_with_http_info', kwargs, fields=fields)
 
     def patch_api_clients(
         self,
@@ -589,6 +600,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         volume_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the volume specified. Enter multiple names in comma-separated format. For example, `vol01,vol02`. A request cannot include a mix of multiple objects with multiple names. For example, a request cannot include a mix of multiple volume names and host names; instead, at least one of the objects (e.g., `volume_names`) must be set to only one name (e.g., `vol01`).")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -672,6 +684,11 @@ class Client(object):
                             one of the objects (e.g., `volume_names`) must be set to only one name
                             (e.g., `vol01`).
         :type volume_names: List[str]
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -719,7 +736,7 @@ class Client(object):
         _process_references(protocol_endpoints, ['protocol_endpoint_names'], kwargs)
         _process_references(volumes, ['volume_names'], kwargs)
         _fixup_list_type_params(['host_group_names', 'host_names', 'protocol_endpoint_names', 'sort', 'volume_names'], kwargs)
-        return self._call_api('ConnectionsApi', 'api21_connections_get_with_http_info', kwargs)
+        return self._call_api('ConnectionsApi', 'api21_connections_get_with_http_info', kwargs, fields=fields)
 
     def post_connections(
         self,
@@ -887,6 +904,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -939,6 +957,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -980,7 +1003,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api21_host_groups_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api21_host_groups_get_with_http_info', kwargs, fields=fields)
 
     def delete_host_groups_hosts(
         self,
@@ -1067,6 +1090,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1126,6 +1150,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1169,7 +1198,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api21_host_groups_hosts_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api21_host_groups_hosts_get_with_http_info', kwargs, fields=fields)
 
     def post_host_groups_hosts(
         self,
@@ -1318,6 +1347,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1368,6 +1398,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1409,7 +1444,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api21_host_groups_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api21_host_groups_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_host_groups_performance(
         self,
@@ -1423,6 +1458,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1473,6 +1509,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1514,7 +1555,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api21_host_groups_performance_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api21_host_groups_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_host_groups(
         self,
@@ -1661,6 +1702,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1720,6 +1762,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1763,7 +1810,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api21_host_groups_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api21_host_groups_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_host_groups_protection_groups(
         self,
@@ -1847,6 +1894,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1892,6 +1940,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1932,7 +1985,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api21_host_groups_space_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api21_host_groups_space_get_with_http_info', kwargs, fields=fields)
 
     def delete_hosts(
         self,
@@ -2006,6 +2059,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2058,6 +2112,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2099,7 +2158,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api21_hosts_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api21_hosts_get_with_http_info', kwargs, fields=fields)
 
     def delete_hosts_host_groups(
         self,
@@ -2186,6 +2245,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2245,6 +2305,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2288,7 +2353,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api21_hosts_host_groups_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api21_hosts_host_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_hosts_host_groups(
         self,
@@ -2437,6 +2502,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2487,6 +2553,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2528,7 +2599,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api21_hosts_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api21_hosts_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_hosts_performance(
         self,
@@ -2542,6 +2613,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2592,6 +2664,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2633,7 +2710,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api21_hosts_performance_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api21_hosts_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_hosts(
         self,
@@ -2784,6 +2861,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2843,6 +2921,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2886,7 +2969,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api21_hosts_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api21_hosts_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_hosts_protection_groups(
         self,
@@ -2970,6 +3053,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3015,6 +3099,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3055,7 +3144,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api21_hosts_space_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api21_hosts_space_get_with_http_info', kwargs, fields=fields)
 
     def delete_offloads(
         self,
@@ -3130,6 +3219,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3182,6 +3272,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3224,7 +3319,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('OffloadsApi', 'api21_offloads_get_with_http_info', kwargs)
+        return self._call_api('OffloadsApi', 'api21_offloads_get_with_http_info', kwargs, fields=fields)
 
     def post_offloads(
         self,
@@ -3400,6 +3495,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3458,6 +3554,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3502,7 +3603,7 @@ class Client(object):
         _process_references(groups, ['group_ids', 'group_names'], kwargs)
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _fixup_list_type_params(['group_ids', 'group_names', 'member_ids', 'member_names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api21_pods_arrays_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api21_pods_arrays_get_with_http_info', kwargs, fields=fields)
 
     def post_pods_arrays(
         self,
@@ -3666,6 +3767,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3731,6 +3833,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3775,7 +3882,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api21_pods_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api21_pods_get_with_http_info', kwargs, fields=fields)
 
     def patch_pods(
         self,
@@ -3864,6 +3971,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3964,6 +4072,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -4010,7 +4123,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api21_pods_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api21_pods_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_pods_performance(
         self,
@@ -4029,6 +4142,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -4129,6 +4243,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -4175,7 +4294,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api21_pods_performance_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api21_pods_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_pods(
         self,
@@ -4258,6 +4377,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -4358,6 +4478,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -4404,7 +4529,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api21_pods_space_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api21_pods_space_get_with_http_info', kwargs, fields=fields)
 
     def delete_protection_group_snapshots(
         self,
@@ -4482,6 +4607,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -4548,6 +4674,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -4593,7 +4724,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(sources, ['source_names'], kwargs)
         _fixup_list_type_params(['names', 'sort', 'source_names'], kwargs)
-        return self._call_api('ProtectionGroupSnapshotsApi', 'api21_protection_group_snapshots_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupSnapshotsApi', 'api21_protection_group_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def patch_protection_group_snapshots(
         self,
@@ -4742,6 +4873,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -4801,6 +4933,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -4845,7 +4982,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(sources, ['source_names'], kwargs)
         _fixup_list_type_params(['names', 'sort', 'source_names'], kwargs)
-        return self._call_api('ProtectionGroupSnapshotsApi', 'api21_protection_group_snapshots_transfer_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupSnapshotsApi', 'api21_protection_group_snapshots_transfer_get_with_http_info', kwargs, fields=fields)
 
     def delete_protection_groups(
         self,
@@ -4921,6 +5058,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -4982,6 +5120,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5025,7 +5168,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def delete_protection_groups_host_groups(
         self,
@@ -5112,6 +5255,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5171,6 +5315,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5214,7 +5363,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_host_groups_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_host_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_protection_groups_host_groups(
         self,
@@ -5372,6 +5521,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5431,6 +5581,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5474,7 +5629,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_hosts_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_hosts_get_with_http_info', kwargs, fields=fields)
 
     def post_protection_groups_hosts(
         self,
@@ -5626,6 +5781,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5717,6 +5873,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5761,7 +5922,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_performance_replication_by_array_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_performance_replication_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_protection_groups_performance_replication(
         self,
@@ -5778,6 +5939,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5869,6 +6031,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5913,7 +6080,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_performance_replication_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_performance_replication_get_with_http_info', kwargs, fields=fields)
 
     def post_protection_groups(
         self,
@@ -6009,6 +6176,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -6058,6 +6226,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -6099,7 +6272,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_space_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_space_get_with_http_info', kwargs, fields=fields)
 
     def delete_protection_groups_targets(
         self,
@@ -6186,6 +6359,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -6245,6 +6419,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -6288,7 +6467,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_targets_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_targets_get_with_http_info', kwargs, fields=fields)
 
     def patch_protection_groups_targets(
         self,
@@ -6521,6 +6700,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -6580,6 +6760,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -6623,7 +6808,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_volumes_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api21_protection_groups_volumes_get_with_http_info', kwargs, fields=fields)
 
     def post_protection_groups_volumes(
         self,
@@ -6709,6 +6894,7 @@ class Client(object):
         on: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the target name specified. Enter multiple target names in comma-separated format. For example, `targetName01,targetName02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -6761,6 +6947,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -6803,7 +6994,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'on', 'sort'], kwargs)
-        return self._call_api('RemotePodsApi', 'api21_remote_pods_get_with_http_info', kwargs)
+        return self._call_api('RemotePodsApi', 'api21_remote_pods_get_with_http_info', kwargs, fields=fields)
 
     def delete_remote_protection_group_snapshots(
         self,
@@ -6885,6 +7076,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -6942,6 +7134,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -6986,7 +7183,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(sources, ['source_names'], kwargs)
         _fixup_list_type_params(['names', 'on', 'sort', 'source_names'], kwargs)
-        return self._call_api('RemoteProtectionGroupSnapshotsApi', 'api21_remote_protection_group_snapshots_get_with_http_info', kwargs)
+        return self._call_api('RemoteProtectionGroupSnapshotsApi', 'api21_remote_protection_group_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def patch_remote_protection_group_snapshots(
         self,
@@ -7073,6 +7270,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7135,6 +7333,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7180,7 +7383,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(sources, ['source_names'], kwargs)
         _fixup_list_type_params(['names', 'on', 'sort', 'source_names'], kwargs)
-        return self._call_api('RemoteProtectionGroupSnapshotsApi', 'api21_remote_protection_group_snapshots_transfer_get_with_http_info', kwargs)
+        return self._call_api('RemoteProtectionGroupSnapshotsApi', 'api21_remote_protection_group_snapshots_transfer_get_with_http_info', kwargs, fields=fields)
 
     def delete_remote_protection_groups(
         self,
@@ -7267,6 +7470,7 @@ class Client(object):
         on: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the target name specified. Enter multiple target names in comma-separated format. For example, `targetName01,targetName02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7323,6 +7527,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7366,7 +7575,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'on', 'sort'], kwargs)
-        return self._call_api('RemoteProtectionGroupsApi', 'api21_remote_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('RemoteProtectionGroupsApi', 'api21_remote_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def patch_remote_protection_groups(
         self,
@@ -7460,6 +7669,7 @@ class Client(object):
         source_ids: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source ID specified. Enter multiple source IDs in comma-separated format.")] = None,
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7524,6 +7734,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7570,7 +7785,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'on', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('RemoteVolumeSnapshotsApi', 'api21_remote_volume_snapshots_get_with_http_info', kwargs)
+        return self._call_api('RemoteVolumeSnapshotsApi', 'api21_remote_volume_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def get_remote_volume_snapshots_transfer(
         self,
@@ -7590,6 +7805,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7659,6 +7875,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7706,7 +7927,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'on', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('RemoteVolumeSnapshotsApi', 'api21_remote_volume_snapshots_transfer_get_with_http_info', kwargs)
+        return self._call_api('RemoteVolumeSnapshotsApi', 'api21_remote_volume_snapshots_transfer_get_with_http_info', kwargs, fields=fields)
 
     def delete_volume_groups(
         self,
@@ -7789,6 +8010,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7854,6 +8076,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7898,7 +8125,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumeGroupsApi', 'api21_volume_groups_get_with_http_info', kwargs)
+        return self._call_api('VolumeGroupsApi', 'api21_volume_groups_get_with_http_info', kwargs, fields=fields)
 
     def patch_volume_groups(
         self,
@@ -7987,6 +8214,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8087,6 +8315,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -8133,7 +8366,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumeGroupsApi', 'api21_volume_groups_performance_get_with_http_info', kwargs)
+        return self._call_api('VolumeGroupsApi', 'api21_volume_groups_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_volume_groups(
         self,
@@ -8216,6 +8449,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8316,6 +8550,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -8362,7 +8601,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumeGroupsApi', 'api21_volume_groups_space_get_with_http_info', kwargs)
+        return self._call_api('VolumeGroupsApi', 'api21_volume_groups_space_get_with_http_info', kwargs, fields=fields)
 
     def get_volume_groups_volumes(
         self,
@@ -8380,6 +8619,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8445,6 +8685,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -8490,7 +8735,7 @@ class Client(object):
         _process_references(groups, ['group_ids', 'group_names'], kwargs)
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _fixup_list_type_params(['group_ids', 'group_names', 'member_ids', 'member_names', 'sort'], kwargs)
-        return self._call_api('VolumeGroupsApi', 'api21_volume_groups_volumes_get_with_http_info', kwargs)
+        return self._call_api('VolumeGroupsApi', 'api21_volume_groups_volumes_get_with_http_info', kwargs, fields=fields)
 
     def delete_volume_snapshots(
         self,
@@ -8576,6 +8821,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8649,6 +8895,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -8696,7 +8947,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('VolumeSnapshotsApi', 'api21_volume_snapshots_get_with_http_info', kwargs)
+        return self._call_api('VolumeSnapshotsApi', 'api21_volume_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def patch_volume_snapshots(
         self,
@@ -8859,6 +9110,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8925,6 +9177,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -8971,7 +9228,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('VolumeSnapshotsApi', 'api21_volume_snapshots_transfer_get_with_http_info', kwargs)
+        return self._call_api('VolumeSnapshotsApi', 'api21_volume_snapshots_transfer_get_with_http_info', kwargs, fields=fields)
 
     def delete_volumes(
         self,
@@ -9054,6 +9311,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -9119,6 +9377,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -9163,7 +9426,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api21_volumes_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api21_volumes_get_with_http_info', kwargs, fields=fields)
 
     def patch_volumes(
         self,
@@ -9264,6 +9527,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -9364,6 +9628,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -9410,7 +9679,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api21_volumes_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api21_volumes_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_volumes_performance(
         self,
@@ -9429,6 +9698,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -9529,6 +9799,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -9575,7 +9850,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api21_volumes_performance_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api21_volumes_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_volumes(
         self,
@@ -9733,6 +10008,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -9792,6 +10068,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -9835,7 +10116,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api21_volumes_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api21_volumes_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_volumes_protection_groups(
         self,
@@ -9925,6 +10206,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -10025,6 +10307,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -10071,7 +10358,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api21_volumes_space_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api21_volumes_space_get_with_http_info', kwargs, fields=fields)
 
     def get_volumes_volume_groups(
         self,
@@ -10089,6 +10376,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -10154,6 +10442,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -10199,7 +10492,7 @@ class Client(object):
         _process_references(groups, ['group_ids', 'group_names'], kwargs)
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _fixup_list_type_params(['group_ids', 'group_names', 'member_ids', 'member_names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api21_volumes_volume_groups_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api21_volumes_volume_groups_get_with_http_info', kwargs, fields=fields)
 
     def _set_auth_header(self, refresh=False):
         """
@@ -10220,7 +10513,9 @@ class Client(object):
             self._api_client.set_default_header(Headers.x_auth_token,
                                                 self._token_man.get_session_token(refresh=refresh))
 
-    def _call_api(self, api_class_name, api_function_name, kwargs):
+    @traced
+    @profiled
+    def _call_api(self, api_class_name, api_function_name, kwargs, fields=None):
         """
         Call the API function and process the response. May call the API
         repeatedly if the request failed for a reason that may not persist in
@@ -10230,6 +10525,8 @@ class Client(object):
             api_class_name (str): Swagger-generated api class to call.
             api_function_name (str): Swagger-generated function to call.
             kwargs (dict): kwargs to pass to the function.
+            fields (list[str or Property]): The fields of the items to
+                deserialize, see `pypureclient.projection.Projection`.
 
         Returns:
             ValidResponse: If the call was successful.
@@ -10240,6 +10537,14 @@ class Client(object):
             ValueError: If a parameter is of an invalid type.
             TypeError: If invalid or missing parameters are used.
         """
+        projection = get_projection(fields, api_function_name, self._api_client.configuration)
+        # Concurrent lookups by names or ids may be sent as a single request,
+        # unless their items are projected
+        if projection is None:
+            response = coalesce_lookup(self, api_class_name, api_function_name, kwargs)
+            if response is not None:
+                return response
+
         kwargs['_request_timeout'] = self._timeout
         if Parameters.x_request_id in kwargs and not kwargs[Parameters.x_request_id]:
             kwargs[Parameters.x_request_id] = str(uuid.uuid4())
@@ -10251,44 +10556,40 @@ class Client(object):
 
         if kwargs.get('authorization') is not None:
             warnings.warn("authorization parameter is deprecated, and will be removed soon.", DeprecationWarning)
-        retries = self._retries
         original_auth_error = None
         api_function = getattr(self.__get_api_instance(api_class_name), api_function_name)
+        if projection is not None:
+            api_function = ProjectedFunction(api_function, projection)
+        retry = self._retry_policy.start(self._api_client.configuration.hooks, get_endpoint(api_function))
         while True:
             try:
-                response = api_function(**kwargs)
+                response = call_endpoint(api_function, kwargs)
                 # Call was successful (200)
                 return self._create_valid_response(response, api_function, _iterator_stop_on_limit, kwargs)
             except ApiException as error:
-                # If no chance for retries, return the error
-                if retries == 0:
-                    return self._create_error_response(original_auth_error or error)
-                # If bad request, forbidden, or not found, return the error (it will never work)
-                elif error.status in [400, 403, 404]:
-                    return self._create_error_response(error)
+                action, delay = retry.status_error_action(error.status, error.headers,
+                                                          auth_error_status=401,
+                                                          final_error_statuses=(400, 403, 404))
+                # If rate limit or server error the policy retries, wait and try again
+                if action == RETRY:
+                    time.sleep(delay)
                 # If authentication error, reset access token and retry once
-                elif error.status == 401:
+                elif action == REFRESH_AUTH:
                     original_auth_error = error
-                    retries = 1
                     self._set_auth_header(refresh=True)
-                # If rate limit error, wait the proper time and try again
-                elif error.status == 429:
-                    # If the the minute limit hit, wait that long
-                    if (int(error.headers.get(Headers.x_ratelimit_remaining_min))
-                            == int(error.headers.get(Headers.x_ratelimit_min))):
-                        time.sleep(60)
-                    # Otherwise it was the second limit and only wait a second
-                    time.sleep(1)
-                # If some internal server error we know nothing about, return
-                elif error.status == 500:
-                    return self._create_error_response(error)
-                # If internal server errors that has to do with timeouts, try again
-                elif error.status > 500:
-                    pass
+                # If the call will never work, or is out of retries, return the error
+                elif action == RETURN_ERROR:
+                    return self._create_error_response(original_auth_error or error)
                 # If error with the swagger client, raise the error
                 else:
                     raise PureError(error)
-            retries = retries - 1
+            except urllib3.exceptions.HTTPError as error:
+                # If the connection failed, wait and try again unless the
+                # request may have been processed already
+                delay = retry.connection_error_delay(error, idempotent=api_function_name.endswith('_get_with_http_info'))
+                if delay is None:
+                    raise
+                time.sleep(delay)
 
     def __get_api_instance(self, api_class):
         """
@@ -10333,7 +10634,8 @@ class Client(object):
                                       body.items,
                                       headers.get(Headers.x_request_id, None),
                                       more_items_remaining or False,
-                                      iterator_stop_on_limit))
+                                      iterator_stop_on_limit,
+                                      configuration=self._api_client.configuration))
         return ValidResponse(response.status_code, continuation_token, total_item_count,
                              items, headers, total, more_items_remaining, errors=errors)
 
@@ -10350,7 +10652,7 @@ class Client(object):
         """
         status = error.status
         try:
-            body = json.loads(error.body)
+            body = self._api_client.json_codec.loads(error.body)
         except Exception:
             errors = [ApiError(None, "Response is not a valid JSON")]
             return ErrorResponse(status, errors, headers=error.headers)
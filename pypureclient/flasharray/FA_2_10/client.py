@@ -1,4 +1,3 @@
-import json
 import time
 import urllib3
 import uuid
@@ -16,11 +15,17 @@ except ModuleNotFoundError:
 from pypureclient.reference_type import ReferenceType
 from pypureclient.api_token_manager import APITokenManager
 from pypureclient.exceptions import PureError
+from pypureclient.hooks import call_endpoint, get_endpoint
 from pypureclient.keywords import Headers, Responses, Parameters
+from pypureclient.profiling import profiled
+from pypureclient.projection import ProjectedFunction, get_projection
 from pypureclient.properties import Property, Filter
 from pypureclient.responses import ValidResponse, ErrorResponse, ApiError, ItemIterator, ResponseHeaders
+from pypureclient.retry_policy import RetryPolicy, RETRY, REFRESH_AUTH, RETURN_ERROR
 from pypureclient.token_manager import TokenManager
+from pypureclient.tracing import traced
 
+from pypureclient._coalescing import coalesce_lookup
 from pypureclient._helpers import create_api_client
 
 from pypureclient._transport.api_client import ApiClient
@@ -46,7 +51,7 @@ class Client(object):
                  key_id: str = None,
                  issuer: str = None,
                  api_token: str = None,
-                 retries: int = None,
+                 retries: Union[int, RetryPolicy] = None,
                  timeout: Union[int, Tuple[float, float]] = None,
                  user_agent: str = None,
                  auto_pagination_limit: int = None):
@@ -86,8 +91,8 @@ class Client(object):
         :type api_token: str, optional
 
         :param retries: The number of times to retry an API call if it fails for a
-            non-blocking reason
-        :type retries: int, optional
+            non-blocking reason, or the RetryPolicy of the calls
+        :type retries: int or RetryPolicy, optional
 
         :param timeout: The timeout duration in seconds, either in total time or
             (connect and read) times. Defaults to None.
@@ -139,7 +144,7 @@ class Client(object):
         self._set_auth_header()
 
         # Read timeout and retries
-        self._retries = retries
+        self._retry_policy = RetryPolicy.from_retries(retries)
         self._timeout = timeout
 
         self.__auto_pagination_limit = auto_pagination_limit
@@ -255,6 +260,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -304,6 +310,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -345,7 +356,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('APIClientsApi', 'api210_api_clients_get_with_http_info', kwargs)
+        return self._call_api('APIClientsApi', 'api210_api_clients_get_with_http_info', kwargs, fields=fields)
 
     def patch_api_clients(
         self,
@@ -559,6 +570,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -611,6 +623,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -652,7 +669,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ActiveDirectoryApi', 'api210_active_directory_get_with_http_info', kwargs)
+        return self._call_api('ActiveDirectoryApi', 'api210_active_directory_get_with_http_info', kwargs, fields=fields)
 
     def post_active_directory(
         self,
@@ -791,6 +808,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -845,6 +863,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -887,7 +910,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('AdministratorsApi', 'api210_admins_api_tokens_get_with_http_info', kwargs)
+        return self._call_api('AdministratorsApi', 'api210_admins_api_tokens_get_with_http_info', kwargs, fields=fields)
 
     def post_admins_api_tokens(
         self,
@@ -1020,6 +1043,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1072,6 +1096,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1113,7 +1142,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('AdministratorsApi', 'api210_admins_cache_get_with_http_info', kwargs)
+        return self._call_api('AdministratorsApi', 'api210_admins_cache_get_with_http_info', kwargs, fields=fields)
 
     def put_admins_cache(
         self,
@@ -1248,6 +1277,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1302,6 +1332,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1344,7 +1379,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('AdministratorsApi', 'api210_admins_get_with_http_info', kwargs)
+        return self._call_api('AdministratorsApi', 'api210_admins_get_with_http_info', kwargs, fields=fields)
 
     def patch_admins(
         self,
@@ -1483,6 +1518,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1523,6 +1559,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1561,7 +1602,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('AdministratorsApi', 'api210_admins_settings_get_with_http_info', kwargs)
+        return self._call_api('AdministratorsApi', 'api210_admins_settings_get_with_http_info', kwargs, fields=fields)
 
     def patch_admins_settings(
         self,
@@ -1690,6 +1731,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1742,6 +1784,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -1783,7 +1830,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('AlertWatchersApi', 'api210_alert_watchers_get_with_http_info', kwargs)
+        return self._call_api('AlertWatchersApi', 'api210_alert_watchers_get_with_http_info', kwargs, fields=fields)
 
     def patch_alert_watchers(
         self,
@@ -1924,6 +1971,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -1969,6 +2017,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2009,7 +2062,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('AlertWatchersApi', 'api210_alert_watchers_test_get_with_http_info', kwargs)
+        return self._call_api('AlertWatchersApi', 'api210_alert_watchers_test_get_with_http_info', kwargs, fields=fields)
 
     def get_alerts_events(
         self,
@@ -2025,6 +2078,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2085,6 +2139,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2128,7 +2187,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('AlertsApi', 'api210_alerts_events_get_with_http_info', kwargs)
+        return self._call_api('AlertsApi', 'api210_alerts_events_get_with_http_info', kwargs, fields=fields)
 
     def get_alerts(
         self,
@@ -2144,6 +2203,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2203,6 +2263,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2246,7 +2311,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('AlertsApi', 'api210_alerts_get_with_http_info', kwargs)
+        return self._call_api('AlertsApi', 'api210_alerts_get_with_http_info', kwargs, fields=fields)
 
     def patch_alerts(
         self,
@@ -2330,6 +2395,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2382,6 +2448,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2423,7 +2494,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('AppsApi', 'api210_apps_get_with_http_info', kwargs)
+        return self._call_api('AppsApi', 'api210_apps_get_with_http_info', kwargs, fields=fields)
 
     def get_apps_nodes(
         self,
@@ -2437,6 +2508,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2488,6 +2560,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2529,7 +2606,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(apps, ['app_names'], kwargs)
         _fixup_list_type_params(['app_names', 'sort'], kwargs)
-        return self._call_api('AppsApi', 'api210_apps_nodes_get_with_http_info', kwargs)
+        return self._call_api('AppsApi', 'api210_apps_nodes_get_with_http_info', kwargs, fields=fields)
 
     def patch_apps(
         self,
@@ -2599,6 +2676,7 @@ class Client(object):
         self,
         authorization: Annotated[Optional[StrictStr], Field(description="Access token (in JWT format) required to use any API endpoint (except `/oauth2`, `/login`, and `/logout`)")] = None,
         x_request_id: Annotated[Optional[StrictStr], Field(description="Supplied by client during request or generated by server.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2611,6 +2689,11 @@ class Client(object):
         :type authorization: str
         :param x_request_id: Supplied by client during request or generated by server.
         :type x_request_id: str
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2644,7 +2727,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params([], kwargs)
-        return self._call_api('ArrayConnectionsApi', 'api210_array_connections_connection_key_get_with_http_info', kwargs)
+        return self._call_api('ArrayConnectionsApi', 'api210_array_connections_connection_key_get_with_http_info', kwargs, fields=fields)
 
     def delete_array_connections(
         self,
@@ -2718,6 +2801,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2770,6 +2854,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2811,7 +2900,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ArrayConnectionsApi', 'api210_array_connections_get_with_http_info', kwargs)
+        return self._call_api('ArrayConnectionsApi', 'api210_array_connections_get_with_http_info', kwargs, fields=fields)
 
     def patch_array_connections(
         self,
@@ -2889,6 +2978,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -2941,6 +3031,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -2982,7 +3077,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ArrayConnectionsApi', 'api210_array_connections_path_get_with_http_info', kwargs)
+        return self._call_api('ArrayConnectionsApi', 'api210_array_connections_path_get_with_http_info', kwargs, fields=fields)
 
     def post_array_connections(
         self,
@@ -3159,6 +3254,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3206,6 +3302,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3245,7 +3346,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('ArraysApi', 'api210_arrays_cloud_provider_tags_get_with_http_info', kwargs)
+        return self._call_api('ArraysApi', 'api210_arrays_cloud_provider_tags_get_with_http_info', kwargs, fields=fields)
 
     def delete_arrays(
         self,
@@ -3315,6 +3416,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3355,6 +3457,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3393,7 +3500,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('ArraysApi', 'api210_arrays_eula_get_with_http_info', kwargs)
+        return self._call_api('ArraysApi', 'api210_arrays_eula_get_with_http_info', kwargs, fields=fields)
 
     def patch_arrays_eula(
         self,
@@ -3510,6 +3617,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3550,6 +3658,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3588,7 +3701,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('ArraysApi', 'api210_arrays_factory_reset_token_get_with_http_info', kwargs)
+        return self._call_api('ArraysApi', 'api210_arrays_factory_reset_token_get_with_http_info', kwargs, fields=fields)
 
     def post_arrays_factory_reset_token(
         self,
@@ -3650,6 +3763,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3690,6 +3804,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3728,12 +3847,13 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('ArraysApi', 'api210_arrays_get_with_http_info', kwargs)
+        return self._call_api('ArraysApi', 'api210_arrays_get_with_http_info', kwargs, fields=fields)
 
     def get_arrays_ntp_test(
         self,
         authorization: Annotated[Optional[StrictStr], Field(description="Access token (in JWT format) required to use any API endpoint (except `/oauth2`, `/login`, and `/logout`)")] = None,
         x_request_id: Annotated[Optional[StrictStr], Field(description="Supplied by client during request or generated by server.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3746,6 +3866,11 @@ class Client(object):
         :type authorization: str
         :param x_request_id: Supplied by client during request or generated by server.
         :type x_request_id: str
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3779,7 +3904,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params([], kwargs)
-        return self._call_api('ArraysApi', 'api210_arrays_ntp_test_get_with_http_info', kwargs)
+        return self._call_api('ArraysApi', 'api210_arrays_ntp_test_get_with_http_info', kwargs, fields=fields)
 
     def patch_arrays(
         self,
@@ -3850,6 +3975,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -3936,6 +4062,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -3979,7 +4110,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('ArraysApi', 'api210_arrays_performance_get_with_http_info', kwargs)
+        return self._call_api('ArraysApi', 'api210_arrays_performance_get_with_http_info', kwargs, fields=fields)
 
     def get_arrays_space(
         self,
@@ -3993,6 +4124,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -4075,6 +4207,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -4116,7 +4253,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('ArraysApi', 'api210_arrays_space_get_with_http_info', kwargs)
+        return self._call_api('ArraysApi', 'api210_arrays_space_get_with_http_info', kwargs, fields=fields)
 
     def get_audits(
         self,
@@ -4131,6 +4268,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -4187,6 +4325,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -4229,7 +4372,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('AuditsApi', 'api210_audits_get_with_http_info', kwargs)
+        return self._call_api('AuditsApi', 'api210_audits_get_with_http_info', kwargs, fields=fields)
 
     def post_certificates_certificate_signing_requests(
         self,
@@ -4358,6 +4501,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -4410,6 +4554,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -4451,7 +4600,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('CertificatesApi', 'api210_certificates_get_with_http_info', kwargs)
+        return self._call_api('CertificatesApi', 'api210_certificates_get_with_http_info', kwargs, fields=fields)
 
     def patch_certificates(
         self,
@@ -4709,6 +4858,7 @@ class Client(object):
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         volume_ids: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the specified volume. Enter multiple ids in comma-separated format. For example, `vol01id,vol02id`. A request cannot include a mix of multiple objects with multiple IDs. For example, a request cannot include a mix of multiple volume IDs and host names; instead, at least one of the objects (e.g., `volume_ids`) must be set to only one name (e.g., `vol01id`). Only one of the two between `volume_names` and `volume_ids` may be used at a time.")] = None,
         volume_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the volume specified. Enter multiple names in comma-separated format. For example, `vol01,vol02`. A request cannot include a mix of multiple objects with multiple names. For example, a request cannot include a mix of multiple volume names and host names; instead, at least one of the objects (e.g., `volume_names`) must be set to only one name (e.g., `vol01`).")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -4807,6 +4957,11 @@ class Client(object):
                             one of the objects (e.g., `volume_names`) must be set to only one name
                             (e.g., `vol01`).
         :type volume_names: List[str]
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -4856,7 +5011,7 @@ class Client(object):
         _process_references(protocol_endpoints, ['protocol_endpoint_ids', 'protocol_endpoint_names'], kwargs)
         _process_references(volumes, ['volume_ids', 'volume_names'], kwargs)
         _fixup_list_type_params(['host_group_names', 'host_names', 'protocol_endpoint_ids', 'protocol_endpoint_names', 'sort', 'volume_ids', 'volume_names'], kwargs)
-        return self._call_api('ConnectionsApi', 'api210_connections_get_with_http_info', kwargs)
+        return self._call_api('ConnectionsApi', 'api210_connections_get_with_http_info', kwargs, fields=fields)
 
     def post_connections(
         self,
@@ -4974,6 +5129,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5026,6 +5182,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5067,7 +5228,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ControllersApi', 'api210_controllers_get_with_http_info', kwargs)
+        return self._call_api('ControllersApi', 'api210_controllers_get_with_http_info', kwargs, fields=fields)
 
     def get_dns(
         self,
@@ -5078,6 +5239,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5118,6 +5280,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5156,7 +5323,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('DNSApi', 'api210_dns_get_with_http_info', kwargs)
+        return self._call_api('DNSApi', 'api210_dns_get_with_http_info', kwargs, fields=fields)
 
     def patch_dns(
         self,
@@ -5297,6 +5464,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5373,6 +5541,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5420,7 +5593,7 @@ class Client(object):
         _process_references(file_systems, ['file_system_ids', 'file_system_names'], kwargs)
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['file_system_ids', 'file_system_names', 'ids', 'names', 'sort'], kwargs)
-        return self._call_api('DirectoriesApi', 'api210_directories_get_with_http_info', kwargs)
+        return self._call_api('DirectoriesApi', 'api210_directories_get_with_http_info', kwargs, fields=fields)
 
     def patch_directories(
         self,
@@ -5511,6 +5684,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5615,6 +5789,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5663,7 +5842,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('DirectoriesApi', 'api210_directories_performance_get_with_http_info', kwargs)
+        return self._call_api('DirectoriesApi', 'api210_directories_performance_get_with_http_info', kwargs, fields=fields)
 
     def get_directories_policies(
         self,
@@ -5682,6 +5861,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5752,6 +5932,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -5798,7 +5983,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('DirectoriesApi', 'api210_directories_policies_get_with_http_info', kwargs)
+        return self._call_api('DirectoriesApi', 'api210_directories_policies_get_with_http_info', kwargs, fields=fields)
 
     def delete_directories_policies_nfs(
         self,
@@ -5899,6 +6084,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -5969,6 +6155,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -6015,7 +6206,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('DirectoriesApi', 'api210_directories_policies_nfs_get_with_http_info', kwargs)
+        return self._call_api('DirectoriesApi', 'api210_directories_policies_nfs_get_with_http_info', kwargs, fields=fields)
 
     def post_directories_policies_nfs(
         self,
@@ -6187,6 +6378,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -6257,6 +6449,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -6303,7 +6500,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('DirectoriesApi', 'api210_directories_policies_quota_get_with_http_info', kwargs)
+        return self._call_api('DirectoriesApi', 'api210_directories_policies_quota_get_with_http_info', kwargs, fields=fields)
 
     def post_directories_policies_quota(
         self,
@@ -6484,6 +6681,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -6554,6 +6752,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -6600,7 +6803,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('DirectoriesApi', 'api210_directories_policies_smb_get_with_http_info', kwargs)
+        return self._call_api('DirectoriesApi', 'api210_directories_policies_smb_get_with_http_info', kwargs, fields=fields)
 
     def post_directories_policies_smb(
         self,
@@ -6772,6 +6975,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -6842,6 +7046,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -6888,7 +7097,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('DirectoriesApi', 'api210_directories_policies_snapshot_get_with_http_info', kwargs)
+        return self._call_api('DirectoriesApi', 'api210_directories_policies_snapshot_get_with_http_info', kwargs, fields=fields)
 
     def post_directories_policies_snapshot(
         self,
@@ -7059,6 +7268,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7159,6 +7369,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7205,7 +7420,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('DirectoriesApi', 'api210_directories_space_get_with_http_info', kwargs)
+        return self._call_api('DirectoriesApi', 'api210_directories_space_get_with_http_info', kwargs, fields=fields)
 
     def delete_directory_exports(
         self,
@@ -7301,6 +7516,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7377,6 +7593,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7425,7 +7646,7 @@ class Client(object):
         _process_references(exports, ['export_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['directory_ids', 'directory_names', 'export_names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('DirectoryExportsApi', 'api210_directory_exports_get_with_http_info', kwargs)
+        return self._call_api('DirectoryExportsApi', 'api210_directory_exports_get_with_http_info', kwargs, fields=fields)
 
     def post_directory_exports(
         self,
@@ -7530,6 +7751,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7597,6 +7819,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7642,7 +7869,7 @@ class Client(object):
         _process_references(directories, ['directory_ids', 'directory_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['directory_ids', 'directory_names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('DirectoryQuotasApi', 'api210_directory_quotas_get_with_http_info', kwargs)
+        return self._call_api('DirectoryQuotasApi', 'api210_directory_quotas_get_with_http_info', kwargs, fields=fields)
 
     def get_directory_services(
         self,
@@ -7656,6 +7883,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7708,6 +7936,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7749,7 +7982,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('DirectoryServicesApi', 'api210_directory_services_get_with_http_info', kwargs)
+        return self._call_api('DirectoryServicesApi', 'api210_directory_services_get_with_http_info', kwargs, fields=fields)
 
     def patch_directory_services(
         self,
@@ -7827,6 +8060,7 @@ class Client(object):
         role_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the unique roles specified. For example, `array_admin`. Enter multiple roles in comma-separated format.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -7879,6 +8113,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -7920,7 +8159,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(roles, ['role_names'], kwargs)
         _fixup_list_type_params(['role_names', 'sort'], kwargs)
-        return self._call_api('DirectoryServicesApi', 'api210_directory_services_roles_get_with_http_info', kwargs)
+        return self._call_api('DirectoryServicesApi', 'api210_directory_services_roles_get_with_http_info', kwargs, fields=fields)
 
     def patch_directory_services_roles(
         self,
@@ -7998,6 +8237,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8050,6 +8290,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -8091,7 +8336,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('DirectoryServicesApi', 'api210_directory_services_test_get_with_http_info', kwargs)
+        return self._call_api('DirectoryServicesApi', 'api210_directory_services_test_get_with_http_info', kwargs, fields=fields)
 
     def delete_directory_snapshots(
         self,
@@ -8177,6 +8422,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8250,6 +8496,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -8297,7 +8548,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('DirectorySnapshotsApi', 'api210_directory_snapshots_get_with_http_info', kwargs)
+        return self._call_api('DirectorySnapshotsApi', 'api210_directory_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def patch_directory_snapshots(
         self,
@@ -8450,6 +8701,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8502,6 +8754,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -8543,7 +8800,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('DrivesApi', 'api210_drives_get_with_http_info', kwargs)
+        return self._call_api('DrivesApi', 'api210_drives_get_with_http_info', kwargs, fields=fields)
 
     def patch_drives(
         self,
@@ -8680,6 +8937,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8740,6 +8998,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -8783,7 +9046,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('FileSystemsApi', 'api210_file_systems_get_with_http_info', kwargs)
+        return self._call_api('FileSystemsApi', 'api210_file_systems_get_with_http_info', kwargs, fields=fields)
 
     def patch_file_systems(
         self,
@@ -8926,6 +9189,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -8971,6 +9235,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -9011,7 +9280,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HardwareApi', 'api210_hardware_get_with_http_info', kwargs)
+        return self._call_api('HardwareApi', 'api210_hardware_get_with_http_info', kwargs, fields=fields)
 
     def patch_hardware(
         self,
@@ -9149,6 +9418,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -9201,6 +9471,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -9242,7 +9517,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api210_host_groups_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api210_host_groups_get_with_http_info', kwargs, fields=fields)
 
     def delete_host_groups_hosts(
         self,
@@ -9329,6 +9604,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -9388,6 +9664,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -9431,7 +9712,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api210_host_groups_hosts_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api210_host_groups_hosts_get_with_http_info', kwargs, fields=fields)
 
     def post_host_groups_hosts(
         self,
@@ -9580,6 +9861,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -9630,6 +9912,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -9671,7 +9958,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api210_host_groups_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api210_host_groups_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_host_groups_performance(
         self,
@@ -9685,6 +9972,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -9735,6 +10023,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -9776,7 +10069,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api210_host_groups_performance_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api210_host_groups_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_host_groups(
         self,
@@ -9923,6 +10216,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -9982,6 +10276,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -10025,7 +10324,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api210_host_groups_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api210_host_groups_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_host_groups_protection_groups(
         self,
@@ -10109,6 +10408,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -10154,6 +10454,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -10194,7 +10499,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostGroupsApi', 'api210_host_groups_space_get_with_http_info', kwargs)
+        return self._call_api('HostGroupsApi', 'api210_host_groups_space_get_with_http_info', kwargs, fields=fields)
 
     def delete_hosts(
         self,
@@ -10268,6 +10573,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -10320,6 +10626,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -10361,7 +10672,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api210_hosts_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api210_hosts_get_with_http_info', kwargs, fields=fields)
 
     def delete_hosts_host_groups(
         self,
@@ -10448,6 +10759,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -10507,6 +10819,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -10550,7 +10867,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api210_hosts_host_groups_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api210_hosts_host_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_hosts_host_groups(
         self,
@@ -10698,6 +11015,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -10743,6 +11061,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -10783,7 +11106,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api210_hosts_performance_balance_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api210_hosts_performance_balance_get_with_http_info', kwargs, fields=fields)
 
     def get_hosts_performance_by_array(
         self,
@@ -10797,6 +11120,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -10847,6 +11171,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -10888,7 +11217,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api210_hosts_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api210_hosts_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_hosts_performance(
         self,
@@ -10902,6 +11231,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -10952,6 +11282,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -10993,7 +11328,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api210_hosts_performance_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api210_hosts_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_hosts(
         self,
@@ -11144,6 +11479,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -11203,6 +11539,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -11246,7 +11587,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api210_hosts_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api210_hosts_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_hosts_protection_groups(
         self,
@@ -11330,6 +11671,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -11375,6 +11717,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -11415,7 +11762,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('HostsApi', 'api210_hosts_space_get_with_http_info', kwargs)
+        return self._call_api('HostsApi', 'api210_hosts_space_get_with_http_info', kwargs, fields=fields)
 
     def delete_kmip(
         self,
@@ -11489,6 +11836,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -11541,6 +11889,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -11582,7 +11935,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('KMIPApi', 'api210_kmip_get_with_http_info', kwargs)
+        return self._call_api('KMIPApi', 'api210_kmip_get_with_http_info', kwargs, fields=fields)
 
     def patch_kmip(
         self,
@@ -11718,6 +12071,7 @@ class Client(object):
         references: Optional[Union[ReferenceType, List[ReferenceType]]] = None,
         authorization: Annotated[Optional[StrictStr], Field(description="Access token (in JWT format) required to use any API endpoint (except `/oauth2`, `/login`, and `/logout`)")] = None,
         x_request_id: Annotated[Optional[StrictStr], Field(description="Supplied by client during request or generated by server.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -11735,6 +12089,11 @@ class Client(object):
         :type authorization: str
         :param x_request_id: Supplied by client during request or generated by server.
         :type x_request_id: str
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -11770,7 +12129,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names'], kwargs)
-        return self._call_api('KMIPApi', 'api210_kmip_test_get_with_http_info', kwargs)
+        return self._call_api('KMIPApi', 'api210_kmip_test_get_with_http_info', kwargs, fields=fields)
 
     def delete_maintenance_windows(
         self,
@@ -11844,6 +12203,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -11896,6 +12256,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -11937,7 +12302,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('MaintenanceWindowsApi', 'api210_maintenance_windows_get_with_http_info', kwargs)
+        return self._call_api('MaintenanceWindowsApi', 'api210_maintenance_windows_get_with_http_info', kwargs, fields=fields)
 
     def post_maintenance_windows(
         self,
@@ -12075,6 +12440,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -12127,6 +12493,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -12168,7 +12539,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('NetworkInterfacesApi', 'api210_network_interfaces_get_with_http_info', kwargs)
+        return self._call_api('NetworkInterfacesApi', 'api210_network_interfaces_get_with_http_info', kwargs, fields=fields)
 
     def patch_network_interfaces(
         self,
@@ -12249,6 +12620,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -12341,6 +12713,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -12385,7 +12762,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('NetworkInterfacesApi', 'api210_network_interfaces_performance_get_with_http_info', kwargs)
+        return self._call_api('NetworkInterfacesApi', 'api210_network_interfaces_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_network_interfaces(
         self,
@@ -12524,6 +12901,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -12576,6 +12954,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -12618,7 +13001,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('OffloadsApi', 'api210_offloads_get_with_http_info', kwargs)
+        return self._call_api('OffloadsApi', 'api210_offloads_get_with_http_info', kwargs, fields=fields)
 
     def post_offloads(
         self,
@@ -12807,6 +13190,7 @@ class Client(object):
         remote_pod_names: Annotated[Optional[conlist(StrictStr)], Field(description="A comma-separated list of remote pod names. If, after filtering, there is not at least one resource that matches each of the elements, then an error is returned. This cannot be provided together with the `remote_pod_ids` query parameter.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -12889,6 +13273,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -12938,7 +13327,7 @@ class Client(object):
         _process_references(remotes, ['remote_ids', 'remote_names'], kwargs)
         _process_references(remote_pods, ['remote_pod_ids', 'remote_pod_names'], kwargs)
         _fixup_list_type_params(['ids', 'local_pod_ids', 'local_pod_names', 'remote_ids', 'remote_names', 'remote_pod_ids', 'remote_pod_names', 'sort'], kwargs)
-        return self._call_api('PodReplicaLinksApi', 'api210_pod_replica_links_get_with_http_info', kwargs)
+        return self._call_api('PodReplicaLinksApi', 'api210_pod_replica_links_get_with_http_info', kwargs, fields=fields)
 
     def get_pod_replica_links_lag(
         self,
@@ -12963,6 +13352,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -13087,6 +13477,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -13139,7 +13534,7 @@ class Client(object):
         _process_references(remotes, ['remote_ids', 'remote_names'], kwargs)
         _process_references(remote_pods, ['remote_pod_ids', 'remote_pod_names'], kwargs)
         _fixup_list_type_params(['ids', 'local_pod_ids', 'local_pod_names', 'remote_ids', 'remote_names', 'remote_pod_ids', 'remote_pod_names', 'sort'], kwargs)
-        return self._call_api('PodReplicaLinksApi', 'api210_pod_replica_links_lag_get_with_http_info', kwargs)
+        return self._call_api('PodReplicaLinksApi', 'api210_pod_replica_links_lag_get_with_http_info', kwargs, fields=fields)
 
     def patch_pod_replica_links(
         self,
@@ -13284,6 +13679,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, only return the aggregate value of all items after filtering. For real-time performance, the values are aggregated for the latest timestamp. For historical performance, the values are aggregated for each timestamp from `start_time` to `end_time`. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -13414,6 +13810,11 @@ class Client(object):
                         average value is displayed instead. The values are displayed for each name
                         where meaningful. If `total_only=true`, the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -13467,7 +13868,7 @@ class Client(object):
         _process_references(remotes, ['remote_ids', 'remote_names'], kwargs)
         _process_references(remote_pods, ['remote_pod_ids', 'remote_pod_names'], kwargs)
         _fixup_list_type_params(['ids', 'local_pod_ids', 'local_pod_names', 'remote_ids', 'remote_names', 'remote_pod_ids', 'remote_pod_names', 'sort'], kwargs)
-        return self._call_api('PodReplicaLinksApi', 'api210_pod_replica_links_performance_replication_get_with_http_info', kwargs)
+        return self._call_api('PodReplicaLinksApi', 'api210_pod_replica_links_performance_replication_get_with_http_info', kwargs, fields=fields)
 
     def post_pod_replica_links(
         self,
@@ -13678,6 +14079,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -13736,6 +14138,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -13780,7 +14187,7 @@ class Client(object):
         _process_references(groups, ['group_ids', 'group_names'], kwargs)
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _fixup_list_type_params(['group_ids', 'group_names', 'member_ids', 'member_names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api210_pods_arrays_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api210_pods_arrays_get_with_http_info', kwargs, fields=fields)
 
     def post_pods_arrays(
         self,
@@ -13950,6 +14357,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -14015,6 +14423,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -14059,7 +14472,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api210_pods_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api210_pods_get_with_http_info', kwargs, fields=fields)
 
     def patch_pods(
         self,
@@ -14179,6 +14592,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -14279,6 +14693,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -14325,7 +14744,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api210_pods_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api210_pods_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_pods_performance(
         self,
@@ -14344,6 +14763,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -14444,6 +14864,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -14490,7 +14915,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api210_pods_performance_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api210_pods_performance_get_with_http_info', kwargs, fields=fields)
 
     def get_pods_performance_replication_by_array(
         self,
@@ -14509,6 +14934,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -14609,6 +15035,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -14655,7 +15086,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api210_pods_performance_replication_by_array_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api210_pods_performance_replication_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_pods_performance_replication(
         self,
@@ -14674,6 +15105,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, only return the aggregate value of all items after filtering. For real-time performance, the values are aggregated for the latest timestamp. For historical performance, the values are aggregated for each timestamp from `start_time` to `end_time`. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -14776,6 +15208,11 @@ class Client(object):
                         average value is displayed instead. The values are displayed for each name
                         where meaningful. If `total_only=true`, the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -14822,7 +15259,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api210_pods_performance_replication_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api210_pods_performance_replication_get_with_http_info', kwargs, fields=fields)
 
     def post_pods(
         self,
@@ -14905,6 +15342,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -15005,6 +15443,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -15051,7 +15494,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PodsApi', 'api210_pods_space_get_with_http_info', kwargs)
+        return self._call_api('PodsApi', 'api210_pods_space_get_with_http_info', kwargs, fields=fields)
 
     def get_policies(
         self,
@@ -15066,6 +15509,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -15122,6 +15566,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -15164,7 +15613,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_get_with_http_info', kwargs, fields=fields)
 
     def get_policies_members(
         self,
@@ -15184,6 +15633,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -15259,6 +15709,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -15306,7 +15761,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'member_types', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_members_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_members_get_with_http_info', kwargs, fields=fields)
 
     def delete_policies_nfs_client_rules(
         self,
@@ -15398,6 +15853,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -15459,6 +15915,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -15503,7 +15964,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_nfs_client_rules_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_nfs_client_rules_get_with_http_info', kwargs, fields=fields)
 
     def post_policies_nfs_client_rules(
         self,
@@ -15654,6 +16115,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -15710,6 +16172,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -15752,7 +16219,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_nfs_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_nfs_get_with_http_info', kwargs, fields=fields)
 
     def delete_policies_nfs_members(
         self,
@@ -15861,6 +16328,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -15936,6 +16404,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -15983,7 +16456,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'member_types', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_nfs_members_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_nfs_members_get_with_http_info', kwargs, fields=fields)
 
     def post_policies_nfs_members(
         self,
@@ -16268,6 +16741,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -16324,6 +16798,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -16366,7 +16845,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_quota_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_quota_get_with_http_info', kwargs, fields=fields)
 
     def delete_policies_quota_members(
         self,
@@ -16475,6 +16954,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -16550,6 +17030,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -16597,7 +17082,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'member_types', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_quota_members_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_quota_members_get_with_http_info', kwargs, fields=fields)
 
     def post_policies_quota_members(
         self,
@@ -16911,6 +17396,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -16972,6 +17458,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -17016,7 +17507,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_quota_rules_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_quota_rules_get_with_http_info', kwargs, fields=fields)
 
     def post_policies_quota_rules(
         self,
@@ -17187,6 +17678,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -17248,6 +17740,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -17292,7 +17789,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_smb_client_rules_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_smb_client_rules_get_with_http_info', kwargs, fields=fields)
 
     def post_policies_smb_client_rules(
         self,
@@ -17443,6 +17940,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -17499,6 +17997,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -17541,7 +18044,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_smb_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_smb_get_with_http_info', kwargs, fields=fields)
 
     def delete_policies_smb_members(
         self,
@@ -17650,6 +18153,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -17725,6 +18229,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -17772,7 +18281,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'member_types', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_smb_members_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_smb_members_get_with_http_info', kwargs, fields=fields)
 
     def post_policies_smb_members(
         self,
@@ -18057,6 +18566,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -18113,6 +18623,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -18155,7 +18670,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_snapshot_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_snapshot_get_with_http_info', kwargs, fields=fields)
 
     def delete_policies_snapshot_members(
         self,
@@ -18264,6 +18779,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -18339,6 +18855,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -18386,7 +18907,7 @@ class Client(object):
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['member_ids', 'member_names', 'member_types', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_snapshot_members_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_snapshot_members_get_with_http_info', kwargs, fields=fields)
 
     def post_policies_snapshot_members(
         self,
@@ -18682,6 +19203,7 @@ class Client(object):
         policy_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the policy names specified. Enter multiple policy names in comma-separated format. For example, `name01,name02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -18743,6 +19265,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -18787,7 +19314,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(policies, ['policy_ids', 'policy_names'], kwargs)
         _fixup_list_type_params(['names', 'policy_ids', 'policy_names', 'sort'], kwargs)
-        return self._call_api('PoliciesApi', 'api210_policies_snapshot_rules_get_with_http_info', kwargs)
+        return self._call_api('PoliciesApi', 'api210_policies_snapshot_rules_get_with_http_info', kwargs, fields=fields)
 
     def post_policies_snapshot_rules(
         self,
@@ -18870,6 +19397,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -18915,6 +19443,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -18955,7 +19488,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('PortsApi', 'api210_ports_get_with_http_info', kwargs)
+        return self._call_api('PortsApi', 'api210_ports_get_with_http_info', kwargs, fields=fields)
 
     def get_ports_initiators(
         self,
@@ -18968,6 +19501,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -19013,6 +19547,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -19053,7 +19592,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('PortsApi', 'api210_ports_initiators_get_with_http_info', kwargs)
+        return self._call_api('PortsApi', 'api210_ports_initiators_get_with_http_info', kwargs, fields=fields)
 
     def delete_protection_group_snapshots(
         self,
@@ -19131,6 +19670,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -19197,6 +19737,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -19242,7 +19787,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(sources, ['source_names'], kwargs)
         _fixup_list_type_params(['names', 'sort', 'source_names'], kwargs)
-        return self._call_api('ProtectionGroupSnapshotsApi', 'api210_protection_group_snapshots_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupSnapshotsApi', 'api210_protection_group_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def patch_protection_group_snapshots(
         self,
@@ -19407,6 +19952,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -19466,6 +20012,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -19510,7 +20061,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(sources, ['source_names'], kwargs)
         _fixup_list_type_params(['names', 'sort', 'source_names'], kwargs)
-        return self._call_api('ProtectionGroupSnapshotsApi', 'api210_protection_group_snapshots_transfer_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupSnapshotsApi', 'api210_protection_group_snapshots_transfer_get_with_http_info', kwargs, fields=fields)
 
     def delete_protection_groups(
         self,
@@ -19586,6 +20137,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -19647,6 +20199,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -19690,7 +20247,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def delete_protection_groups_host_groups(
         self,
@@ -19777,6 +20334,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -19836,6 +20394,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -19879,7 +20442,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_host_groups_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_host_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_protection_groups_host_groups(
         self,
@@ -20037,6 +20600,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -20096,6 +20660,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -20139,7 +20708,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_hosts_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_hosts_get_with_http_info', kwargs, fields=fields)
 
     def post_protection_groups_hosts(
         self,
@@ -20291,6 +20860,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -20382,6 +20952,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -20426,7 +21001,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_performance_replication_by_array_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_performance_replication_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_protection_groups_performance_replication(
         self,
@@ -20443,6 +21018,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -20534,6 +21110,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -20578,7 +21159,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_performance_replication_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_performance_replication_get_with_http_info', kwargs, fields=fields)
 
     def post_protection_groups(
         self,
@@ -20674,6 +21255,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -20723,6 +21305,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -20764,7 +21351,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_space_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_space_get_with_http_info', kwargs, fields=fields)
 
     def delete_protection_groups_targets(
         self,
@@ -20851,6 +21438,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -20910,6 +21498,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -20953,7 +21546,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_targets_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_targets_get_with_http_info', kwargs, fields=fields)
 
     def patch_protection_groups_targets(
         self,
@@ -21194,6 +21787,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -21262,6 +21856,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -21307,7 +21906,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_ids', 'member_names', 'sort'], kwargs)
-        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_volumes_get_with_http_info', kwargs)
+        return self._call_api('ProtectionGroupsApi', 'api210_protection_groups_volumes_get_with_http_info', kwargs, fields=fields)
 
     def post_protection_groups_volumes(
         self,
@@ -21399,6 +21998,7 @@ class Client(object):
         on: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the target name specified. Enter multiple target names in comma-separated format. For example, `targetName01,targetName02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -21451,6 +22051,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -21493,7 +22098,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'on', 'sort'], kwargs)
-        return self._call_api('RemotePodsApi', 'api210_remote_pods_get_with_http_info', kwargs)
+        return self._call_api('RemotePodsApi', 'api210_remote_pods_get_with_http_info', kwargs, fields=fields)
 
     def delete_remote_protection_group_snapshots(
         self,
@@ -21575,6 +22180,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -21632,6 +22238,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -21676,7 +22287,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(sources, ['source_names'], kwargs)
         _fixup_list_type_params(['names', 'on', 'sort', 'source_names'], kwargs)
-        return self._call_api('RemoteProtectionGroupSnapshotsApi', 'api210_remote_protection_group_snapshots_get_with_http_info', kwargs)
+        return self._call_api('RemoteProtectionGroupSnapshotsApi', 'api210_remote_protection_group_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def patch_remote_protection_group_snapshots(
         self,
@@ -21866,6 +22477,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -21928,6 +22540,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -21973,7 +22590,7 @@ class Client(object):
         _process_references(references, ['names'], kwargs)
         _process_references(sources, ['source_names'], kwargs)
         _fixup_list_type_params(['names', 'on', 'sort', 'source_names'], kwargs)
-        return self._call_api('RemoteProtectionGroupSnapshotsApi', 'api210_remote_protection_group_snapshots_transfer_get_with_http_info', kwargs)
+        return self._call_api('RemoteProtectionGroupSnapshotsApi', 'api210_remote_protection_group_snapshots_transfer_get_with_http_info', kwargs, fields=fields)
 
     def delete_remote_protection_groups(
         self,
@@ -22060,6 +22677,7 @@ class Client(object):
         on: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the target name specified. Enter multiple target names in comma-separated format. For example, `targetName01,targetName02`.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -22116,6 +22734,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -22159,7 +22782,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'on', 'sort'], kwargs)
-        return self._call_api('RemoteProtectionGroupsApi', 'api210_remote_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('RemoteProtectionGroupsApi', 'api210_remote_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def patch_remote_protection_groups(
         self,
@@ -22325,6 +22948,7 @@ class Client(object):
         source_ids: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source ID specified. Enter multiple source IDs in comma-separated format.")] = None,
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -22389,6 +23013,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -22435,7 +23064,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'on', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('RemoteVolumeSnapshotsApi', 'api210_remote_volume_snapshots_get_with_http_info', kwargs)
+        return self._call_api('RemoteVolumeSnapshotsApi', 'api210_remote_volume_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def patch_remote_volume_snapshots(
         self,
@@ -22601,6 +23230,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -22670,6 +23300,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -22717,7 +23352,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'on', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('RemoteVolumeSnapshotsApi', 'api210_remote_volume_snapshots_transfer_get_with_http_info', kwargs)
+        return self._call_api('RemoteVolumeSnapshotsApi', 'api210_remote_volume_snapshots_transfer_get_with_http_info', kwargs, fields=fields)
 
     def get_smi_s(
         self,
@@ -22728,6 +23363,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -22768,6 +23404,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -22806,7 +23447,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('SMISApi', 'api210_smi_s_get_with_http_info', kwargs)
+        return self._call_api('SMISApi', 'api210_smi_s_get_with_http_info', kwargs, fields=fields)
 
     def patch_smi_s(
         self,
@@ -22872,6 +23513,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -22912,6 +23554,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -22950,7 +23597,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('SMTPApi', 'api210_smtp_servers_get_with_http_info', kwargs)
+        return self._call_api('SMTPApi', 'api210_smtp_servers_get_with_http_info', kwargs, fields=fields)
 
     def patch_smtp_servers(
         self,
@@ -23016,6 +23663,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -23056,6 +23704,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -23094,7 +23747,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('SNMPAgentsApi', 'api210_snmp_agents_get_with_http_info', kwargs)
+        return self._call_api('SNMPAgentsApi', 'api210_snmp_agents_get_with_http_info', kwargs, fields=fields)
 
     def get_snmp_agents_mib(
         self,
@@ -23105,6 +23758,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -23145,6 +23799,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -23183,7 +23842,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('SNMPAgentsApi', 'api210_snmp_agents_mib_get_with_http_info', kwargs)
+        return self._call_api('SNMPAgentsApi', 'api210_snmp_agents_mib_get_with_http_info', kwargs, fields=fields)
 
     def patch_snmp_agents(
         self,
@@ -23312,6 +23971,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -23364,6 +24024,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -23405,7 +24070,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('SNMPManagersApi', 'api210_snmp_managers_get_with_http_info', kwargs)
+        return self._call_api('SNMPManagersApi', 'api210_snmp_managers_get_with_http_info', kwargs, fields=fields)
 
     def patch_snmp_managers(
         self,
@@ -23546,6 +24211,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -23591,6 +24257,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -23631,7 +24302,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('SNMPManagersApi', 'api210_snmp_managers_test_get_with_http_info', kwargs)
+        return self._call_api('SNMPManagersApi', 'api210_snmp_managers_test_get_with_http_info', kwargs, fields=fields)
 
     def get_sessions(
         self,
@@ -23646,6 +24317,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -23702,6 +24374,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -23744,7 +24421,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('SessionsApi', 'api210_sessions_get_with_http_info', kwargs)
+        return self._call_api('SessionsApi', 'api210_sessions_get_with_http_info', kwargs, fields=fields)
 
     def get_software_bundle(
         self,
@@ -23756,6 +24433,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -23800,6 +24478,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -23839,7 +24522,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids'], kwargs)
         _fixup_list_type_params(['ids', 'sort'], kwargs)
-        return self._call_api('SoftwareApi', 'api210_software_bundle_get_with_http_info', kwargs)
+        return self._call_api('SoftwareApi', 'api210_software_bundle_get_with_http_info', kwargs, fields=fields)
 
     def post_software_bundle(
         self,
@@ -23970,6 +24653,7 @@ class Client(object):
         software_versions: Annotated[Optional[conlist(StrictStr)], Field(description="A comma-separated list of target software versions.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -24025,6 +24709,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -24069,7 +24758,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(softwares, ['software_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'software_names', 'software_versions', 'sort'], kwargs)
-        return self._call_api('SoftwareApi', 'api210_software_check_get_with_http_info', kwargs)
+        return self._call_api('SoftwareApi', 'api210_software_check_get_with_http_info', kwargs, fields=fields)
 
     def post_software_check(
         self,
@@ -24147,6 +24836,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         versions: Annotated[Optional[conlist(StrictStr)], Field(description="A comma-separated list of versions.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -24198,6 +24888,11 @@ class Client(object):
         :type total_item_count: bool
         :param versions: A comma-separated list of versions.
         :type versions: List[str]
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -24240,7 +24935,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort', 'versions'], kwargs)
-        return self._call_api('SoftwareApi', 'api210_software_get_with_http_info', kwargs)
+        return self._call_api('SoftwareApi', 'api210_software_get_with_http_info', kwargs, fields=fields)
 
     def get_software_installation_steps(
         self,
@@ -24257,6 +24952,7 @@ class Client(object):
         software_installation_ids: Annotated[Optional[conlist(StrictStr)], Field(description="A comma-separated list of software installation IDs.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -24317,6 +25013,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -24361,7 +25062,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(software_installations, ['software_installation_ids'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'software_installation_ids', 'sort'], kwargs)
-        return self._call_api('SoftwareApi', 'api210_software_installation_steps_get_with_http_info', kwargs)
+        return self._call_api('SoftwareApi', 'api210_software_installation_steps_get_with_http_info', kwargs, fields=fields)
 
     def get_software_installations(
         self,
@@ -24379,6 +25080,7 @@ class Client(object):
         software_names: Annotated[Optional[conlist(StrictStr)], Field(description="A comma-separated list of software names.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -24441,6 +25143,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -24486,7 +25193,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(softwares, ['software_ids', 'software_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'software_ids', 'software_names', 'sort'], kwargs)
-        return self._call_api('SoftwareApi', 'api210_software_installations_get_with_http_info', kwargs)
+        return self._call_api('SoftwareApi', 'api210_software_installations_get_with_http_info', kwargs, fields=fields)
 
     def patch_software_installations(
         self,
@@ -24682,6 +25389,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -24722,6 +25430,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -24760,7 +25473,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('SoftwareApi', 'api210_software_versions_get_with_http_info', kwargs)
+        return self._call_api('SoftwareApi', 'api210_software_versions_get_with_http_info', kwargs, fields=fields)
 
     def delete_subnets(
         self,
@@ -24834,6 +25547,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -24886,6 +25600,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -24927,7 +25646,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('SubnetsApi', 'api210_subnets_get_with_http_info', kwargs)
+        return self._call_api('SubnetsApi', 'api210_subnets_get_with_http_info', kwargs, fields=fields)
 
     def patch_subnets(
         self,
@@ -25067,6 +25786,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -25114,6 +25834,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -25153,7 +25878,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('SupportApi', 'api210_support_get_with_http_info', kwargs)
+        return self._call_api('SupportApi', 'api210_support_get_with_http_info', kwargs, fields=fields)
 
     def patch_support(
         self,
@@ -25220,6 +25945,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         test_type: Annotated[Optional[StrictStr], Field(description="Specifies the type of test. Valid values are `all`, `phonehome`, and `remote-assist`. If not specified, defaults to `all`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -25263,6 +25989,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -25302,7 +26033,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('SupportApi', 'api210_support_test_get_with_http_info', kwargs)
+        return self._call_api('SupportApi', 'api210_support_test_get_with_http_info', kwargs, fields=fields)
 
     def delete_syslog_servers(
         self,
@@ -25376,6 +26107,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -25428,6 +26160,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -25469,7 +26206,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['names'], kwargs)
         _fixup_list_type_params(['names', 'sort'], kwargs)
-        return self._call_api('SyslogApi', 'api210_syslog_servers_get_with_http_info', kwargs)
+        return self._call_api('SyslogApi', 'api210_syslog_servers_get_with_http_info', kwargs, fields=fields)
 
     def patch_syslog_servers(
         self,
@@ -25608,6 +26345,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -25648,6 +26386,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -25686,7 +26429,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('SyslogApi', 'api210_syslog_servers_settings_get_with_http_info', kwargs)
+        return self._call_api('SyslogApi', 'api210_syslog_servers_settings_get_with_http_info', kwargs, fields=fields)
 
     def patch_syslog_servers_settings(
         self,
@@ -25752,6 +26495,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -25792,6 +26536,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -25830,7 +26579,7 @@ class Client(object):
         )
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _fixup_list_type_params(['sort'], kwargs)
-        return self._call_api('SyslogApi', 'api210_syslog_servers_test_get_with_http_info', kwargs)
+        return self._call_api('SyslogApi', 'api210_syslog_servers_test_get_with_http_info', kwargs, fields=fields)
 
     def patch_virtual_machines(
         self,
@@ -26036,6 +26785,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -26101,6 +26851,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -26145,7 +26900,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumeGroupsApi', 'api210_volume_groups_get_with_http_info', kwargs)
+        return self._call_api('VolumeGroupsApi', 'api210_volume_groups_get_with_http_info', kwargs, fields=fields)
 
     def patch_volume_groups(
         self,
@@ -26240,6 +26995,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -26340,6 +27096,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -26386,7 +27147,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumeGroupsApi', 'api210_volume_groups_performance_get_with_http_info', kwargs)
+        return self._call_api('VolumeGroupsApi', 'api210_volume_groups_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_volume_groups(
         self,
@@ -26469,6 +27230,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -26569,6 +27331,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -26615,7 +27382,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumeGroupsApi', 'api210_volume_groups_space_get_with_http_info', kwargs)
+        return self._call_api('VolumeGroupsApi', 'api210_volume_groups_space_get_with_http_info', kwargs, fields=fields)
 
     def get_volume_groups_volumes(
         self,
@@ -26633,6 +27400,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -26698,6 +27466,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -26743,7 +27516,7 @@ class Client(object):
         _process_references(groups, ['group_ids', 'group_names'], kwargs)
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _fixup_list_type_params(['group_ids', 'group_names', 'member_ids', 'member_names', 'sort'], kwargs)
-        return self._call_api('VolumeGroupsApi', 'api210_volume_groups_volumes_get_with_http_info', kwargs)
+        return self._call_api('VolumeGroupsApi', 'api210_volume_groups_volumes_get_with_http_info', kwargs, fields=fields)
 
     def delete_volume_snapshots(
         self,
@@ -26836,6 +27609,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -26909,6 +27683,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -26956,7 +27735,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('VolumeSnapshotsApi', 'api210_volume_snapshots_get_with_http_info', kwargs)
+        return self._call_api('VolumeSnapshotsApi', 'api210_volume_snapshots_get_with_http_info', kwargs, fields=fields)
 
     def patch_volume_snapshots(
         self,
@@ -27267,6 +28046,7 @@ class Client(object):
         resource_names: Annotated[Optional[conlist(StrictStr)], Field(description="A comma-separated list of resource names. The `resource_ids` or `resource_names` parameter is required, but they cannot be set together.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -27330,6 +28110,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -27374,7 +28159,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(resources, ['resource_ids', 'resource_names'], kwargs)
         _fixup_list_type_params(['namespaces', 'resource_ids', 'resource_names', 'sort'], kwargs)
-        return self._call_api('VolumeSnapshotsApi', 'api210_volume_snapshots_tags_get_with_http_info', kwargs)
+        return self._call_api('VolumeSnapshotsApi', 'api210_volume_snapshots_tags_get_with_http_info', kwargs, fields=fields)
 
     def get_volume_snapshots_transfer(
         self,
@@ -27393,6 +28178,7 @@ class Client(object):
         source_names: Annotated[Optional[conlist(StrictStr)], Field(description="Performs the operation on the source name specified. Enter multiple source names in comma-separated format. For example, `name01,name02`.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -27459,6 +28245,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -27505,7 +28296,7 @@ class Client(object):
         _process_references(references, ['ids', 'names'], kwargs)
         _process_references(sources, ['source_ids', 'source_names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort', 'source_ids', 'source_names'], kwargs)
-        return self._call_api('VolumeSnapshotsApi', 'api210_volume_snapshots_transfer_get_with_http_info', kwargs)
+        return self._call_api('VolumeSnapshotsApi', 'api210_volume_snapshots_transfer_get_with_http_info', kwargs, fields=fields)
 
     def delete_volumes(
         self,
@@ -27591,6 +28382,7 @@ class Client(object):
         segment_offset: Annotated[Optional[StrictInt], Field(description="Absolute offset, in bytes, of the segment to compare. Must be a multiple of block_size.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -27662,6 +28454,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -27709,7 +28506,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api210_volumes_diff_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api210_volumes_diff_get_with_http_info', kwargs, fields=fields)
 
     def get_volumes(
         self,
@@ -27726,6 +28523,7 @@ class Client(object):
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -27791,6 +28589,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -27835,7 +28638,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api210_volumes_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api210_volumes_get_with_http_info', kwargs, fields=fields)
 
     def patch_volumes(
         self,
@@ -27936,6 +28739,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -28036,6 +28840,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -28082,7 +28891,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api210_volumes_performance_by_array_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api210_volumes_performance_by_array_get_with_http_info', kwargs, fields=fields)
 
     def get_volumes_performance(
         self,
@@ -28101,6 +28910,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -28201,6 +29011,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -28247,7 +29062,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api210_volumes_performance_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api210_volumes_performance_get_with_http_info', kwargs, fields=fields)
 
     def post_volumes(
         self,
@@ -28413,6 +29228,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -28481,6 +29297,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -28526,7 +29347,7 @@ class Client(object):
         _process_references(groups, ['group_names'], kwargs)
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _fixup_list_type_params(['group_names', 'member_ids', 'member_names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api210_volumes_protection_groups_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api210_volumes_protection_groups_get_with_http_info', kwargs, fields=fields)
 
     def post_volumes_protection_groups(
         self,
@@ -28622,6 +29443,7 @@ class Client(object):
         start_time: Annotated[Optional[StrictInt], Field(description="Displays historical performance data for the specified time window, where `start_time` is the beginning of the time window, and `end_time` is the end of the time window. The `start_time` and `end_time` parameters are specified in milliseconds since the UNIX epoch. If `start_time` is not specified, the start time will default to one resolution before the end time, meaning that the most recent sample of performance data will be displayed. If `end_time`is not specified, the end time will default to the current time. Include the `resolution` parameter to display the performance data at the specified resolution. If not specified, `resolution` defaults to the lowest valid resolution.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
         total_only: Annotated[Optional[StrictBool], Field(description="If set to `true`, returns the aggregate value of all items after filtering. Where it makes more sense, the average value is displayed instead. The values are displayed for each name where meaningful. If `total_only=true`, the `items` list will be empty.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -28722,6 +29544,11 @@ class Client(object):
                         values are displayed for each name where meaningful. If `total_only=true`,
                         the `items` list will be empty.
         :type total_only: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -28768,7 +29595,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(references, ['ids', 'names'], kwargs)
         _fixup_list_type_params(['ids', 'names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api210_volumes_space_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api210_volumes_space_get_with_http_info', kwargs, fields=fields)
 
     def put_volumes_tags_batch(
         self,
@@ -28928,6 +29755,7 @@ class Client(object):
         resource_names: Annotated[Optional[conlist(StrictStr)], Field(description="A comma-separated list of resource names. The `resource_ids` or `resource_names` parameter is required, but they cannot be set together.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -28991,6 +29819,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -29035,7 +29868,7 @@ class Client(object):
         kwargs = {k: v for k, v in kwargs.items() if v is not None or k in [Parameters.x_request_id, Parameters.limit]}
         _process_references(resources, ['resource_ids', 'resource_names'], kwargs)
         _fixup_list_type_params(['namespaces', 'resource_ids', 'resource_names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api210_volumes_tags_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api210_volumes_tags_get_with_http_info', kwargs, fields=fields)
 
     def get_volumes_volume_groups(
         self,
@@ -29053,6 +29886,7 @@ class Client(object):
         offset: Annotated[Optional[conint(strict=True, ge=0)], Field(description="The starting position based on the results of the query in relation to the full set of response objects returned.")] = None,
         sort: Annotated[Optional[conlist(constr(strict=True))], Field(description="Returns the response objects in the order specified. Set `sort` to the name in the response by which to sort. Sorting can be performed on any of the names in the response, and the objects can be sorted in ascending or descending order. By default, the response objects are sorted in ascending order. To sort in descending order, append the minus sign (`-`) to the name. A single request can be sorted on multiple objects. For example, you can sort all volumes from largest to smallest volume size, and then sort volumes of the same size in ascending order by volume name. To sort on multiple names, list the names as comma-separated values.")] = None,
         total_item_count: Annotated[Optional[StrictBool], Field(description="If set to `true`, the `total_item_count` matching the specified query parameters is calculated and returned in the response. If set to `false`, the `total_item_count` is `null` in the response. This may speed up queries where the `total_item_count` is large. If not specified, defaults to `false`.")] = None,
+        fields: Optional[List[Union[str, Property]]] = None,
         _preload_content: bool = True,
         _return_http_data_only: Optional[bool] = None,
         _request_timeout: Optional[Union[float, Tuple[float, float]]] = None
@@ -29118,6 +29952,11 @@ class Client(object):
                                 where the `total_item_count` is large. If not specified, defaults to
                                 `false`.
         :type total_item_count: bool
+        :param fields: The fields of the items to deserialize, dotted for the fields of
+                    nested objects, e.g. `space.total_physical`. Other fields are left
+                    unset, as if the target had not sent them. Defaults to the
+                    `default_fields` of the configuration.
+        :type fields: List[Union[str, Property]], optional
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
                  be set to none and raw_data will store the
@@ -29163,7 +30002,7 @@ class Client(object):
         _process_references(groups, ['group_ids', 'group_names'], kwargs)
         _process_references(members, ['member_ids', 'member_names'], kwargs)
         _fixup_list_type_params(['group_ids', 'group_names', 'member_ids', 'member_names', 'sort'], kwargs)
-        return self._call_api('VolumesApi', 'api210_volumes_volume_groups_get_with_http_info', kwargs)
+        return self._call_api('VolumesApi', 'api210_volumes_volume_groups_get_with_http_info', kwargs, fields=fields)
 
     def _set_auth_header(self, refresh=False):
         """
@@ -29184,7 +30023,9 @@ class Client(object):
             self._api_client.set_default_header(Headers.x_auth_token,
                                                 self._token_man.get_session_token(refresh=refresh))
 
-    def _call_api(self, api_class_name, api_function_name, kwargs):
+    @traced
+    @profiled
+    def _call_api(self, api_class_name, api_function_name, kwargs, fields=None):
         """
         Call the API function and process the response. May call the API
         repeatedly if the request failed for a reason that may not persist in
@@ -29194,6 +30035,8 @@ class Client(object):
             api_class_name (str): Swagger-generated api class to call.
             api_function_name (str): Swagger-generated function to call.
             kwargs (dict): kwargs to pass to the function.
+            fields (list[str or Property]): The fields of the items to
+                deserialize, see `pypureclient.projection.Projection`.
 
         Returns:
             ValidResponse: If the call was successful.
@@ -29204,6 +30047,14 @@ class Client(object):
             ValueError: If a parameter is of an invalid type.
             TypeError: If invalid or missing parameters are used.
         """
+        projection = get_projection(fields, api_function_name, self._api_client.configuration)
+        # Concurrent lookups by names or ids may be sent as a single request,
+        # unless their items are projected
+        if projection is None:
+            response = coalesce_lookup(self, api_class_name, api_function_name, kwargs)
+            if response is not None:
+                return response
+
         kwargs['_request_timeout'] = self._timeout
         if Parameters.x_request_id in kwargs and not kwargs[Parameters.x_request_id]:
             kwargs[Parameters.x_request_id] = str(uuid.uuid4())
@@ -29215,44 +30066,40 @@ class Client(object):
 
         if kwargs.get('authorization') is not None:
             warnings.warn("authorization parameter is deprecated, and will be removed soon.", DeprecationWarning)
-        retries = self._retries
         original_auth_error = None
         api_function = getattr(self.__get_api_instance(api_class_name), api_function_name)
+        if projection is not None:
+            api_function = ProjectedFunction(api_function, projection)
+        retry = self._retry_policy.start(self._api_client.configuration.hooks, get_endpoint(api_function))
         while True:
             try:
-                response = api_function(**kwargs)
+                response = call_endpoint(api_function, kwargs)
                 # Call was successful (200)
                 return self._create_valid_response(response, api_function, _iterator_stop_on_limit, kwargs)
             except ApiException as error:
-                # If no chance for retries, return the error
-                if retries == 0:
-                    return self._create_error_response(original_auth_error or error)
-                # If bad request, forbidden, or not found, return the error (it will never work)
-                elif error.status in [400, 403, 404]:
-                    return self._create_error_response(error)
+                action, delay = retry.status_error_action(error.status, error.headers,
+                                                          auth_error_status=401,
+                                                          final_error_statuses=(400, 403, 404))
+                # If rate limit or server error the policy retries, wait and try again
+                if action == RETRY:
+                    time.sleep(delay)
                 # If authentication error, reset access token and retry once
-                elif error.status == 401:
+                elif action == REFRESH_AUTH:
                     original_auth_error = error
-                    retries = 1
                     self._set_auth_header(refresh=True)
-                # If rate limit error, wait the proper time and try again
-                elif error.status == 429:
-                    # If the the minute limit hit, wait that long
-                    if (int(error.headers.get(Headers.x_ratelimit_remaining_min))
-                            == int(error.headers.get(Headers.x_ratelimit_min))):
-                        time.sleep(60)
-                    # Otherwise it was the second limit and only wait a second
-                    time.sleep(1)
-                # If some internal server error we know nothing about, return
-                elif error.status == 500:
-                    return self._create_error_response(error)
-                # If internal server errors that has to do with timeouts, try again
-                elif error.status > 500:
-                    pass
+                # If the call will never work, or is out of retries, return the error
+                elif action == RETURN_ERROR:
+                    return self._create_error_response(original_auth_error or error)
                 # If error with the swagger client, raise the error
                 else:
                     raise PureError(error)
-            retries = retries - 1
+            except urllib3.exceptions.HTTPError as error:
+                # If the connection failed, wait and try again unless the
+                # request may have been processed already
+                delay = retry.connection_error_delay(error, idempotent=api_function_name.endswith('_get_with_http_info'))
+                if delay is None:
+                    raise
+                time.sleep(delay)
 
     def __get_api_instance(self, api_class):
         """
@@ -29297,7 +30144,8 @@ class Client(object):
                                       body.items,
                                       headers.get(Headers.x_request_id, None),
                                       more_items_remaining or False,
-                                      iterator_stop_on_limit))
+                                      iterator_stop_on_limit,
+                                      configuration=self._api_client.configuration))
         return ValidResponse(response.status_code, continuation_token, total_item_count,
                              items, headers, total, more_items_remaining, errors=errors)
 
@@ -29314,7 +30162,7 @@ class Client(object):
         """
         status = error.status
         try:
-            body = json.loads(error.body)
+            body = self._api_client.json_codec.loads(error.body)
         except Exception:
             errors = [ApiError(None, "Response is not a valid JSON")]
             return ErrorResponse(status, errors, headers=error.headers)
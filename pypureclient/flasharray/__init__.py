@@ -17,7 +17,7 @@ except ModuleNotFoundError:
 
 
 
-from .client import Client
+from .client import Client, AsyncClient
 
 from pypureclient.reference_type import ReferenceType, quoteStrings
 from pypureclient.exceptions import PureError
@@ -3,7 +3,9 @@ from typing import Union, Tuple
 
 from .__modules_dict import __modules_dict as fb_modules_dict
 from .._helpers import create_transport_config, get_target_versions
+from ..async_client import to_async_client
 from ..configuration import Configuration
+from ..retry_policy import RetryPolicy
 
 fb_modules = {}
 
@@ -24,7 +26,7 @@ def Client(
     key_id: str = None,
     issuer: str = None,
     api_token: str = None,
-    retries: int = DEFAULT_RETRIES,
+    retries: Union[int, RetryPolicy] = DEFAULT_RETRIES,
     timeout: Union[int, Tuple[float, float]] = None,
     ssl_cert: str = None,
     user_agent: str = None,
@@ -68,8 +70,8 @@ def Client(
     :type api_token: str, optional
 
     :param retries: The number of times to retry an API call if it fails for a
-        non-blocking reason. Defaults to 5.
-    :type retries: int, optional
+        non-blocking reason, or the RetryPolicy of the calls. Defaults to 5.
+    :type retries: int or RetryPolicy, optional
 
     :param timeout: The timeout duration in seconds, either in total time or
         (connect and read) times. Defaults to None.
@@ -113,6 +115,42 @@ def Client(
     return client
 
 
+def AsyncClient(
+    target: str,
+    version: str = None,
+    id_token: str = None,
+    private_key_file: str = None,
+    private_key_password: str = None,
+    username: str = None,
+    client_id: str = None,
+    key_id: str = None,
+    issuer: str = None,
+    api_token: str = None,
+    retries: Union[int, RetryPolicy] = DEFAULT_RETRIES,
+    timeout: Union[int, Tuple[float, float]] = None,
+    ssl_cert: str = None,
+    user_agent: str = None,
+    verify_ssl: bool = None,
+    configuration: Configuration = None):
+    """
+    Initialize an asyncio FlashBlade Client.
+
+    Takes the same parameters as `Client`. The version negotiation and the
+    authentication are done while the client is created, then every API method
+    returns a coroutine, e.g. `response = await client.get_file_systems()`, and
+    the items of a ValidResponse are iterated with `async for`. Requests are
+    sent through a non-blocking transport, so a single event loop can keep many
+    of them in flight. Proxies are not supported.
+
+    :raises PureError: If it could not create an ID or access token
+    """
+    client = Client(target, version=version, id_token=id_token, private_key_file=private_key_file,
+                    private_key_password=private_key_password, username=username, client_id=client_id,
+                    key_id=key_id, issuer=issuer, api_token=api_token, retries=retries, timeout=timeout,
+                    ssl_cert=ssl_cert, user_agent=user_agent, verify_ssl=verify_ssl, configuration=configuration)
+    return to_async_client(client)
+
+
 def __validate_version(array_versions, version):
     if str(version).lower() == MW_DEV_VERSION and MW_DEV_VERSION in fb_modules_dict.keys():
         return
@@ -0,0 +1,343 @@
+import bisect
+import contextvars
+import inspect
+import logging
+import threading
+import time
+
+from . import profiling
+
+logger = logging.getLogger(__name__)
+
+# (api class name, api function name) of the API call being sent
+_current_endpoint = contextvars.ContextVar('pypureclient_endpoint', default=None)
+
+# Upper bounds, in seconds, of the buckets of the latency histograms: 1ms to
+# about 65s, doubling, and a last bucket for anything slower
+LATENCY_BUCKETS = tuple(0.001 * 2 ** i for i in range(17))
+
+
+class ClientHooks(object):
+    """
+    Instrumentation hooks of a client, set in `Configuration.hooks`.
+    Subclasses override the callbacks they need, the others do nothing.
+
+    Callbacks are called on the thread sending the request, so they should
+    be quick. An exception raised by a callback is logged and ignored.
+
+    The endpoint of a callback is the (api class name, api function name)
+    tuple of the API call being made, e.g.
+    ('VolumesApi', 'volumes_get_with_http_info'), or None for the
+    requests the client sends on its own, e.g. to get an access token.
+
+    Hooks are shared, not copied, along with the configuration.
+    """
+
+    def on_request(self, endpoint, method, url):
+        """
+        Called before a request is sent.
+
+        Args:
+            endpoint (tuple): The API call.
+            method (str): The HTTP method.
+            url (str): The URL of the request, with its query string.
+        """
+
+    def on_response(self, endpoint, method, url, status, elapsed, bytes_in, bytes_out):
+        """
+        Called when the response to a request is received, or the request
+        failed.
+
+        Args:
+            endpoint (tuple): The API call.
+            method (str): The HTTP method.
+            url (str): The URL of the request, with its query string.
+            status (int): The HTTP status, None if no response was received.
+            elapsed (float): Seconds from sending the request to receiving the
+                response, or the body too if it was read.
+            bytes_in (int): Size of the response body as transferred, 0 if it
+                was not read.
+            bytes_out (int): Size of the request body.
+        """
+
+    def on_retry(self, endpoint, retries, status, delay):
+        """
+        Called when an API call is about to be retried.
+
+        Args:
+            endpoint (tuple): The API call.
+            retries (int): Number of retries made so far, this one included.
+            status (int): The HTTP status of the failed attempt, None if its
+                connection failed.
+            delay (float): Seconds waited before the retry.
+        """
+
+    def on_page(self, endpoint, page, items, elapsed):
+        """
+        Called when a page of items after the first is received.
+
+        Args:
+            endpoint (tuple): The API call.
+            page (int): Number of the page, the first one being 0.
+            items (int): Number of items of the page.
+            elapsed (float): Seconds taken to get the page.
+        """
+
+    def __deepcopy__(self, memo):
+        # the configuration is copied by each client, the hooks collect for all of them
+        return self
+
+
+class EndpointStats(object):
+    """
+    Latencies and counts of the requests of an endpoint, see LatencyRecorder.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        """Number of requests which failed or got a status of 400 or more."""
+        self.retries = 0
+        self.rate_limited = 0
+        """Number of 429 responses."""
+        self.pages = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        """Number of requests per latency bucket, see LATENCY_BUCKETS."""
+
+    def percentile(self, percent):
+        """
+        Estimate a percentile of the latencies, from the histogram.
+
+        Args:
+            percent (float): The percentile, between 0 and 100.
+
+        Returns:
+            float: The upper bound of the bucket holding the percentile, or
+                the maximum latency for the last bucket. None if there were no
+                requests.
+        """
+        if not self.requests:
+            return None
+        rank = self.requests * percent / 100.0
+        count = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, self.histogram):
+            count += bucket_count
+            if count >= rank and count:
+                return min(bound, self.max_time)
+        return self.max_time
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: The counts, with the mean and the 50th, 90th and 99th
+                percentile latencies.
+        """
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'rate_limited': self.rate_limited,
+            'pages': self.pages,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'mean': self.total_time / self.requests if self.requests else None,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max_time,
+        }
+
+
+class LatencyRecorder(ClientHooks):
+    """
+    Hooks keeping a latency histogram and the bytes, retry and 429 counts of
+    each endpoint. Recording a request costs a lock and a few additions, so
+    it can be left on.
+
+    Example:
+        >>> recorder = LatencyRecorder()
+        >>> configuration.hooks = [recorder]
+        >>> # ... make calls ...
+        >>> for endpoint, stats in recorder.slowest(5):
+        ...     print(endpoint, stats.percentile(99))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def on_response(self, endpoint, method, url, status, elapsed, bytes_in, bytes_out):
+        with self._lock:
+            stats = self._get_stats(endpoint)
+            stats.requests += 1
+            if status is None or status >= 400:
+                stats.errors += 1
+            if status == 429:
+                stats.rate_limited += 1
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            stats.histogram[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    def on_retry(self, endpoint, retries, status, delay):
+        with self._lock:
+            self._get_stats(endpoint).retries += 1
+
+    def on_page(self, endpoint, page, items, elapsed):
+        with self._lock:
+            self._get_stats(endpoint).pages += 1
+
+    def stats(self):
+        """
+        Get the stats recorded so far.
+
+        Returns:
+            dict[tuple, EndpointStats]: The stats of each endpoint, which are
+                copies, left unchanged by later requests.
+        """
+        with self._lock:
+            result = {}
+            for endpoint, stats in self._stats.items():
+                copy = EndpointStats()
+                copy.__dict__.update(stats.__dict__)
+                copy.histogram = list(stats.histogram)
+                result[endpoint] = copy
+            return result
+
+    def slowest(self, count=10, percent=99):
+        """
+        Get the endpoints with the highest latency percentile.
+
+        Args:
+            count (int): Number of endpoints to return.
+            percent (float): The percentile to compare.
+
+        Returns:
+            list[tuple[tuple, EndpointStats]]: (endpoint, stats) pairs, the
+                slowest first.
+        """
+        stats = [item for item in self.stats().items() if item[1].requests]
+        stats.sort(key=lambda item: item[1].percentile(percent), reverse=True)
+        return stats[:count]
+
+    def reset(self):
+        """
+        Forget the stats recorded so far.
+        """
+        with self._lock:
+            self._stats = {}
+
+    def _get_stats(self, endpoint):
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            stats = self._stats[endpoint] = EndpointStats()
+        return stats
+
+
+def current_endpoint():
+    """
+    Returns:
+        tuple: The (api class name, api function name) of the API call being
+            sent, None outside of an API call.
+    """
+    return _current_endpoint.get()
+
+
+def call_endpoint(api_function, kwargs):
+    """
+    Call a Swagger-generated API function, with its endpoint known to the
+    hooks of the requests it sends. The result of an asyncio API function is
+    a coroutine which does the same when awaited.
+
+    Args:
+        api_function (function): The bound API function.
+        kwargs (dict): kwargs to pass to the function.
+    """
+    # the time since the previous attempt, e.g. waiting to retry it, is not
+    # part of the phases of a profiled call
+    profiling.skip()
+    endpoint = get_endpoint(api_function)
+    token = _current_endpoint.set(endpoint)
+    try:
+        result = api_function(**kwargs)
+    finally:
+        _current_endpoint.reset(token)
+    if inspect.isawaitable(result):
+        return _await_endpoint(endpoint, result)
+    return result
+
+
+def fire_hooks(hooks, callback, *args):
+    """
+    Call a callback of every hook, logging the exceptions they raise.
+
+    Args:
+        hooks (list[ClientHooks]): The hooks.
+        callback (str): The name of the callback, e.g. 'on_request'.
+        *args: The arguments of the callback.
+    """
+    for hook in hooks:
+        try:
+            getattr(hook, callback)(*args)
+        except Exception:
+            logger.exception("%s hook of %r failed", callback, hook)
+
+
+class PageHooks(object):
+    """
+    Wraps the API function an ItemIterator calls for the following pages, to
+    fire the `on_page` callback of the hooks.
+    """
+
+    def __init__(self, api_function, hooks):
+        self.api_function = api_function
+        self.hooks = hooks
+        self._page = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, **kwargs):
+        with self._lock:
+            self._page += 1
+            page = self._page
+        start = time.monotonic()
+        result = call_endpoint(self.api_function, kwargs)
+        if inspect.isawaitable(result):
+            return self._await_page(result, page, start)
+        self._fire(result, page, start)
+        return result
+
+    async def _await_page(self, result, page, start):
+        result = await result
+        self._fire(result, page, start)
+        return result
+
+    def _fire(self, result, page, start):
+        items = getattr(getattr(result, 'data', None), 'items', None)
+        fire_hooks(self.hooks, 'on_page', get_endpoint(self.api_function), page,
+                   len(items) if isinstance(items, list) else 0, time.monotonic() - start)
+
+
+async def _await_endpoint(endpoint, awaitable):
+    token = _current_endpoint.set(endpoint)
+    try:
+        return await awaitable
+    finally:
+        _current_endpoint.reset(token)
+
+
+def get_endpoint(api_function):
+    """
+    Args:
+        api_function (function): A bound Swagger-generated API function.
+
+    Returns:
+        tuple: The (api class name, api function name) of the function.
+    """
+    api_instance = getattr(api_function, '__self__', None)
+    return (type(api_instance).__name__ if api_instance is not None else None,
+            getattr(api_function, '__name__', None))
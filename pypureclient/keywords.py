@@ -7,6 +7,7 @@ class Parameters(object):
     limit = 'limit'
     offset = 'offset'
     sort = 'sort'
+    total_item_count = 'total_item_count'
     x_request_id = 'x_request_id'
 
 
@@ -0,0 +1,257 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import threading
+import time
+
+# Profile of the API call being made, None unless profiling
+_current_profile = contextvars.ContextVar('pypureclient_profile', default=None)
+
+# Phases the time of a call is broken into, in the order they happen
+PHASES = (
+    'params',       # parameters processed by the client and the API function
+    'url_encode',   # query string encoded
+    'send',         # request sent, waiting for the response headers
+    'body_read',    # response body read, and decompressed
+    'decode',       # body decoded from its charset, if not UTF-8
+    'json',         # body parsed
+    'models',       # models built from the parsed body
+    'pagination',   # following pages fetched while iterating the items
+)
+
+
+class CallProfile(object):
+    """
+    Breakdown of the wall time of an API call into phases, to tell whether a
+    slow call is waiting for the target or processing on the client side.
+
+    Phases are timed back to back on the thread making the call, each one
+    ending where the next one starts. Time which belongs to none of them,
+    e.g. waiting before a retry, is `other`. The pages fetched while
+    iterating the items of the response are added to `pagination` as they
+    are fetched, which is not part of `total`.
+    """
+
+    def __init__(self):
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        """Seconds spent in each phase, see PHASES."""
+        self.total = 0.0
+        """Seconds from the start of the call to the response."""
+        self.pages = 0
+        """Number of pages fetched while iterating the items."""
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._depth = 0
+        self._mark = time.perf_counter()
+
+    @property
+    def other(self):
+        """Seconds of `total` which belong to none of the phases."""
+        timed = sum(seconds for phase, seconds in self.phases.items() if phase != 'pagination')
+        return max(0.0, self.total - timed)
+
+    def lap(self, phase):
+        """
+        End a phase, which started where the previous one ended.
+
+        Args:
+            phase (str): The phase, see PHASES.
+        """
+        now = time.perf_counter()
+        self.phases[phase] += now - self._mark
+        self._mark = now
+
+    def skip(self):
+        """
+        Start the next phase now, leaving the time since the previous one
+        ended to `other`.
+        """
+        self._mark = time.perf_counter()
+
+    def add_page(self, seconds):
+        """
+        Add the fetch of a page of items, possibly from another thread.
+
+        Args:
+            seconds (float): Time taken to fetch the page.
+        """
+        with self._lock:
+            self.phases['pagination'] += seconds
+            self.pages += 1
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: Seconds of each phase, `other` and `total`, and the number
+                of pages.
+        """
+        result = dict(self.phases)
+        result['other'] = self.other
+        result['total'] = self.total
+        result['pages'] = self.pages
+        return result
+
+    def __str__(self):
+        lines = ['{:<12}{:>12}{:>8}'.format('phase', 'ms', '%')]
+        for phase, seconds in list(self.phases.items()) + [('other', self.other)]:
+            share = 100.0 * seconds / self.total if self.total and phase != 'pagination' else None
+            lines.append('{:<12}{:>12.3f}{:>8}'.format(phase, 1000 * seconds,
+                                                       '' if share is None else '{:.1f}'.format(share)))
+        lines.append('{:<12}{:>12.3f}'.format('total', 1000 * self.total))
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return 'CallProfile(total={:.6f}, phases={!r})'.format(self.total, self.phases)
+
+
+@contextlib.contextmanager
+def profile_call():
+    """
+    Profile the API calls made in the block, whatever the configuration of
+    their client. The profile covers the block from its start, so the
+    processing of the parameters of its first call is included; it adds up
+    the calls if the block makes more than one.
+
+    Example:
+        >>> with profile_call() as profile:
+        ...     response = client.get_volumes_performance()
+        >>> print(profile)
+
+    Yields:
+        CallProfile: The profile, also set as the `profile` of the responses.
+    """
+    profile = CallProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+def current_profile():
+    """
+    Returns:
+        CallProfile: The profile of the API call being made, None if it is
+            not profiled.
+    """
+    return _current_profile.get()
+
+
+def lap(phase):
+    """
+    End a phase of the API call being made, if it is profiled, see
+    `CallProfile.lap`.
+    """
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.lap(phase)
+
+
+def skip():
+    """
+    Leave the time since the last phase of the API call being made to
+    `other`, if it is profiled, see `CallProfile.skip`.
+    """
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.skip()
+
+
+def profiled(call_api):
+    """
+    Decorates the `_call_api` method of a client, to profile its calls if
+    `Configuration.profiling` is set, or within `profile_call`. The profile
+    is set as the `profile` of the response.
+    """
+    if inspect.iscoroutinefunction(call_api):
+        @functools.wraps(call_api)
+        async def profiled_call_api(client, *args, **kwargs):
+            call = _ProfiledCall(client)
+            if call.profile is None:
+                return await call_api(client, *args, **kwargs)
+            with call:
+                return call.done(await call_api(client, *args, **kwargs))
+    else:
+        @functools.wraps(call_api)
+        def profiled_call_api(client, *args, **kwargs):
+            call = _ProfiledCall(client)
+            if call.profile is None:
+                return call_api(client, *args, **kwargs)
+            with call:
+                return call.done(call_api(client, *args, **kwargs))
+    return profiled_call_api
+
+
+class PageProfile(object):
+    """
+    Wraps the API function an ItemIterator calls for the following pages, to
+    add their fetch to the profile of the first call.
+    """
+
+    def __init__(self, api_function, profile):
+        self.api_function = api_function
+        self.profile = profile
+
+    def __call__(self, **kwargs):
+        start = time.perf_counter()
+        # the page is not part of the phases of the call being profiled
+        token = _current_profile.set(None)
+        try:
+            result = self.api_function(**kwargs)
+        finally:
+            _current_profile.reset(token)
+        if inspect.isawaitable(result):
+            return self._await_page(result, start)
+        self.profile.add_page(time.perf_counter() - start)
+        return result
+
+    async def _await_page(self, result, start):
+        token = _current_profile.set(None)
+        try:
+            result = await result
+        finally:
+            _current_profile.reset(token)
+        self.profile.add_page(time.perf_counter() - start)
+        return result
+
+
+class _ProfiledCall(object):
+    """A call of `profiled`, from the call of the API function to its response."""
+
+    def __init__(self, client):
+        self.token = None
+        self.profile = _current_profile.get()
+        if self.profile is not None:
+            if self.profile._depth:
+                # a call made by the call being profiled, e.g. a coalesced
+                # request, its phases are part of the profile already
+                self.profile = None
+                return
+            if self.profile._calls:
+                self.profile.skip()
+            self.start = self.profile._mark
+            # in `profile_call`, the parameters of the first call were
+            # processed since the block started
+            self.profile.lap('params')
+        elif getattr(client._api_client.configuration, 'profiling', False):
+            self.profile = CallProfile()
+            self.start = self.profile._mark
+            self.token = _current_profile.set(self.profile)
+
+    def __enter__(self):
+        self.profile._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        profile = self.profile
+        profile._depth -= 1
+        profile._calls += 1
+        profile.total += time.perf_counter() - self.start
+        if self.token is not None:
+            _current_profile.reset(self.token)
+
+    def done(self, response):
+        if response is not None:
+            response.profile = self.profile
+        return response
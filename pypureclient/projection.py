@@ -0,0 +1,223 @@
+import contextvars
+import inspect
+import re
+
+from .exceptions import PureError
+from .properties import Property
+
+# Projection of the items of the responses of the API call being sent
+_current_projection = contextvars.ContextVar('pypureclient_projection', default=None)
+
+# Indexes of list properties, e.g. `[all]`, which don't name a field
+_INDEX = re.compile(r'\[\w*\]')
+
+
+class Projection(object):
+    """
+    The fields of the items of list responses the client deserializes. The
+    other fields are dropped from each item as soon as the JSON body is
+    decoded, and are left unset on the models, as if the target had not sent
+    them: reading one returns None, or raises AttributeError with
+    `model_attribute_error_on_none`. The models are still built field by
+    field, so a projection mostly saves building the nested objects left
+    out.
+
+    Fields are named as in the JSON bodies, or given as the Property of a
+    model, e.g. `flasharray.Volume.name`. A name which is not a field of the
+    model of the items fails once the response is deserialized. Fields of
+    nested objects are dotted, e.g. 'space.total_physical', or
+    `flasharray.Volume.space + flasharray.Space.total_physical`.
+    """
+
+    def __init__(self, fields):
+        """
+        Initialize a Projection.
+
+        Args:
+            fields (list[str or Property]): The fields to keep.
+
+        Raises:
+            PureError: If a field is not a str or a Property.
+        """
+        if isinstance(fields, (str, Property)):
+            fields = [fields]
+        # field name -> tree of the fields of its value, None for all of them
+        self._tree = {}
+        for field in fields:
+            names = _field_names(field)
+            node = self._tree
+            for name in names[:-1]:
+                if name in node and node[name] is None:
+                    # the whole value is kept already
+                    break
+                node = node.setdefault(name, {})
+            else:
+                node[names[-1]] = None
+        # model classes whose fields the projection names
+        self._validated = set()
+
+    @property
+    def fields(self):
+        """
+        Returns:
+            list[str]: The dotted names of the fields kept.
+        """
+        return sorted(_dotted_names(self._tree))
+
+    def validate(self, model_class):
+        """
+        Check the fields are fields of a model class, by their JSON names,
+        those of its nested models included.
+
+        Args:
+            model_class: The model class of the items.
+
+        Raises:
+            PureError: If a field is not a field of the model.
+        """
+        if model_class not in self._validated:
+            _validate(self._tree, model_class, '')
+            self._validated.add(model_class)
+
+    def project(self, item):
+        """
+        Args:
+            item (dict): An item as decoded from a JSON body.
+
+        Returns:
+            dict: The item with the fields of the projection only.
+        """
+        return _project(self._tree, item)
+
+    def project_body(self, data):
+        """
+        Args:
+            data (dict): A response as decoded from a JSON body.
+
+        Returns:
+            dict: The response, its items projected.
+        """
+        if isinstance(data, dict):
+            items = data.get('items')
+            if isinstance(items, list):
+                tree = self._tree
+                data['items'] = [_project(tree, item) for item in items]
+        return data
+
+    def wrap(self, deserializer):
+        """
+        Args:
+            deserializer (function): The function building an item from its
+                dict, None to leave it as a dict.
+
+        Returns:
+            function: A function building an item from its projected dict.
+        """
+        tree = self._tree
+        if deserializer is None:
+            return lambda item: _project(tree, item)
+        return lambda item: deserializer(_project(tree, item))
+
+    def __repr__(self):
+        return 'Projection({})'.format(self.fields)
+
+
+def current_projection():
+    """
+    Returns:
+        Projection: The projection of the items of the API call being sent,
+            None outside of an API call or if it has none.
+    """
+    return _current_projection.get()
+
+
+def get_projection(fields, api_function_name, configuration):
+    """
+    The projection of an API call: its fields if given, else the
+    `default_fields` of the configuration for the GETs.
+
+    Args:
+        fields (list[str or Property]): The fields of the call. An empty
+            list keeps every field.
+        api_function_name (str): Swagger-generated function to call.
+        configuration: The configuration of the client.
+
+    Returns:
+        Projection: None if every field is kept.
+    """
+    if fields is None:
+        if not api_function_name.endswith('_get_with_http_info'):
+            return None
+        fields = getattr(configuration, 'default_fields', None)
+    if not fields:
+        return None
+    return Projection(fields)
+
+
+class ProjectedFunction(object):
+    """
+    Wraps a Swagger-generated API function, so that the items of its
+    responses are projected. It stands for the function wherever the client
+    passes it on, e.g. to the ItemIterator calling it for the following
+    pages.
+    """
+
+    def __init__(self, api_function, projection):
+        self.api_function = api_function
+        self.projection = projection
+        # the endpoint of the function, see hooks.get_endpoint
+        self.__self__ = getattr(api_function, '__self__', None)
+        self.__name__ = getattr(api_function, '__name__', None)
+
+    def __call__(self, **kwargs):
+        token = _current_projection.set(self.projection)
+        try:
+            result = self.api_function(**kwargs)
+        finally:
+            _current_projection.reset(token)
+        if inspect.isawaitable(result):
+            return self._await(result)
+        return result
+
+    async def _await(self, awaitable):
+        token = _current_projection.set(self.projection)
+        try:
+            return await awaitable
+        finally:
+            _current_projection.reset(token)
+
+
+def _field_names(field):
+    if isinstance(field, Property):
+        field = field.value
+    if not isinstance(field, str) or not field:
+        raise PureError('Field {!r} is not a str or a Property'.format(field))
+    return _INDEX.sub('', field).split('.')
+
+
+def _dotted_names(tree, prefix=''):
+    for name, sub_tree in tree.items():
+        if sub_tree is None:
+            yield prefix + name
+        else:
+            yield from _dotted_names(sub_tree, prefix + name + '.')
+
+
+def _validate(tree, model_class, prefix):
+    fields = {field.alias: field for field in model_class.__fields__.values()}
+    for name, sub_tree in tree.items():
+        field = fields.get(name)
+        if field is None:
+            raise PureError("Unknown field '{}' for {}, expected one of {}".format(
+                prefix + name, model_class.__name__, ', '.join(sorted(fields))))
+        if sub_tree is not None and hasattr(field.type_, '__fields__'):
+            _validate(sub_tree, field.type_, prefix + name + '.')
+
+
+def _project(tree, value):
+    if isinstance(value, dict):
+        return {name: value[name] if sub_tree is None else _project(sub_tree, value[name])
+                for name, sub_tree in tree.items() if name in value}
+    if isinstance(value, list):
+        return [_project(tree, v) for v in value]
+    return value
@@ -6,7 +6,9 @@ from typing import Union, Tuple
 from .__modules_dict import __modules_dict as pure1_modules_dict
 from .._version import __default_user_agent__
 from .._helpers import create_transport_config
+from ..async_client import to_async_client
 from ..configuration import Configuration
+from ..retry_policy import RetryPolicy
 
 
 pure1_modules = {}
@@ -26,7 +28,7 @@ def Client(
     id_token: str = None,
     private_key_file: str = None,
     private_key_password: str = None,
-    retries: int = __RETRIES_DEFAULT,
+    retries: Union[int, RetryPolicy] = __RETRIES_DEFAULT,
     timeout: Union[int, Tuple[float, float]] = __TIMEOUT_DEFAULT,
     configuration: Configuration = None,
     model_attribute_error_on_none: bool = True):
@@ -56,8 +58,9 @@ def Client(
     :type private_key_password: str, optional
 
     :param retries: The number of times to retry an API call if
-        it failed for a non-blocking reason. Defaults to 5.
-    :type retries: int, optional
+        it failed for a non-blocking reason, or the RetryPolicy of the
+        calls. Defaults to 5.
+    :type retries: int or RetryPolicy, optional
 
     :param timeout: The timeout
         duration in seconds, either in total time or (connect and read)
@@ -89,6 +92,35 @@ def Client(
     return client
 
 
+def AsyncClient(
+    version: str = __DEFAULT_VERSION,
+    app_id: str = None,
+    id_token: str = None,
+    private_key_file: str = None,
+    private_key_password: str = None,
+    retries: Union[int, RetryPolicy] = __RETRIES_DEFAULT,
+    timeout: Union[int, Tuple[float, float]] = __TIMEOUT_DEFAULT,
+    configuration: Configuration = None,
+    model_attribute_error_on_none: bool = True):
+    """
+    Initialize an asyncio Pure1 Client.
+
+    Takes the same parameters as `Client`. The authentication is done while the
+    client is created, then every API method returns a coroutine, e.g.
+    `response = await client.get_arrays()`, and the items of a ValidResponse
+    are iterated with `async for`. Requests are sent through a non-blocking
+    transport, so a single event loop can keep many of them in flight. Proxies
+    are not supported.
+
+    :raises PureError: If it could not create an ID or access token
+    """
+    client = Client(version=version, app_id=app_id, id_token=id_token, private_key_file=private_key_file,
+                    private_key_password=private_key_password, retries=retries, timeout=timeout,
+                    configuration=configuration, model_attribute_error_on_none=model_attribute_error_on_none)
+    # Pure1 signals an expired access token with 403
+    return to_async_client(client, auth_error_status=403, final_error_statuses=(400, 404))
+
+
 def __version_to_module(version):
     if version not in set(pure1_modules_dict.keys()):
         msg = "version {} not supported".format(version)
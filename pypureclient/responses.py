@@ -1,7 +1,16 @@
+import collections
 import pprint
+import queue
+import threading
+
+from concurrent import futures
 
 from .keywords import Headers, Parameters
 from .exceptions import PureError
+from .hooks import PageHooks
+from .profiling import PageProfile, current_profile
+from .tracing import PageSpans, set_item_count
+from ._transport.json_stream import JSONItemStream
 
 class ResponseHeaders(object):
     """
@@ -66,6 +75,9 @@ class Response(object):
     An abstract response that is extended to a valid or error response.
     """
 
+    profile = None
+    """CallProfile of the call, if it was profiled."""
+
     def __init__(self, status_code, headers):
         """
         Initialize a Response.
@@ -120,7 +132,9 @@ class ValidResponse(Response):
         """
         new_dict = dict(self.__dict__)
         if isinstance(self.items, ItemIterator):
-            new_dict['items'] = [item.to_dict(include_readonly=True) for item in list(self.items)]
+            # items of a client configured with raw_items are dicts already
+            new_dict['items'] = [item if isinstance(item, dict) else item.to_dict(include_readonly=True)
+                                 for item in list(self.items)]
 
         new_dict['headers'] = (self.headers.to_dict
                                if self.headers is not None else None)
@@ -129,6 +143,8 @@ class ValidResponse(Response):
             new_dict['total'] = [item.to_dict(include_readonly=True) for item in self.total]
         if hasattr(self, 'errors') and isinstance(self.errors, list):
             new_dict['errors'] = [item.to_dict(include_readonly=True) for item in self.errors]
+        if self.profile is not None:
+            new_dict['profile'] = self.profile.to_dict()
         return new_dict
 
     def __repr__(self):
@@ -176,6 +192,8 @@ class ErrorResponse(Response):
         new_dict['errors'] = [err.to_dict() for err in new_dict['errors']]
         new_dict['headers'] = (self.headers.to_dict
                                if self.headers is not None else None)
+        if self.profile is not None:
+            new_dict['profile'] = self.profile.to_dict()
         return new_dict
 
     def __repr__(self):
@@ -232,7 +250,8 @@ class ItemIterator(object):
     """
 
     def __init__(self, api_endpoint, kwargs,  continuation_token,
-                 total_item_count, items, x_request_id, more_items_remaining=None, stop_on_limit=True):
+                 total_item_count, items, x_request_id, more_items_remaining=None, stop_on_limit=True,
+                 configuration=None):
         """
         Initialize an ItemIterator.
 
@@ -245,8 +264,27 @@ class ItemIterator(object):
             total_item_count (int): The total number of items available in the
                 collection.
             items (list[object]): The items returned from the initial response.
+                A JSONItemStream if the call was made with
+                `_preload_content=False` and `Configuration.stream_items`, in
+                which case the items of every page are decoded one at a time
+                as they are read.
             x_request_id (str): The X-Request-ID to use for all subsequent calls.
-        """
+            configuration (Configuration): The configuration of the client which
+                made the initial call. Enables the pagination options it sets.
+        """
+        if api_endpoint is not None:
+            # the following pages are spans of the trace of the call
+            api_endpoint = PageSpans.wrap(api_endpoint, configuration)
+        if isinstance(items, list):
+            set_item_count(len(items))
+        hooks = getattr(configuration, 'hooks', None)
+        if hooks and api_endpoint is not None:
+            # the following pages are reported to the hooks
+            api_endpoint = PageHooks(api_endpoint, hooks)
+        profile = current_profile()
+        if profile is not None and api_endpoint is not None:
+            # the following pages are added to the profile of the call
+            api_endpoint = PageProfile(api_endpoint, profile)
         self._api_endpoint = api_endpoint
         self._kwargs = kwargs
         self._continuation_token = continuation_token
@@ -254,9 +292,23 @@ class ItemIterator(object):
         self._more_items_remaining = more_items_remaining
         self._items = items
         self._x_request_id = x_request_id
-        self.__stop_on_limit = stop_on_limit
-        self.__index = 0
-        self.__page = 0   # helps to calculate offset properly
+        self._stop_on_limit = stop_on_limit
+        self._index = 0
+        self._page = 0   # helps to calculate offset properly
+        self._page_fetcher = None
+        self._parallel = False
+        parallel_pages = getattr(configuration, 'parallel_pages', 0)
+        prefetch_pages = getattr(configuration, 'prefetch_pages', 0)
+        if parallel_pages and self._can_fetch_parallel():
+            self.parallel(parallel_pages, getattr(configuration, 'parallel_pages_ordered', True))
+        elif prefetch_pages:
+            self.prefetch(prefetch_pages)
+
+    def __del__(self):
+        if getattr(self, '_page_fetcher', None) is not None:
+            self._page_fetcher.stop()
+        if isinstance(getattr(self, '_items', None), JSONItemStream):
+            self._items.close()
 
     def __iter__(self):
         """
@@ -279,23 +331,21 @@ class ItemIterator(object):
             StopIteration: If there are no more items to return, or if there
                 was an error calling the API.
         """
-        # If we've reached the end of the desired limit, stop
-        if self._kwargs.get(Parameters.limit, None) is not None and self.__stop_on_limit and self._kwargs.get(Parameters.limit, None) <= self.__index:
-            raise StopIteration
-        # If we've reached the end of all possible items, stop
-        if self._total_item_count is not None and self._total_item_count <= self.__index:
+        if self._is_exhausted():
             raise StopIteration
+        if isinstance(self._items, JSONItemStream):
+            return self._next_streamed_item()
         # If we've reached the end of the current collection, get more data
-        if self.__index == len(self._items):
+        if self._index == len(self._items):
             if self._more_items_remaining is False:
                 raise StopIteration
             self._refresh_data()
-            self.__index = 0
-            self.__page += 1
+            self._index = 0
+            self._page += 1
         # Return the next item in the current list if possible
-        if self.__index < len(self._items):
-            to_return = self._items[self.__index]
-            self.__index += 1
+        if self._index < len(self._items):
+            to_return = self._items[self._index]
+            self._index += 1
             return to_return
         # If no new data was given, just stop
         raise StopIteration
@@ -313,6 +363,136 @@ class ItemIterator(object):
         """
         return self._total_item_count or len(self._items)
 
+    def _next_streamed_item(self):
+        """
+        Get the next item of a streamed collection, requesting the next page
+        once the current one is read entirely.
+
+        Returns:
+            object
+
+        Raises:
+            StopIteration: If there are no more items to return.
+        """
+        while True:
+            for item in self._items:
+                self._index += 1
+                return item
+            # The members following the items are known once they are read
+            self._update_state(self._items.body)
+            if self._more_items_remaining is False:
+                raise StopIteration
+            self._refresh_data()
+            self._index = 0
+            self._page += 1
+            if self._is_exhausted():
+                raise StopIteration
+
+    def prefetch(self, pages):
+        """
+        Fetch up to `pages` next pages on a background thread while the current
+        one is consumed, instead of fetching a page only once the previous one
+        is used up. Errors are raised when the page that failed is reached.
+        Pages which were already fetched are not refetched.
+
+        Args:
+            pages (int): The maximum number of pages to keep buffered. 0
+                disables prefetching.
+
+        Returns:
+            ItemIterator: self, so it can be chained on `response.items`.
+        """
+        self._stop_page_fetcher()
+        if pages and self._has_more_pages():
+            self._page_fetcher = _PagePrefetcher(self._api_endpoint, self._kwargs,
+                                               self._continuation_token, len(self._items),
+                                               self._page, self._x_request_id, pages)
+        return self
+
+    def parallel(self, concurrency, ordered=True):
+        """
+        Fetch all the remaining pages concurrently, by splitting the offset
+        range given by the total item count into pages of the size of the
+        current one. Requires the initial call to be made with
+        `total_item_count=True`, otherwise pages are fetched one at a time.
+        Errors are raised when the page that failed is reached.
+
+        Args:
+            concurrency (int): The maximum number of pages requested at once,
+                which is also the maximum number of pages buffered.
+            ordered (bool, optional): If False, pages are returned as soon as
+                they are received instead of in the order of the collection.
+                Defaults to True.
+
+        Returns:
+            ItemIterator: self, so it can be chained on `response.items`.
+        """
+        self._stop_page_fetcher()
+        if concurrency and self._can_fetch_parallel():
+            page_size = len(self._items)
+            first_offset = (self._kwargs.get(Parameters.offset, None) or 0) + page_size * (self._page + 1)
+            self._page_fetcher = _ParallelPageFetcher(self._api_endpoint, self._kwargs,
+                                                      range(first_offset, self._total_item_count, page_size),
+                                                      self._x_request_id, concurrency, ordered)
+            self._parallel = True
+        return self
+
+    def _stop_page_fetcher(self):
+        """
+        Stop the current prefetching or parallel fetching of pages, if any.
+        """
+        if self._page_fetcher is not None:
+            self._page_fetcher.stop()
+            self._page_fetcher = None
+        self._parallel = False
+
+    def _can_fetch_parallel(self):
+        """
+        Check whether the offsets of the pages after the current one are known.
+
+        Returns:
+            bool
+        """
+        # A continuation token passed by the caller hides the offset of the first page
+        return (self._total_item_count is not None and len(self._items) > 0 and
+                self._kwargs.get(Parameters.continuation_token, None) is None and
+                self._has_more_pages())
+
+    def _has_more_pages(self):
+        """
+        Check whether pages after the current one may be requested.
+
+        Returns:
+            bool
+        """
+        if self._more_items_remaining is False:
+            return False
+        # Streamed pages are requested once the previous one is read
+        if isinstance(self._items, JSONItemStream):
+            return False
+        # With a limit and no auto pagination only the first page is used
+        if self._kwargs.get(Parameters.limit, None) is not None and self._stop_on_limit:
+            return False
+        if self._total_item_count is not None and self._total_item_count <= len(self._items):
+            return False
+        return True
+
+    def _is_exhausted(self):
+        """
+        Check whether the desired limit or the end of the collection has been
+        reached.
+
+        Returns:
+            bool
+        """
+        # If we've reached the end of the desired limit, stop
+        if self._kwargs.get(Parameters.limit, None) is not None and self._stop_on_limit and self._kwargs.get(Parameters.limit, None) <= self._index:
+            return True
+        # If we've reached the end of all possible items, stop
+        if self._total_item_count is not None and self._total_item_count <= self._index:
+            return True
+        return False
+
     def _refresh_data(self):
         """
         Call the API to collect more items and updates the internal state.
@@ -320,13 +500,16 @@ class ItemIterator(object):
         Raises:
             StopIteration: If there was an error calling the API.
         """
-        # Use continuation token if provided
-        if self._continuation_token is not None:
-            self._kwargs[Parameters.continuation_token] = self._continuation_token
-        else: # Use offset otherwise (no continuation token with sorts)
-            self._kwargs[Parameters.offset] = len(self._items) * (self.__page + 1)
-        if self._x_request_id is not None:
-            self._kwargs[Parameters.x_request_id] = self._x_request_id
+        if self._page_fetcher is not None:
+            body = self._page_fetcher.next_page()
+            if body is None:
+                raise StopIteration
+            self._update_state(body)
+            if self._parallel:
+                # Pages may come out of order, only the fetcher knows when the last one is returned
+                self._more_items_remaining = self._page_fetcher.has_more_pages()
+            return
+        self._prepare_next_page()
         # Call the API again and update internal state
         body = None
         try:
@@ -339,10 +522,328 @@ class ItemIterator(object):
         if body is None:
             raise StopIteration
 
+        self._update_state(body)
+
+    def _prepare_next_page(self):
+        """
+        Update the kwargs of the initial call to request the next page.
+        """
+        # Use continuation token if provided
+        if self._continuation_token is not None:
+            self._kwargs[Parameters.continuation_token] = self._continuation_token
+        else: # Use offset otherwise (no continuation token with sorts)
+            self._kwargs[Parameters.offset] = len(self._items) * (self._page + 1)
+        if self._x_request_id is not None:
+            self._kwargs[Parameters.x_request_id] = self._x_request_id
+
+    def _update_state(self, body):
+        """
+        Update the internal state from the body of a page response.
+
+        Args:
+            body (object): The deserialized response body.
+        """
         # *-get-response models have "continuation_token" attribute. Other models don't have them.
         self._continuation_token = getattr(body, "continuation_token", None)
         self._more_items_remaining = getattr(body, "more_items_remaining", None)
         if self._more_items_remaining is None:
             self._more_items_remaining = self._continuation_token is not None
+        # The count of a streamed response may follow its items
+        if self._total_item_count is None:
+            self._total_item_count = getattr(body, "total_item_count", None)
 
         self._items = body.items
+
+
+class _PagePrefetcher(object):
+    """
+    Fetches the pages following the current page of an ItemIterator on a
+    background thread and buffers a bounded number of them.
+    """
+
+    _PUT_TIMEOUT = 0.5
+    # Queued after the last page
+    _END = object()
+
+    def __init__(self, api_endpoint, kwargs, continuation_token, page_size, page, x_request_id, pages):
+        """
+        Initialize a _PagePrefetcher and start fetching.
+
+        Args:
+            api_endpoint (function): The function that corresponds to the
+                internal API call.
+            kwargs (dict): The kwargs of the initial call.
+            continuation_token (str): The continuation token of the current page.
+                May be None, in which case pages are requested by offset.
+            page_size (int): The number of items in the current page.
+            page (int): The index of the current page.
+            x_request_id (str): The X-Request-ID to use for all subsequent calls.
+            pages (int): The maximum number of pages to buffer.
+        """
+        self._pages = queue.Queue(maxsize=pages)
+        self._stopped = threading.Event()
+        # set once the last page or an error was taken, the thread is done
+        self._ended = False
+        self._error = None
+        # the thread must not reference the prefetcher, so an abandoned
+        # iterator can be collected and stop it
+        thread = threading.Thread(target=_PagePrefetcher._run,
+                                  args=(self._pages, self._stopped, api_endpoint, dict(kwargs),
+                                        continuation_token, page_size, page, x_request_id),
+                                  daemon=True)
+        thread.start()
+
+    def next_page(self):
+        """
+        Wait for the next page.
+
+        Returns:
+            object: The deserialized response body, None if there was no data
+                or the last page was already returned.
+
+        Raises:
+            PureError: If there was an error calling the API, again on every
+                later call.
+        """
+        if self._error is not None:
+            raise PureError('Failed to collect more items: {}'.format(self._error))
+        if self._ended:
+            return None
+        body = self._pages.get()
+        if body is _PagePrefetcher._END or body is None:
+            self._ended = True
+            return None
+        if isinstance(body, Exception):
+            self._error = body
+            # Generic errors for pagination
+            raise PureError('Failed to collect more items: {}'.format(body))
+        return body
+
+    def stop(self):
+        """
+        Stop fetching pages.
+        """
+        self._stopped.set()
+
+    @staticmethod
+    def _run(pages, stopped, api_endpoint, kwargs, continuation_token, page_size, page, x_request_id):
+        while not stopped.is_set():
+            # Use continuation token if provided
+            if continuation_token is not None:
+                kwargs[Parameters.continuation_token] = continuation_token
+            else: # Use offset otherwise (no continuation token with sorts)
+                kwargs[Parameters.offset] = page_size * (page + 1)
+            if x_request_id is not None:
+                kwargs[Parameters.x_request_id] = x_request_id
+            try:
+                body = api_endpoint(**dict(kwargs)).data
+            except Exception as e:
+                _PagePrefetcher._put(pages, stopped, e)
+                return
+            _PagePrefetcher._put(pages, stopped, body)
+            if body is None:
+                return
+            continuation_token = getattr(body, "continuation_token", None)
+            more_items_remaining = getattr(body, "more_items_remaining", None)
+            if more_items_remaining is None:
+                more_items_remaining = continuation_token is not None
+            if not more_items_remaining:
+                _PagePrefetcher._put(pages, stopped, _PagePrefetcher._END)
+                return
+            page_size = len(body.items)
+            page += 1
+
+    @staticmethod
+    def _put(pages, stopped, value):
+        while not stopped.is_set():
+            try:
+                pages.put(value, timeout=_PagePrefetcher._PUT_TIMEOUT)
+                return
+            except queue.Full:
+                pass
+
+
+class _ParallelPageFetcher(object):
+    """
+    Fetches the pages at the given offsets of a collection concurrently on a
+    thread pool, keeping a bounded number of requests in flight.
+    """
+
+    def __init__(self, api_endpoint, kwargs, offsets, x_request_id, concurrency, ordered):
+        """
+        Initialize a _ParallelPageFetcher and start fetching.
+
+        Args:
+            api_endpoint (function): The function that corresponds to the
+                internal API call.
+            kwargs (dict): The kwargs of the initial call.
+            offsets (range): The offsets of the pages to fetch.
+            x_request_id (str): The X-Request-ID to use for all subsequent calls.
+            concurrency (int): The maximum number of requests in flight.
+            ordered (bool): Whether pages are returned in the order of offsets.
+        """
+        self._api_endpoint = api_endpoint
+        self._kwargs = dict(kwargs)
+        self._kwargs.pop(Parameters.continuation_token, None)
+        # The count is known already, don't have the server compute it again
+        self._kwargs.pop(Parameters.total_item_count, None)
+        if x_request_id is not None:
+            self._kwargs[Parameters.x_request_id] = x_request_id
+        self._offsets = iter(offsets)
+        self._ordered = ordered
+        self._executor = futures.ThreadPoolExecutor(max_workers=concurrency)
+        self._pending = collections.deque()
+        for _ in range(concurrency):
+            self._submit_next()
+
+    def _submit_next(self):
+        offset = next(self._offsets, None)
+        if offset is not None:
+            kwargs = dict(self._kwargs)
+            kwargs[Parameters.offset] = offset
+            self._pending.append(self._executor.submit(self._api_endpoint, **kwargs))
+        elif not self._pending:
+            self._executor.shutdown(wait=False)
+
+    def has_more_pages(self):
+        """
+        Check whether pages are left to be returned.
+
+        Returns:
+            bool
+        """
+        return bool(self._pending)
+
+    def next_page(self):
+        """
+        Wait for the next page.
+
+        Returns:
+            object: The deserialized response body, None if there are no more
+                pages or there was no data.
+
+        Raises:
+            PureError: If there was an error calling the API.
+        """
+        if not self._pending:
+            return None
+        if self._ordered:
+            future = self._pending.popleft()
+        else:
+            done, _ = futures.wait(self._pending, return_when=futures.FIRST_COMPLETED)
+            future = next(f for f in self._pending if f in done)
+            self._pending.remove(future)
+        try:
+            body = future.result().data
+        except Exception as e:
+            self.stop()
+            # Generic errors for pagination
+            raise PureError('Failed to collect more items: {}'.format(e))
+        self._submit_next()
+        return body
+
+    def stop(self):
+        """
+        Stop fetching pages.
+        """
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False)
+
+
+class AsyncItemIterator(ItemIterator):
+    """
+    An asynchronous iterator for items of a collection returned by the server,
+    for clients whose API calls are coroutines. Use it with `async for`.
+    """
+
+    @classmethod
+    def from_item_iterator(cls, iterator):
+        """
+        Create an AsyncItemIterator continuing from the state of an ItemIterator.
+
+        Args:
+            iterator (ItemIterator): The iterator built for the initial response.
+
+        Returns:
+            AsyncItemIterator
+        """
+        iterator._stop_page_fetcher()
+        result = cls.__new__(cls)
+        result.__dict__.update(iterator.__dict__)
+        return result
+
+    def prefetch(self, pages):
+        """
+        Not supported, pages of an AsyncItemIterator are awaited on demand.
+        """
+        raise TypeError("'AsyncItemIterator' does not prefetch pages")
+
+    def parallel(self, concurrency, ordered=True):
+        """
+        Not supported, pages of an AsyncItemIterator are awaited on demand.
+        """
+        raise TypeError("'AsyncItemIterator' does not fetch pages in parallel")
+
+    def __next__(self):
+        raise TypeError("'AsyncItemIterator' must be iterated with 'async for'")
+
+    next = __next__
+
+    def __aiter__(self):
+        """
+        Creates a new asynchronous iterator.
+
+        Returns:
+            AsyncItemIterator
+        """
+        return self
+
+    async def __anext__(self):
+        """
+        Get the next item in the collection. If there are no items left to get
+        from the last response, it awaits the API again to get more items.
+
+        Returns:
+            object
+
+        Raises:
+            StopAsyncIteration: If there are no more items to return.
+            PureError: If there was an error calling the API.
+        """
+        if self._is_exhausted():
+            raise StopAsyncIteration
+        if self._index == len(self._items):
+            if self._more_items_remaining is False:
+                raise StopAsyncIteration
+            await self._async_refresh_data()
+            self._index = 0
+            self._page += 1
+        if self._index < len(self._items):
+            to_return = self._items[self._index]
+            self._index += 1
+            return to_return
+        raise StopAsyncIteration
+
+    async def _async_refresh_data(self):
+        """
+        Await the API to collect more items and updates the internal state.
+
+        Raises:
+            StopAsyncIteration: If the API returned no data.
+            PureError: If there was an error calling the API.
+        """
+        self._prepare_next_page()
+        body = None
+        try:
+            response = await self._api_endpoint(**self._kwargs)
+            body = response.data
+        except Exception as e:
+            # Generic errors for pagination
+            raise PureError('Failed to collect more items: {}'.format(e))
+
+        if body is None:
+            raise StopAsyncIteration
+
+        self._update_state(body)
@@ -0,0 +1,390 @@
+import collections
+import contextlib
+import contextvars
+import email.utils
+import logging
+import random
+import threading
+import time
+
+from typing import Deque, List, Optional
+
+import urllib3
+
+from .hooks import fire_hooks
+from .keywords import Headers
+from ._transport.exceptions import ApiConnectionError
+from .tracing import add_retry
+
+logger = logging.getLogger(__name__)
+
+# Statuses retried by default: rate limiting, and the server errors other than
+# an internal error, which may not persist in the next call
+DEFAULT_RETRY_STATUSES = frozenset([429] + list(range(501, 600)))
+
+# What a call does after it failed with an error status, see
+# `CallRetries.status_error_action`
+RETURN_ERROR = 'return_error'
+REFRESH_AUTH = 'refresh_auth'
+RETRY = 'retry'
+RAISE_ERROR = 'raise_error'
+
+# Policy of the API calls made in a `retrying` block, instead of the one of
+# their client
+_current_policy = contextvars.ContextVar('pypureclient_retry_policy', default=None)
+
+
+class RetryBudget(object):
+    """
+    Caps the retries of every client sharing the budget to a ratio of their
+    calls over a sliding time window, so that a failing target is not sent a
+    storm of retries on top of the calls it already fails.
+
+    A retry is allowed while the retries of the window are fewer than
+    `ratio` times the calls of the window, plus `min_retries_per_second`
+    times the length of the window, which lets a client making few calls
+    retry them.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 1.0, window: float = 10.0):
+        """
+        Initialize a RetryBudget.
+
+        Args:
+            ratio (float): Retries allowed per call.
+            min_retries_per_second (float): Retries allowed regardless of the
+                number of calls.
+            window (float): Seconds over which calls and retries are counted.
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._lock = threading.Lock()
+        # [second, calls, retries] for each second of the window
+        self._counts: Deque[List[int]] = collections.deque()
+
+    def add_call(self):
+        """
+        Count a call, which adds to the retries allowed.
+        """
+        with self._lock:
+            self._current_counts()[1] += 1
+
+    def withdraw(self):
+        """
+        Count a retry if the budget allows it.
+
+        Returns:
+            bool: True if the retry may be sent.
+        """
+        with self._lock:
+            counts = self._current_counts()
+            calls = sum(c[1] for c in self._counts)
+            retries = sum(c[2] for c in self._counts)
+            if retries >= self.ratio * calls + self.min_retries_per_second * self.window:
+                return False
+            counts[2] += 1
+            return True
+
+    def _current_counts(self):
+        second = int(time.monotonic())
+        while self._counts and self._counts[0][0] <= second - self.window:
+            self._counts.popleft()
+        if not self._counts or self._counts[-1][0] != second:
+            self._counts.append([second, 0, 0])
+        return self._counts[-1]
+
+
+# Budget shared by the clients of the process unless given their own
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+class RetryPolicy(object):
+    """
+    Rules for retrying the API calls of a client which failed for a reason
+    that may not persist in the next call.
+
+    Retries wait for an exponential backoff, `backoff_factor` times 2 to the
+    power of the number of retries made, capped to `backoff_max`. With
+    jitter, the wait is drawn uniformly between 0 and that backoff, so that
+    clients failing together don't retry together. A Retry-After header of
+    the response, or the rate limit headers of a 429 response, set the wait
+    instead.
+    """
+
+    def __init__(self,
+                 max_retries: int = 5,
+                 backoff_factor: float = 0.5,
+                 backoff_max: float = 30.0,
+                 jitter: bool = True,
+                 retry_statuses=DEFAULT_RETRY_STATUSES,
+                 status_retries: Optional[dict] = None,
+                 retry_connection_errors: bool = True,
+                 respect_retry_after: bool = True,
+                 max_retry_after: float = 60.0,
+                 budget: RetryBudget = DEFAULT_RETRY_BUDGET):
+        """
+        Initialize a RetryPolicy.
+
+        Args:
+            max_retries (int): Number of times a call is retried.
+            backoff_factor (float): Seconds to wait before the first retry.
+            backoff_max (float): Maximum number of seconds between retries.
+            jitter (bool): Whether to wait a random time up to the backoff.
+            retry_statuses (collection of int): HTTP statuses which are
+                retried. Defaults to 429 and the statuses above 500.
+            status_retries (dict[int, int]): Number of times a call is
+                retried for the given statuses, if less than max_retries.
+            retry_connection_errors (bool): Whether to retry calls which failed
+                to connect, or GET calls whose connection failed afterwards.
+            respect_retry_after (bool): Whether to wait as told by a
+                Retry-After header.
+            max_retry_after (float): Maximum number of seconds to wait as told
+                by a response. The error is returned if the wait is longer.
+            budget (RetryBudget): Budget the retries are taken from, shared by
+                every client of the process by default. None for no budget.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.status_retries = dict(status_retries or {})
+        self.retry_connection_errors = retry_connection_errors
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+
+    @classmethod
+    def from_retries(cls, retries):
+        """
+        Get the policy of the `retries` parameter of a client.
+
+        Args:
+            retries (int or RetryPolicy): A number of retries or a policy. None
+                for the default policy.
+
+        Returns:
+            RetryPolicy
+        """
+        if isinstance(retries, RetryPolicy):
+            return retries
+        if retries is None:
+            return cls()
+        return cls(max_retries=retries)
+
+    def start(self, hooks=None, endpoint=None):
+        """
+        Start counting the retries of a call, under the policy of the
+        enclosing `retrying` block if any, else this one.
+
+        Args:
+            hooks (list[ClientHooks]): Hooks told about the retries.
+            endpoint (tuple): The (api class name, api function name) of the
+                call, for the hooks.
+
+        Returns:
+            CallRetries
+        """
+        return CallRetries(_current_policy.get() or self, hooks, endpoint)
+
+    def backoff(self, retries):
+        """
+        Get the number of seconds to wait before a retry.
+
+        Args:
+            retries (int): Number of retries already made.
+
+        Returns:
+            float
+        """
+        backoff = min(self.backoff_max, self.backoff_factor * (2 ** retries))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def __repr__(self):
+        return 'RetryPolicy(max_retries={!r}, backoff_factor={!r}, backoff_max={!r})'.format(
+            self.max_retries, self.backoff_factor, self.backoff_max)
+
+
+@contextlib.contextmanager
+def retrying(policy):
+    """
+    Retry the API calls made in the block under a policy, whatever the
+    policy of their client.
+
+    Example:
+        >>> with retrying(RetryPolicy(max_retries=0)):
+        ...     response = client.post_volumes(names=['vol1'], volume=volume)
+
+    Args:
+        policy (int or RetryPolicy): A number of retries or a policy.
+
+    Yields:
+        RetryPolicy: The policy.
+    """
+    policy = RetryPolicy.from_retries(policy)
+    token = _current_policy.set(policy)
+    try:
+        yield policy
+    finally:
+        _current_policy.reset(token)
+
+
+class CallRetries(object):
+    """
+    Retries of one call under a RetryPolicy.
+    """
+
+    def __init__(self, policy, hooks=None, endpoint=None):
+        self.policy = policy
+        self.hooks = hooks
+        self.endpoint = endpoint
+        self.remaining = policy.max_retries
+        """Number of retries left."""
+        self._retries = 0
+        self._status_retries = collections.Counter()
+        if policy.budget is not None:
+            policy.budget.add_call()
+
+    def retries_status(self, status):
+        """
+        Returns:
+            bool: True if the policy retries calls failing with the status.
+        """
+        return status in self.policy.retry_statuses
+
+    def status_error_action(self, status, headers, auth_error_status=401, final_error_statuses=(400, 403, 404)):
+        """
+        Decide what a call does after it failed with an error status, taking
+        a retry if it is retried.
+
+        Args:
+            status (int): The HTTP status of the response.
+            headers (dict): The headers of the response.
+            auth_error_status (int): The status for which the access token is
+                refreshed, and the call retried once.
+            final_error_statuses (tuple): The statuses returned without
+                retrying, the call will never succeed.
+
+        Returns:
+            tuple: (action, delay). The action is RETURN_ERROR to return the
+                error, REFRESH_AUTH to refresh the access token and retry,
+                RETRY to retry after `delay` seconds, or RAISE_ERROR to raise
+                the error.
+        """
+        if self.remaining == 0 or status in final_error_statuses:
+            return RETURN_ERROR, None
+        if status == auth_error_status:
+            # the call is retried once with a new token, and not again
+            self.remaining = 0
+            return REFRESH_AUTH, None
+        if self.retries_status(status):
+            delay = self.status_delay(status, headers)
+            # out of retries, or told to wait too long
+            if delay is None:
+                return RETURN_ERROR, None
+            return RETRY, delay
+        # some server error we know nothing about
+        if status >= 500 or status == 429:
+            return RETURN_ERROR, None
+        # an error of the swagger client
+        return RAISE_ERROR, None
+
+    def status_delay(self, status, headers):
+        """
+        Take a retry for a call which failed with a retried status.
+
+        Args:
+            status (int): The HTTP status of the response.
+            headers (dict): The headers of the response.
+
+        Returns:
+            float: Seconds to wait before retrying.
+            None: If the call is not to be retried.
+        """
+        max_retries = self.policy.status_retries.get(status)
+        if max_retries is not None and self._status_retries[status] >= max_retries:
+            return None
+        delay = self.policy.backoff(self._retries)
+        retry_after = _get_retry_after(headers) if self.policy.respect_retry_after else None
+        if retry_after is None and status == 429:
+            retry_after = _get_rate_limit_wait(headers)
+        if retry_after is not None:
+            if retry_after > self.policy.max_retry_after:
+                logger.debug("not retrying status %s, told to wait %.1fs", status, retry_after)
+                return None
+            delay = retry_after
+        if not self._take(status, delay):
+            return None
+        self._status_retries[status] += 1
+        return delay
+
+    def connection_error_delay(self, error, idempotent):
+        """
+        Take a retry for a call whose connection failed.
+
+        Args:
+            error (urllib3.exceptions.HTTPError or ApiConnectionError): The
+                connection error.
+            idempotent (bool): Whether the call may be sent again if the
+                target may have received it already.
+
+        Returns:
+            float: Seconds to wait before retrying.
+            None: If the call is not to be retried.
+        """
+        if not self.policy.retry_connection_errors:
+            return None
+        if not idempotent and not _is_connect_error(error):
+            return None
+        delay = self.policy.backoff(self._retries)
+        return delay if self._take(None, delay) else None
+
+    def _take(self, status, delay):
+        if self.remaining <= 0:
+            return False
+        budget = self.policy.budget
+        if budget is not None and not budget.withdraw():
+            logger.debug("not retrying, the retry budget is exhausted")
+            return False
+        self.remaining -= 1
+        self._retries += 1
+        if self.hooks:
+            fire_hooks(self.hooks, 'on_retry', self.endpoint, self._retries, status, delay)
+        add_retry(self._retries, status, delay)
+        return True
+
+
+def _get_retry_after(headers):
+    """Seconds to wait from a Retry-After header, None if not sent."""
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+def _get_rate_limit_wait(headers):
+    """Seconds to wait after a 429 response, from the rate limit headers."""
+    if not headers:
+        return 1.0
+    # If the minute limit was hit, wait that long, otherwise it was the second limit
+    if str(headers.get(Headers.x_ratelimit_remaining_min, '')).strip() == '0':
+        return 60.0
+    return 1.0
+
+
+def _is_connect_error(error):
+    """Whether the request failed before reaching the target."""
+    if isinstance(error, urllib3.exceptions.MaxRetryError):
+        error = error.reason
+    if isinstance(error, ApiConnectionError):
+        # raised by the asyncio transport
+        return not error.connected
+    return isinstance(error, urllib3.exceptions.ConnectTimeoutError)
@@ -1,7 +1,6 @@
 import jwt
 import time
 import uuid
-import json
 
 from io import StringIO
 from paramiko import RSAKey
@@ -197,7 +196,7 @@ class TokenManager(object):
                                     _return_http_data_only=True,
                                     _request_timeout=self._timeout
                                 )
-                response = json.loads(response_data.decode("utf-8"))
+                response = api_client.json_codec.loads(response_data)
                 if 'access_token' in response:
                     return response['access_token']
                 elif 'items' in response:
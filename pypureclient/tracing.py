@@ -0,0 +1,272 @@
+import contextlib
+import functools
+import inspect
+import re
+import threading
+from urllib.parse import urlsplit
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import trace
+except ImportError:
+    otel_context = None
+    trace = None
+
+from ._version import __version__
+
+_tracer = trace.get_tracer('pypureclient', __version__) if trace is not None else None
+
+# Prefix of the versioned API function names, e.g. api238_
+_API_VERSION_PREFIX = re.compile(r'^api\d+_')
+
+# Attribute names, from the OpenTelemetry semantic conventions where they exist
+ENDPOINT = 'pypureclient.endpoint'
+REQUEST_ID = 'pypureclient.request_id'
+ITEM_COUNT = 'pypureclient.item_count'
+TOTAL_ITEM_COUNT = 'pypureclient.total_item_count'
+PAGE = 'pypureclient.page'
+HTTP_METHOD = 'http.request.method'
+HTTP_STATUS = 'http.response.status_code'
+HTTP_BODY_SIZE = 'http.response.body.size'
+URL = 'url.full'
+SERVER_ADDRESS = 'server.address'
+SERVER_PORT = 'server.port'
+
+
+def is_enabled(configuration):
+    """
+    Args:
+        configuration (Configuration): The configuration of a client.
+
+    Returns:
+        bool: True if the calls of the client are traced.
+    """
+    return _tracer is not None and getattr(configuration, 'tracing', False)
+
+
+def traced(call_api):
+    """
+    Decorates the `_call_api` method of a client, to make each of its calls
+    a span, e.g. `VolumesApi.volumes_get`, the current one while the call is
+    made. The HTTP requests sent for the call, retries included, and the
+    pages fetched while iterating its items are child spans.
+    """
+    if inspect.iscoroutinefunction(call_api):
+        @functools.wraps(call_api)
+        async def traced_call_api(client, api_class_name, api_function_name, *args, **kwargs):
+            if not is_enabled(client._api_client.configuration):
+                return await call_api(client, api_class_name, api_function_name, *args, **kwargs)
+            with _call_span(api_class_name, api_function_name) as span:
+                response = await call_api(client, api_class_name, api_function_name, *args, **kwargs)
+                _set_call_response(span, response)
+                return response
+    else:
+        @functools.wraps(call_api)
+        def traced_call_api(client, api_class_name, api_function_name, *args, **kwargs):
+            if not is_enabled(client._api_client.configuration):
+                return call_api(client, api_class_name, api_function_name, *args, **kwargs)
+            with _call_span(api_class_name, api_function_name) as span:
+                response = call_api(client, api_class_name, api_function_name, *args, **kwargs)
+                _set_call_response(span, response)
+                return response
+    return traced_call_api
+
+
+@contextlib.contextmanager
+def request_span(configuration, method, url, headers):
+    """
+    Make the HTTP request sent in the block a span, child of the current
+    span. Yields None if the calls are not traced.
+
+    Args:
+        configuration (Configuration): The configuration of the client.
+        method (str): The HTTP method.
+        url (str): The URL of the request.
+        headers (dict): The headers of the request.
+
+    Yields:
+        Span: The span, to be passed to `set_response`.
+    """
+    if not is_enabled(configuration):
+        yield None
+        return
+    parts = urlsplit(url)
+    attributes = {
+        HTTP_METHOD: method,
+        URL: url,
+        SERVER_ADDRESS: parts.hostname or '',
+    }
+    if parts.port:
+        attributes[SERVER_PORT] = parts.port
+    request_id = (headers or {}).get('X-Request-ID')
+    if request_id:
+        attributes[REQUEST_ID] = request_id
+    with _tracer.start_as_current_span(method, kind=trace.SpanKind.CLIENT, attributes=attributes,
+                                       record_exception=False, set_status_on_exception=False) as span:
+        try:
+            yield span
+        except BaseException as e:
+            # the error statuses are set from the response
+            if not getattr(e, 'status', None):
+                span.record_exception(e)
+                span.set_status(trace.Status(trace.StatusCode.ERROR, type(e).__name__))
+            raise
+
+
+def set_response(span, status, headers, body_size):
+    """
+    Set the response of an HTTP request on its span.
+
+    Args:
+        span (Span): The span of `request_span`, or None.
+        status (int): The HTTP status, 0 if no response was received.
+        headers (dict): The headers of the response.
+        body_size (int): The size of the response body as transferred.
+    """
+    if span is None:
+        return
+    if status:
+        span.set_attribute(HTTP_STATUS, status)
+    span.set_attribute(HTTP_BODY_SIZE, body_size or 0)
+    request_id = headers.get('X-Request-ID') if headers else None
+    if request_id:
+        span.set_attribute(REQUEST_ID, request_id)
+    if not status or status >= 400:
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(status or 'no response')))
+
+
+def add_retry(retries, status, delay):
+    """
+    Record a retry as an event of the span of the API call being made.
+
+    Args:
+        retries (int): Number of retries made so far, this one included.
+        status (int): The HTTP status of the failed attempt, None if its
+            connection failed.
+        delay (float): Seconds waited before the retry.
+    """
+    if _tracer is None:
+        return
+    span = trace.get_current_span()
+    if span.is_recording():
+        attributes = {'pypureclient.retries': retries, 'pypureclient.delay': delay}
+        if status is not None:
+            attributes[HTTP_STATUS] = status
+        span.add_event('retry', attributes)
+
+
+def set_item_count(count):
+    """
+    Set the number of items of a response on the span of the API call being
+    made.
+    """
+    if _tracer is None:
+        return
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attribute(ITEM_COUNT, count)
+
+
+class PageSpans(object):
+    """
+    Wraps the API function an ItemIterator calls for the following pages, to
+    make each page a span, child of the span of the first call.
+    """
+
+    def __init__(self, api_function, parent_context):
+        self.api_function = api_function
+        self.parent_context = parent_context
+        self.name = _get_span_name(type(getattr(api_function, '__self__', None)).__name__,
+                                   getattr(api_function, '__name__', ''))
+        self._page = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def wrap(cls, api_function, configuration):
+        """
+        Get the function to call for the following pages.
+
+        Returns:
+            PageSpans: If a call of the configuration is being traced.
+            function: The API function, otherwise.
+        """
+        if not is_enabled(configuration) or not trace.get_current_span().is_recording():
+            return api_function
+        return cls(api_function, otel_context.get_current())
+
+    def __call__(self, **kwargs):
+        with self._lock:
+            self._page += 1
+            page = self._page
+        # pages may be fetched after the call, or by another thread, their
+        # parent is given
+        span = _tracer.start_span('{} page'.format(self.name), context=self.parent_context,
+                                  attributes={ENDPOINT: self.name, PAGE: page})
+        token = otel_context.attach(trace.set_span_in_context(span))
+        try:
+            result = self.api_function(**kwargs)
+        except BaseException as e:
+            _end_page(span, None, e)
+            raise
+        finally:
+            otel_context.detach(token)
+        if inspect.isawaitable(result):
+            return self._await_page(span, result)
+        _end_page(span, result)
+        return result
+
+    async def _await_page(self, span, result):
+        token = otel_context.attach(trace.set_span_in_context(span))
+        try:
+            result = await result
+        except BaseException as e:
+            _end_page(span, None, e)
+            raise
+        finally:
+            otel_context.detach(token)
+        _end_page(span, result)
+        return result
+
+
+def _get_span_name(api_class_name, api_function_name):
+    """Name of the span of a call, e.g. VolumesApi.volumes_get."""
+    name = _API_VERSION_PREFIX.sub('', api_function_name)
+    if name.endswith('_with_http_info'):
+        name = name[:-len('_with_http_info')]
+    return '{}.{}'.format(api_class_name, name)
+
+
+def _call_span(api_class_name, api_function_name):
+    name = _get_span_name(api_class_name, api_function_name)
+    return _tracer.start_as_current_span(name, attributes={ENDPOINT: name})
+
+
+def _set_call_response(span, response):
+    status_code = getattr(response, 'status_code', None)
+    if status_code is not None:
+        span.set_attribute(HTTP_STATUS, status_code)
+    headers = getattr(response, 'headers', None)
+    request_id = getattr(headers, 'x_request_id', None)
+    if request_id:
+        span.set_attribute(REQUEST_ID, request_id)
+    total_item_count = getattr(response, 'total_item_count', None)
+    if total_item_count is not None:
+        span.set_attribute(TOTAL_ITEM_COUNT, total_item_count)
+    if not status_code or status_code >= 400:
+        errors = getattr(response, 'errors', None)
+        span.set_status(trace.Status(trace.StatusCode.ERROR,
+                                     getattr(errors[0], 'message', None) if errors else None))
+
+
+def _end_page(span, result, error=None):
+    if error is not None:
+        span.record_exception(error)
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+    else:
+        items = getattr(getattr(result, 'data', None), 'items', None)
+        if isinstance(items, list):
+            span.set_attribute(ITEM_COUNT, len(items))
+        status = getattr(result, 'status_code', None)
+        if status is not None:
+            span.set_attribute(HTTP_STATUS, status)
+    span.end()
@@ -0,0 +1,107 @@
+import json
+import os
+import sys
+
+import pytest
+
+from pypureclient._transport import cassette as cassette_module
+from pypureclient._transport.cassette import RECORD, REPLAY, Cassette, Interaction, close_cassettes
+from pypureclient._transport.configuration import Configuration
+from pypureclient._transport.exceptions import ApiValueError
+from pypureclient.flasharray.FA_2_38 import Client
+from pypureclient.responses import ValidResponse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks'))
+
+from mock_array import MockArray  # noqa: E402
+
+ITEMS = 25
+
+
+def _interaction(url, body, method='GET', status=200):
+    return Interaction(method, url, status, 'OK', [('Content-Type', 'application/json')],
+                       json.dumps(body).encode('utf-8'), 0.01)
+
+
+@pytest.fixture(params=['cassette.jsonl', 'cassette.jsonl.gz'])
+def path(request, tmp_path):
+    yield str(tmp_path / request.param)
+    close_cassettes()
+
+
+def _recorded(path, *interactions):
+    recorder = Cassette(path, RECORD)
+    for interaction in interactions:
+        recorder.record(interaction)
+    recorder.close()
+    return Cassette(path, REPLAY)
+
+
+def test_interactions_are_replayed_as_recorded(path):
+    binary = Interaction('GET', '/file', 200, 'OK', [], b'\xff\x00\xfe', 0.5)
+    cassette = _recorded(path, _interaction('/api/2.38/volumes?names=a', {'items': ['a']}), binary)
+    assert len(cassette) == 2
+    played = cassette.play('GET', 'https://array.example.com/file')
+    assert played.data == b'\xff\x00\xfe' and played.elapsed == 0.5
+    response = cassette.play('GET', 'https://other.example.com/api/2.38/volumes?names=a').to_response(True)
+    assert response.status == 200 and json.loads(response.data) == {'items': ['a']}
+    assert response.headers['Content-Length'] == str(len(response.data))
+
+
+def test_requests_match_on_query_string_then_path(path):
+    cassette = _recorded(path,
+                         _interaction('/api/2.38/volumes?names=a', 'a'),
+                         _interaction('/api/2.38/volumes?names=b', 'b'),
+                         _interaction('/api/2.38/volumes', 'all'),
+                         _interaction('/api/2.38/volumes', 'created', method='POST'))
+
+    def play(method, url):
+        return json.loads(cassette.play(method, 'https://array.example.com' + url).data)
+
+    assert play('GET', '/api/2.38/volumes?names=b') == 'b'
+    assert play('POST', '/api/2.38/volumes') == 'created'
+    # nothing recorded for the query string, the interactions of the path
+    # are played in the recorded order
+    assert [play('GET', '/api/2.38/volumes?names=c') for _ in range(4)] == ['a', 'b', 'all', 'a']
+    with pytest.raises(ApiValueError):
+        play('DELETE', '/api/2.38/volumes?names=a')
+    with pytest.raises(ApiValueError):
+        play('GET', '/api/2.38/hosts')
+
+
+def test_interactions_of_a_request_are_played_in_order(path):
+    cassette = _recorded(path, *[_interaction('/api/2.38/volumes?limit=1', i) for i in range(3)])
+    played = [json.loads(cassette.play('GET', '/api/2.38/volumes?limit=1').data) for _ in range(4)]
+    assert played == [0, 1, 2, 0]
+
+
+def test_tokens_are_not_recorded(path):
+    login = Interaction('POST', '/api/2.38/login', 200, 'OK', cassette_module._recorded_headers(
+        {'x-auth-token': 'secret-session', 'Content-Length': '10', 'Content-Type': 'application/json'}),
+        cassette_module._redact(b'{"access_token": "header.claims.signature"}'), 0.0)
+    played = _recorded(path, login).play('POST', '/api/2.38/login')
+    assert played.headers == [('x-auth-token', 'recorded-session-token'), ('Content-Type', 'application/json')]
+    assert played.data == b'{"access_token": "header.claims.redacted"}'
+
+
+def _client(url, path, mode):
+    configuration = Configuration(host=url)
+    configuration.cassette = path
+    configuration.cassette_mode = mode
+    configuration.cassette_latency = 0
+    return Client(configuration=configuration, api_token='token')
+
+
+def test_client_replays_its_recording(path):
+    with MockArray(items=ITEMS, page_size=10) as array:
+        client = _client(array.url, path, RECORD)
+        recorded = [volume.name for volume in client.get_volumes().items]
+        recorded_hosts = [host.name for host in client.get_hosts(limit=5).items]
+        close_cassettes()
+    assert len(recorded) == ITEMS and len(recorded_hosts) == 5
+    # the array is gone, and replayed under another host
+    client = _client('https://replayed.example.com', path, REPLAY)
+    response = client.get_volumes()
+    assert isinstance(response, ValidResponse)
+    assert [volume.name for volume in response.items] == recorded
+    assert [host.name for host in client.get_hosts(limit=5).items] == recorded_hosts
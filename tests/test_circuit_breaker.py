@@ -0,0 +1,111 @@
+import pytest
+import urllib3
+
+from pypureclient.exceptions import CircuitOpenError
+from pypureclient._transport import circuit_breaker
+from pypureclient._transport.circuit_breaker import (CLOSED, HALF_OPEN, OPEN, CircuitBreaker, get_circuit_breaker,
+                                                     get_circuit_state, is_failure)
+from pypureclient._transport.exceptions import ApiException, NotFoundException
+
+TARGET = 'https://array.example.com'
+
+
+class _Clock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', clock)
+    return clock
+
+
+def _fail(breaker, count=1):
+    for _ in range(count):
+        breaker.release(breaker.acquire(), True)
+
+
+def _open_breaker():
+    breaker = CircuitBreaker(TARGET, 3, 30)
+    _fail(breaker, 3)
+    assert breaker.state == OPEN
+    return breaker
+
+
+def test_opens_after_failures_in_a_row(clock):
+    breaker = CircuitBreaker(TARGET, 3, 30)
+    _fail(breaker, 2)
+    # a success resets the count
+    breaker.release(breaker.acquire(), False)
+    _fail(breaker, 2)
+    # a request which failed before reaching the target doesn't count
+    breaker.release(breaker.acquire(), None)
+    assert breaker.state == CLOSED
+    _fail(breaker)
+    assert breaker.state == OPEN
+
+
+def test_open_circuit_fails_fast(clock):
+    breaker = _open_breaker()
+    clock.now += 10
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.acquire()
+    assert raised.value.target == TARGET and raised.value.retry_after == pytest.approx(20)
+
+
+def test_half_open_lets_a_single_probe_through(clock):
+    breaker = _open_breaker()
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+    assert breaker.acquire() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    # the probe failed before reaching the target, another one is let through
+    breaker.release(True, None)
+    assert breaker.state == HALF_OPEN and breaker.acquire() is True
+
+
+def test_probe_success_closes(clock):
+    breaker = _open_breaker()
+    clock.now += 30
+    breaker.release(breaker.acquire(), False)
+    assert breaker.state == CLOSED
+    assert breaker.acquire() is False
+    # the failures are counted from zero again
+    _fail(breaker, 2)
+    assert breaker.state == CLOSED
+
+
+def test_probe_failure_opens_again(clock):
+    breaker = _open_breaker()
+    clock.now += 30
+    _fail(breaker)
+    assert breaker.state == OPEN
+    clock.now += 29
+    assert breaker.state == OPEN
+    clock.now += 1
+    assert breaker.state == HALF_OPEN
+
+
+def test_shared_breakers(monkeypatch):
+    monkeypatch.setattr(circuit_breaker, '_circuit_breakers', {})
+    breaker = get_circuit_breaker(TARGET, 1, 30)
+    assert get_circuit_breaker(TARGET, 5, 60) is breaker
+    assert get_circuit_state('array.example.com') == CLOSED
+    _fail(breaker)
+    assert get_circuit_state('array.example.com') == OPEN
+    assert get_circuit_state('other.example.com') == CLOSED
+
+
+def test_failures():
+    assert is_failure(urllib3.exceptions.NewConnectionError(None, 'refused'))
+    assert is_failure(ApiException(status=0, reason='reset'))
+    assert is_failure(ApiException(status=503))
+    assert not is_failure(NotFoundException(status=404))
+    assert not is_failure(ValueError())
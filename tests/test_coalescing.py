@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from pypureclient import _coalescing
+from pypureclient._coalescing import RequestCoalescer
+from pypureclient.responses import ErrorResponse, ValidResponse
+
+FUNCTION = 'api238_volumes_get_with_http_info'
+
+
+class _Client(object):
+    """Answers the lookups by names with an item per name, unless given the
+    response or exception of every request."""
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.sent = []
+
+    def _call_api(self, api_class_name, api_function_name, kwargs):
+        self.sent.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        if self.response is not None:
+            return self.response
+        items = [{'name': name} for name in kwargs['names']]
+        return ValidResponse(200, None, len(items), items, None)
+
+
+def _call_concurrently(coalescer, *names):
+    """Makes a lookup per list of names, each on its own thread, and returns
+    their responses, or the exceptions they raised, in order."""
+    results = [None] * len(names)
+
+    def call(i):
+        try:
+            results[i] = coalescer.call('VolumesApi', FUNCTION, {'names': names[i]})
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(names))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def _names(response):
+    return [item['name'] for item in response.items]
+
+
+def test_calls_of_the_window_are_merged():
+    client = _Client()
+    # the batch is sent once full, long before the window ends
+    coalescer = RequestCoalescer(client, 5, 4, 1000)
+    responses = _call_concurrently(coalescer, ['a'], ['b', 'c'], ['A'])
+    assert len(client.sent) == 1
+    assert sorted(client.sent[0]['names']) == ['A', 'a', 'b', 'c']
+    # names are case insensitive
+    assert [sorted(_names(r)) for r in responses] == [['A', 'a'], ['b', 'c'], ['A', 'a']]
+
+
+def test_single_call_is_sent_as_is():
+    client = _Client()
+    coalescer = RequestCoalescer(client, 0.01, 4, 1000)
+    assert coalescer.call('VolumesApi', FUNCTION, {'names': ['a']}) is None
+    assert client.sent == []
+
+
+def test_calls_which_cannot_be_merged():
+    coalescer = RequestCoalescer(_Client(), 5, 4, 1000)
+    assert coalescer.call('VolumesApi', FUNCTION, {'names': ['a'], 'limit': 1}) is None
+    assert coalescer.call('VolumesApi', FUNCTION, {'names': ['a'], 'ids': ['1']}) is None
+    assert coalescer.call('VolumesApi', 'api238_volumes_delete_with_http_info', {'names': ['a']}) is None
+
+
+def test_full_batch_starts_another():
+    client = _Client()
+    coalescer = RequestCoalescer(client, 0.2, 2, 1000)
+    responses = _call_concurrently(coalescer, ['a'], ['b'], ['c'], ['d'])
+    assert sorted(len(kwargs['names']) for kwargs in client.sent) == [2, 2]
+    assert [_names(r) for r in responses] == [['a'], ['b'], ['c'], ['d']]
+
+
+def test_error_is_sent_unmerged_for_a_while(monkeypatch):
+    client = _Client(response=ErrorResponse(400, [], None))
+    coalescer = RequestCoalescer(client, 5, 3, 1000)
+    # each call is sent on its own
+    assert _call_concurrently(coalescer, ['a'], ['b'], ['c']) == [None, None, None]
+    assert len(client.sent) == 1
+    # and so are the next ones, without waiting for the window
+    assert coalescer.call('VolumesApi', FUNCTION, {'names': ['a']}) is None
+    assert len(client.sent) == 1
+    # until the cool-down ends
+    monkeypatch.setattr(_coalescing.time, 'monotonic', lambda: float('inf'))
+    client.response = None
+    responses = _call_concurrently(coalescer, ['a'], ['b'], ['c'])
+    assert len(client.sent) == 2 and [_names(r) for r in responses] == [['a'], ['b'], ['c']]
+
+
+def test_unrequested_items_are_sent_unmerged():
+    client = _Client(response=ValidResponse(200, None, 1, [{'name': 'other'}], None))
+    coalescer = RequestCoalescer(client, 5, 2, 1000)
+    assert _call_concurrently(coalescer, ['a'], ['b']) == [None, None]
+
+
+def test_exception_is_raised_by_every_call():
+    error = RuntimeError('connection failed')
+    client = _Client(error=error)
+    coalescer = RequestCoalescer(client, 5, 3, 1000)
+    assert _call_concurrently(coalescer, ['a'], ['b'], ['c']) == [error, error, error]
+    assert len(client.sent) == 1
@@ -0,0 +1,70 @@
+import copy
+import pickle
+
+import pytest
+
+from pypureclient.flasharray.FA_2_2 import models as models_2_2
+from pypureclient.flasharray.FA_2_38 import models
+from pypureclient._transport.compact_model import CompactModel, compact_class
+
+HOST = {'name': 'host1', 'iqns': ['iqn.1', 'iqn.2'], 'host_group': {'name': 'hg1'},
+        'preferred_arrays': [{'name': 'array1'}, {'name': 'array2'}], 'is_local': True}
+# a field decoded as is, holding nested dicts and lists
+POD = {'name': 'pod1', 'space': {'total': 10, 'by_array': [{'name': 'array1', 'used': [1, [2, 3]]}]}}
+
+
+def _host(**changes):
+    return compact_class(models.Host)(dict(HOST, **changes))
+
+
+def _pod(space=POD['space']):
+    return compact_class(models_2_2.Pod)(dict(POD, space=space))
+
+
+def test_fields():
+    host = _host()
+    assert isinstance(host, CompactModel) and isinstance(host.host_group, CompactModel)
+    assert host.name == 'host1' and host.host_group.name == 'hg1' and host['wwns'] is None
+    assert host.iqns == ('iqn.1', 'iqn.2') and host.preferred_arrays[1].name == 'array2'
+    assert host.to_dict() == HOST
+    assert host.to_model() == models.Host.from_dict(HOST)
+    with pytest.raises(AttributeError):
+        host.not_a_field
+
+
+def test_records_are_read_only():
+    host, pod = _host(), _pod()
+    with pytest.raises(AttributeError):
+        host.name = 'host2'
+    with pytest.raises(AttributeError):
+        del host.name
+    with pytest.raises(TypeError):
+        pod.space['total'] = 20
+    with pytest.raises(TypeError):
+        pod.space['by_array'][0]['used'][1][0] = 4
+
+
+def test_hashing():
+    assert _host() == _host() and hash(_host()) == hash(_host())
+    assert _host() != _host(iqns=['iqn.1']) and _host() != _host(host_group={'name': 'hg2'})
+    assert len({_host(), _host(), _host(name='host2')}) == 2
+    # the dict and list values are hashed with their nested values
+    assert _pod() == _pod() and hash(_pod()) == hash(_pod())
+    other = {'total': 10, 'by_array': [{'name': 'array1', 'used': [1, [2, 4]]}]}
+    assert _pod() != _pod(other)
+    assert len({_pod(), _pod(), _pod(other)}) == 2
+    assert _pod().to_dict() == POD
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    for record in (_host(), _pod()):
+        unpickled = pickle.loads(pickle.dumps(record, protocol))
+        assert type(unpickled) is type(record)
+        assert unpickled == record and hash(unpickled) == hash(record)
+        assert unpickled.to_dict() == record.to_dict()
+
+
+def test_copy():
+    host = _host()
+    assert copy.copy(host) == host and copy.deepcopy(host) == host
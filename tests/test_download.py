@@ -0,0 +1,64 @@
+import io
+
+import pytest
+import urllib3
+
+from pypureclient._transport.api_client import ApiClient
+from pypureclient._transport.configuration import Configuration
+from pypureclient._transport.download import FileDownload
+from pypureclient._transport.exceptions import ApiException
+
+BODY = b'0123456789' * 1000
+
+
+def _response(body=BODY):
+    return urllib3.HTTPResponse(io.BytesIO(body), headers={'Content-Length': str(len(body))},
+                                status=200, preload_content=False)
+
+
+def test_save_twice_requests_the_file_again(tmp_path):
+    reopened = []
+
+    def reopen(headers):
+        reopened.append(headers)
+        return _response()
+
+    download = FileDownload(_response(), reopen)
+    first, second = tmp_path / 'first', tmp_path / 'second'
+    download.save(str(first))
+    assert reopened == []
+    download.save(str(second))
+    assert reopened == [{}]
+    assert first.read_bytes() == second.read_bytes() == BODY
+
+
+def test_save_twice_without_reopen(tmp_path):
+    download = FileDownload(_response())
+    destination = tmp_path / 'file'
+    download.save(str(destination))
+    with pytest.raises(ApiException):
+        download.save(str(destination))
+    # not truncated by the failed save
+    assert destination.read_bytes() == BODY
+    with pytest.raises(ApiException):
+        download.save(io.BytesIO())
+
+
+def test_save_after_close_requests_the_file_again():
+    download = FileDownload(_response(), lambda headers: _response())
+    download.close()
+    assert download.save(io.BytesIO()).getvalue() == BODY
+
+
+def test_reopen_sends_the_current_auth_header():
+    client = ApiClient(Configuration(host='https://array.example.com'))
+    sent = []
+    client.request = lambda method, url, headers=None, **kwargs: sent.append(headers) or _response()
+    client.set_default_header('x-auth-token', 'expired')
+    header_params = {'x-auth-token': 'expired', 'X-Request-ID': 'id'}
+    # the client refreshed its token since the request was sent
+    client.set_default_header('x-auth-token', 'refreshed')
+    client._reopen_request('GET', 'https://array.example.com/file', header_params, None, None, None,
+                           {'Range': 'bytes=10-'})
+    assert sent == [{'x-auth-token': 'refreshed', 'X-Request-ID': 'id', 'Range': 'bytes=10-',
+                     'User-Agent': client.user_agent}]
@@ -0,0 +1,102 @@
+import contextvars
+import threading
+import time
+
+import pytest
+
+from pypureclient._transport.hedging import MIN_LATENCY_SAMPLES, RequestHedger
+
+DELAY = 0.05
+
+_call = contextvars.ContextVar('call', default=None)
+
+
+@pytest.fixture
+def hedger():
+    hedger = RequestHedger(95.0, DELAY, max_workers=2)
+    for _ in range(MIN_LATENCY_SAMPLES):
+        hedger.send(lambda: None)
+    assert hedger.delay() == DELAY
+    hedger.counters.requests = 0
+    yield hedger
+    hedger.close()
+
+
+class _Requests(object):
+    """Sends the request, then the hedge, with the given outcomes: a response,
+    or an exception to raise, after a time in seconds."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.threads = []
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            seconds, outcome = self.outcomes.pop(0)
+            self.threads.append(threading.current_thread())
+            self.calls.append(_call.get())
+        time.sleep(seconds)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_requests_are_not_hedged_until_latencies_are_known():
+    hedger = RequestHedger(95.0, 0, max_workers=2)
+    send = _Requests((0.1, 'request'))
+    assert hedger.send(send) == 'request'
+    assert send.threads == [threading.current_thread()]
+    hedger.close()
+
+
+def test_request_on_time(hedger):
+    send = _Requests((0, 'request'), (0, 'hedge'))
+    assert hedger.send(send) == 'request'
+    time.sleep(DELAY * 2)
+    assert send.threads == [threading.current_thread()]
+    assert (hedger.counters.requests, hedger.counters.hedged, hedger.counters.won) == (1, 0, 0)
+
+
+def test_late_request_is_hedged(hedger):
+    _call.set('call')
+    send = _Requests((DELAY * 4, 'request'), (0, 'hedge'))
+    assert hedger.send(send) == 'hedge'
+    # the request is sent by the caller, the hedge by the executor, in the
+    # context of the caller
+    assert send.threads[0] is threading.current_thread() and send.threads[1] is not send.threads[0]
+    assert send.calls == ['call', 'call']
+    assert (hedger.counters.requests, hedger.counters.hedged, hedger.counters.won) == (1, 1, 1)
+
+
+def test_hedge_coming_last(hedger):
+    send = _Requests((DELAY * 2, 'request'), (DELAY * 4, 'hedge'))
+    assert hedger.send(send) == 'request'
+    assert (hedger.counters.hedged, hedger.counters.won) == (1, 0)
+
+
+def test_failed_request_waits_for_the_hedge(hedger):
+    send = _Requests((DELAY * 2, ValueError('request')), (DELAY * 2, 'hedge'))
+    assert hedger.send(send) == 'hedge'
+    assert (hedger.counters.hedged, hedger.counters.won) == (1, 1)
+
+
+def test_both_requests_failed(hedger):
+    send = _Requests((DELAY * 2, ValueError('request')), (0, ValueError('hedge')))
+    with pytest.raises(ValueError, match='request'):
+        hedger.send(send)
+    assert (hedger.counters.hedged, hedger.counters.won) == (1, 0)
+
+
+def test_failed_request_not_hedged(hedger):
+    send = _Requests((0, ValueError('request')))
+    with pytest.raises(ValueError, match='request'):
+        hedger.send(send)
+    assert hedger.counters.hedged == 0
+
+
+def test_hedge_not_allowed(hedger):
+    send = _Requests((DELAY * 3, 'request'), (0, 'hedge'))
+    assert hedger.send(send, may_hedge=lambda: False) == 'request'
+    assert len(send.threads) == 1 and hedger.counters.hedged == 0
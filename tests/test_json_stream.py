@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from pypureclient._transport.json_stream import JSONItemStream
+
+BODY = {
+    'total_item_count': 3,
+    'items': [
+        {'name': 'vol "1"', 'path': 'C:\\dir\\', 'note': 'line\nbreak\ttab \u00e9\u4e2d\U0001f600'},
+        {'name': 'vol2', 'tags': [[1, 2], [], [[3, [4.5e-3]]]], 'items': [{'items': []}],
+         'size': -12345678901234567890, 'ratio': 1.5E+10, 'flags': [True, False, None]},
+        [],
+    ],
+    'continuation_token': 'tok\\en"',
+    'more_items_remaining': False,
+}
+
+
+class _Response(object):
+    """Response streaming its body in the given chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    def stream(self, size):
+        return iter(self.chunks)
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        pass
+
+
+def _encoded(body, ensure_ascii=False):
+    return json.dumps(body, ensure_ascii=ensure_ascii, indent=1).encode('utf-8')
+
+
+def _stream(chunks):
+    return JSONItemStream(_Response(chunks), 'utf-8')
+
+
+@pytest.mark.parametrize('ensure_ascii', [False, True])
+def test_one_byte_chunks(ensure_ascii):
+    data = _encoded(BODY, ensure_ascii)
+    stream = _stream([data[i:i + 1] for i in range(len(data))])
+    assert list(stream) == BODY['items']
+    assert stream.fields['continuation_token'] == BODY['continuation_token']
+    assert stream.fields['more_items_remaining'] is False
+
+
+@pytest.mark.parametrize('ensure_ascii', [False, True])
+def test_every_split(ensure_ascii):
+    # each token, escape and multibyte character is split at every position
+    data = _encoded(BODY, ensure_ascii)
+    for split in range(1, len(data)):
+        stream = _stream([data[:split], data[split:]])
+        assert list(stream) == BODY['items'], split
+        assert stream.fields == {k: v for k, v in BODY.items() if k != 'items'}, split
+
+
+def test_numbers_split_at_the_end_of_a_chunk():
+    stream = _stream([b'{"items": [12', b'34, -0.5', b'e-3, 7', b'], "total_item_count": 1', b'0}'])
+    assert list(stream) == [1234, -0.5e-3, 7]
+    assert stream.fields['total_item_count'] == 10
+
+
+def test_fields_before_the_items():
+    stream = _stream([b'{"total_item_count": 2, "items": [{"a": 1}, {"a": 2}], "continuation_token": "t"}'])
+    assert stream.field('total_item_count') == 2
+    # not read yet
+    assert stream.field('continuation_token') is None
+    assert list(stream) == [{'a': 1}, {'a': 2}]
+    assert stream.field('continuation_token') == 't'
+    assert len(stream) == 2
+
+
+def test_item_deserializer():
+    stream = JSONItemStream(_Response([b'{"items": [{"a": 1}, {"a": 2}]}']), 'utf-8', lambda item: item['a'])
+    assert list(stream) == [1, 2]
+
+
+def test_empty_items():
+    stream = _stream([b'{"items": [ ], "continuation_token": null}'])
+    assert list(stream) == []
+    assert stream.fields == {'continuation_token': None}
+
+
+def test_malformed_body():
+    response = _Response([b'["not", "an", "object"]'])
+    with pytest.raises(json.JSONDecodeError):
+        list(JSONItemStream(response, 'utf-8'))
+    assert response.closed
+
+
+def test_truncated_body():
+    with pytest.raises(json.JSONDecodeError):
+        list(_stream([b'{"items": [{"a": 1}, {"a": ']))
@@ -0,0 +1,50 @@
+import copy
+import pickle
+
+import pytest
+
+from pypureclient.flasharray.FA_2_38 import models
+from pypureclient._transport.lazy_model import LazyModel
+
+
+def _volume():
+    return LazyModel(models.Volume, {'name': 'vol1', 'provisioned': 1048576,
+                                     'space': {'snapshots': 10, 'total_physical': 20},
+                                     'volume_group': {'name': 'vg1'}})
+
+
+def test_fields_are_read_lazily():
+    volume = _volume()
+    assert volume.name == 'vol1' and volume.space.snapshots == 10
+    assert volume.to_model() == models.Volume.from_dict(volume.to_dict())
+    with pytest.raises(AttributeError):
+        volume.not_a_field
+    with pytest.raises(AttributeError):
+        volume._not_a_slot
+
+
+def test_copy():
+    volume = _volume()
+    volume.space
+    copied = copy.copy(volume)
+    assert copied == volume and copied.space.total_physical == 20
+    # a shallow copy shares the dict
+    copied.name = 'vol2'
+    assert volume.name == 'vol2'
+
+
+def test_deepcopy():
+    volume = _volume()
+    copied = copy.deepcopy(volume)
+    assert copied == volume and copied.volume_group.name == 'vg1'
+    copied.name = 'vol2'
+    assert volume.name == 'vol1'
+
+
+def test_pickle():
+    volume = _volume()
+    volume.volume_group
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        unpickled = pickle.loads(pickle.dumps(volume, protocol))
+        assert isinstance(unpickled, LazyModel) and unpickled == volume
+        assert unpickled.space.snapshots == 10 and unpickled.to_dict() == volume.to_dict()
@@ -0,0 +1,71 @@
+import os
+import sys
+
+import pytest
+
+from pypureclient.exceptions import PureError
+from pypureclient.flasharray.FA_2_38 import Client, models
+from pypureclient.projection import Projection
+from pypureclient.properties import Property
+from pypureclient.responses import ValidResponse
+from pypureclient._transport.configuration import Configuration
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks'))
+
+from mock_array import MockArray  # noqa: E402
+
+ITEMS = 5
+
+
+@pytest.fixture(scope='module')
+def array():
+    with MockArray(items=ITEMS, page_size=ITEMS) as array:
+        yield array
+
+
+def _client(array, **settings):
+    configuration = Configuration(host=array.url)
+    for name, value in settings.items():
+        setattr(configuration, name, value)
+    return Client(configuration=configuration, api_token='token')
+
+
+def test_projection_of_an_item():
+    projection = Projection(['name', Property('space') + Property('total_physical'), 'space'])
+    # the whole space is kept
+    assert projection.fields == ['name', 'space']
+    projection = Projection(['name', 'space.total_physical', 'volume_group[all].name'])
+    item = {'name': 'vol1', 'id': '1', 'space': {'total_physical': 1, 'snapshots': 2},
+            'volume_group': {'name': 'vg1', 'id': '2'}}
+    assert projection.project(item) == {'name': 'vol1', 'space': {'total_physical': 1},
+                                        'volume_group': {'name': 'vg1'}}
+    projection.validate(models.Volume)
+    with pytest.raises(PureError):
+        Projection(['nmae']).validate(models.Volume)
+    with pytest.raises(PureError):
+        Projection([1])
+
+
+def test_fields_left_out_are_unset(array):
+    response = _client(array).get_volumes(fields=['name', 'space.total_physical'])
+    assert isinstance(response, ValidResponse)
+    volumes = list(response.items)
+    assert len(volumes) == ITEMS
+    for volume in volumes:
+        assert volume.to_dict() == {'name': volume.name, 'space': {'total_physical': volume.space.total_physical}}
+        # as if the target had not sent them
+        with pytest.raises(AttributeError):
+            volume.provisioned
+        assert volume['provisioned'] is None
+
+
+def test_default_fields(array):
+    client = _client(array, default_fields=['name'])
+    assert all(volume.to_dict() == {'name': volume.name} for volume in client.get_volumes().items)
+    # an empty list keeps every field
+    assert all(volume.provisioned is not None for volume in client.get_volumes(fields=[]).items)
+
+
+def test_unknown_field(array):
+    with pytest.raises(PureError):
+        _client(array).get_volumes(fields=['nmae'])
@@ -0,0 +1,114 @@
+import pytest
+
+from pypureclient._transport import rate_limit
+from pypureclient._transport.rate_limit import RateLimiter, _TokenBucket
+
+
+def _bucket(limit, period=1.0):
+    bucket = _TokenBucket(period)
+    bucket.limit = limit
+    return bucket
+
+
+def test_bucket_without_limit():
+    bucket = _TokenBucket(1.0)
+    bucket.take(0.0, 10)
+    assert bucket.wait_time(0.0) == 0.0 and bucket.times == []
+
+
+def test_bucket_wait_time():
+    bucket = _bucket(2)
+    bucket.take(0.0)
+    assert bucket.wait_time(0.1) == 0.0
+    bucket.take(0.5)
+    # the first token is put back a period after it was taken
+    assert bucket.wait_time(0.6) == pytest.approx(0.4)
+    bucket.put_back(1.0)
+    assert bucket.put_back_total == 1 and bucket.times == [0.5] and bucket.totals == [2]
+    assert bucket.wait_time(1.0) == 0.0
+
+
+def test_bucket_tokens_taken_at_once():
+    bucket = _bucket(5)
+    bucket.take(0.0, 5)
+    assert bucket.times == [0.0] and bucket.totals == [5]
+    assert bucket.wait_time(0.1) == pytest.approx(0.9)
+    bucket.put_back(1.0)
+    assert bucket.put_back_total == 5 and bucket.wait_time(1.0) == 0.0
+
+
+def test_bucket_token_taken_out_of_order():
+    bucket = _bucket(3)
+    bucket.take(0.0)
+    bucket.take(0.8, 2)
+    # a request reserved before the latest one
+    bucket.take(0.4)
+    assert bucket.times == [0.0, 0.4, 0.8] and bucket.totals == [1, 2, 4]
+    assert bucket.used(0.5) == 2 and bucket.used(0.9) == 4
+    # the 4 tokens held are one more than the limit, wait for the first two
+    assert bucket.wait_time(0.9) == pytest.approx(0.5)
+    bucket.put_back(1.5)
+    assert bucket.put_back_total == 2 and bucket.times == [0.8] and bucket.totals == [4]
+    assert bucket.used(1.5) == 2 and bucket.wait_time(1.5) == 0.0
+    bucket.take(1.6)
+    assert bucket.wait_time(1.6) == pytest.approx(0.2)
+
+
+class _Clock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(rate_limit.time, 'monotonic', clock)
+    return clock
+
+
+def _headers(limit, remaining):
+    return {'X-RateLimit-Limit-second': str(limit), 'X-RateLimit-Remaining-second': str(remaining)}
+
+
+def test_requests_are_not_paced_without_limits(clock):
+    limiter = RateLimiter()
+    limiter.update(None)
+    limiter.update({'X-RateLimit-Limit-second': 'not a number'})
+    assert all(limiter.reserve() == 0.0 for _ in range(100))
+
+
+def test_reserve_waits_for_the_limit(clock):
+    limiter = RateLimiter()
+    limiter.update(_headers(2, 2))
+    assert limiter.reserve() == 0.0
+    clock.now += 0.25
+    assert limiter.reserve() == 0.0
+    assert not limiter.try_reserve()
+    # a token of the first request, then one of the second
+    assert limiter.reserve() == pytest.approx(1.0 - 0.25)
+    assert limiter.reserve() == pytest.approx(1.0)
+    clock.now += 2.0
+    assert limiter.try_reserve()
+
+
+def test_update_takes_the_requests_of_others(clock):
+    limiter = RateLimiter()
+    limiter.update(_headers(3, 3))
+    limiter.reserve()
+    # the target counted the request sent from here, and another
+    limiter.update(_headers(3, 1))
+    assert limiter.try_reserve()
+    assert not limiter.try_reserve()
+    # the requests sent from here are not taken twice
+    limiter.update(_headers(3, 0))
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_update_minute_limit(clock):
+    limiter = RateLimiter()
+    limiter.update({'X-RateLimit-Limit-minute': '10', 'X-RateLimit-Remaining-minute': '0'})
+    assert limiter.reserve() == pytest.approx(60.0)
@@ -0,0 +1,72 @@
+import threading
+import types
+
+import pytest
+
+from pypureclient.exceptions import PureError
+from pypureclient.responses import _PagePrefetcher
+
+
+def _page(items, continuation_token):
+    body = types.SimpleNamespace(items=items, continuation_token=continuation_token,
+                                 more_items_remaining=continuation_token is not None)
+    return types.SimpleNamespace(data=body)
+
+
+def _endpoint(*results):
+    """API function returning, or raising, the results in turn."""
+    results = list(results)
+
+    def api_endpoint(**kwargs):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return api_endpoint
+
+
+def _next_page(fetcher, timeout=5):
+    """next_page, failing the test instead of blocking."""
+    outcome = {}
+
+    def run():
+        try:
+            outcome['body'] = fetcher.next_page()
+        except Exception as e:
+            outcome['error'] = e
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), 'next_page blocked'
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['body']
+
+
+def _prefetcher(api_endpoint):
+    return _PagePrefetcher(api_endpoint, {}, 'token-1', 1, 0, None, 2)
+
+
+def test_next_page_after_the_last_page():
+    fetcher = _prefetcher(_endpoint(_page(['b'], 'token-2'), _page(['c'], None)))
+    assert _next_page(fetcher).items == ['b']
+    assert _next_page(fetcher).items == ['c']
+    assert _next_page(fetcher) is None
+    assert _next_page(fetcher) is None
+    fetcher.stop()
+
+
+def test_next_page_after_an_empty_page():
+    fetcher = _prefetcher(_endpoint(types.SimpleNamespace(data=None)))
+    assert _next_page(fetcher) is None
+    assert _next_page(fetcher) is None
+    fetcher.stop()
+
+
+def test_next_page_after_an_error():
+    fetcher = _prefetcher(_endpoint(_page(['b'], 'token-2'), ValueError('connection lost')))
+    assert _next_page(fetcher).items == ['b']
+    for _ in range(2):
+        with pytest.raises(PureError, match='connection lost'):
+            _next_page(fetcher)
+    fetcher.stop()
@@ -0,0 +1,27 @@
+from pypureclient._transport import rest
+from pypureclient._transport.configuration import Configuration
+
+
+def _rest_client(**settings):
+    configuration = Configuration(host='https://array.example.com')
+    for name, value in settings.items():
+        setattr(configuration, name, value)
+    return rest.RESTClientObject(configuration)
+
+
+def test_pools_are_not_shared_by_default():
+    first, second = _rest_client(), _rest_client()
+    assert not first.shared and first.backend is not second.backend
+
+
+def test_shared_pools():
+    rest.clear_shared_pool_managers()
+    first = _rest_client(share_connection_pools=True)
+    second = _rest_client(share_connection_pools=True)
+    assert first.shared and first.backend is second.backend
+    # other settings, other pools
+    assert _rest_client(share_connection_pools=True, verify_ssl=True).backend is not first.backend
+    assert _rest_client().backend is not first.backend
+    rest.clear_shared_pool_managers()
+    assert _rest_client(share_connection_pools=True).backend is not first.backend
+    rest.clear_shared_pool_managers()
@@ -0,0 +1,311 @@
+import asyncio
+import collections
+import json
+import socket
+import threading
+import time
+import urllib.parse
+
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pypureclient.async_client import to_async_client
+from pypureclient.exceptions import PureError
+from pypureclient.flasharray.FA_2_38 import Client, models
+from pypureclient.hooks import ClientHooks
+from pypureclient.responses import ErrorResponse, ValidResponse
+from pypureclient.retry_policy import RetryBudget, RetryPolicy, retrying
+from pypureclient._transport.configuration import Configuration
+
+# Outcome of a request which succeeds, and of one whose connection is dropped
+OK = 'ok'
+DROP = 'drop'
+
+
+class _Array(object):
+    """Fake array answering the volume requests with the scripted outcomes,
+    then with success."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.outcomes = collections.deque()
+        # (method, monotonic time) of the volume requests received
+        self.requests = []
+        self.logins = 0
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _handler(self))
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self._server.server_address[1])
+
+    def script(self, *outcomes):
+        """Sets the outcomes of the next volume requests: OK, DROP, a status
+        or a (status, headers) tuple."""
+        with self.lock:
+            self.outcomes = collections.deque(outcomes)
+            self.requests = []
+            self.logins = 0
+
+    def next_outcome(self, method):
+        with self.lock:
+            self.requests.append((method, time.monotonic()))
+            return self.outcomes.popleft() if self.outcomes else OK
+
+    def gaps(self):
+        """Seconds between the volume requests received."""
+        times = [t for _, t in self.requests]
+        return [b - a for a, b in zip(times, times[1:])]
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _handler(array):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body, headers=None):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _volumes(self):
+            outcome = array.next_outcome(self.command)
+            if outcome == DROP:
+                self.close_connection = True
+                self.connection.shutdown(socket.SHUT_RDWR)
+                return
+            if outcome == OK:
+                return self._send(200, {'items': [{'id': 'id-1', 'name': 'vol1'}], 'total_item_count': 1})
+            status, headers = outcome if isinstance(outcome, tuple) else (outcome, None)
+            return self._send(status, {'errors': [{'message': 'injected {}'.format(status)}]}, headers)
+
+        def do_GET(self):
+            path = urllib.parse.urlsplit(self.path).path
+            if path == '/api/api_version':
+                return self._send(200, {'version': ['2.38']})
+            if path.endswith('/volumes'):
+                return self._volumes()
+            return self._send(404, {'errors': [{'message': 'not found'}]})
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            path = urllib.parse.urlsplit(self.path).path
+            if path.endswith('/login'):
+                with array.lock:
+                    array.logins += 1
+                return self._send(200, {'items': [{'username': 'user'}]}, {'x-auth-token': 'session'})
+            if path.endswith('/volumes'):
+                return self._volumes()
+            return self._send(404, {'errors': [{'message': 'not found'}]})
+
+    return Handler
+
+
+class _RetryCounter(ClientHooks):
+
+    def __init__(self):
+        self.retries = []
+
+    def on_retry(self, endpoint, attempt, status, delay):
+        self.retries.append(status)
+
+
+@pytest.fixture(scope='module')
+def array():
+    array = _Array()
+    yield array
+    array.stop()
+
+
+def _closed_url():
+    """URL of a port nothing listens on."""
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    url = 'http://127.0.0.1:{}'.format(listener.getsockname()[1])
+    listener.close()
+    return url
+
+
+def _client(array, hooks=None, **policy):
+    configuration = Configuration(host=array.url)
+    # the policies retry the connection errors, not urllib3
+    configuration.retries = 0
+    configuration.hooks = list(hooks or ())
+    policy.setdefault('backoff_factor', 0)
+    policy.setdefault('budget', None)
+    return Client(configuration=configuration, api_token='token', retries=RetryPolicy(**policy))
+
+
+def _assert_error(response, status):
+    assert isinstance(response, ErrorResponse), response
+    assert response.status_code == status, response.status_code
+
+
+def test_retry_after(array):
+    client = _client(array)
+    array.script((429, {'Retry-After': '1'}), OK)
+    response = client.get_volumes()
+    assert isinstance(response, ValidResponse), response
+    assert len(array.requests) == 2, array.requests
+    assert array.gaps()[0] >= 0.9, array.gaps()
+    # told to wait longer than allowed, the error is returned
+    array.script((503, {'Retry-After': '120'}), OK)
+    _assert_error(client.get_volumes(), 503)
+    assert len(array.requests) == 1, array.requests
+
+
+def test_backoff(array):
+    client = _client(array, backoff_factor=0.1, jitter=False)
+    array.script(503, 503, OK)
+    assert isinstance(client.get_volumes(), ValidResponse)
+    gaps = array.gaps()
+    assert len(gaps) == 2 and 0.1 <= gaps[0] < 0.2 and 0.2 <= gaps[1] < 0.35, gaps
+
+
+def test_status_rules(array):
+    client = _client(array, status_retries={503: 1})
+    array.script(503, 503, OK)
+    _assert_error(client.get_volumes(), 503)
+    assert len(array.requests) == 2, array.requests
+    # not retried
+    array.script(500, OK)
+    _assert_error(client.get_volumes(), 500)
+    assert len(array.requests) == 1, array.requests
+    client = _client(array, max_retries=2)
+    array.script(502, 502, 502, OK)
+    _assert_error(client.get_volumes(), 502)
+    assert len(array.requests) == 3, array.requests
+
+
+def test_budget_exhaustion(array):
+    # two retries over the window, whatever the number of calls
+    budget = RetryBudget(ratio=0, min_retries_per_second=0.2, window=10)
+    client = _client(array, budget=budget)
+    array.script(*[503] * 20)
+    for _ in range(3):
+        _assert_error(client.get_volumes(), 503)
+    assert len(array.requests) == 3 + 2, array.requests
+
+
+def test_non_get_connection_errors(array):
+    hooks = _RetryCounter()
+    client = _client(array, hooks=[hooks])
+    volume = models.VolumePost(provisioned=1048576)
+    # the request may have been processed, a POST is not sent again
+    array.script(DROP, OK)
+    with pytest.raises(Exception):
+        client.post_volumes(names=['vol1'], volume=volume)
+    assert len(array.requests) == 1 and hooks.retries == [], (array.requests, hooks.retries)
+    # a GET is
+    array.script(DROP, OK)
+    assert isinstance(client.get_volumes(), ValidResponse)
+    assert len(array.requests) == 2 and hooks.retries == [None], (array.requests, hooks.retries)
+    # a POST which failed to connect was not sent, it is retried
+    hooks.retries = []
+    client._api_client.configuration.host = _closed_url()
+    with pytest.raises(Exception):
+        client.post_volumes(names=['vol1'], volume=volume)
+    assert hooks.retries == [None] * 5, hooks.retries
+
+
+def test_per_call_policy(array):
+    client = _client(array)
+    array.script(503, OK)
+    with retrying(RetryPolicy(max_retries=0, budget=None)):
+        _assert_error(client.get_volumes(), 503)
+    assert len(array.requests) == 1, array.requests
+    # the policy of the client again
+    array.script(503, OK)
+    assert isinstance(client.get_volumes(), ValidResponse)
+    assert len(array.requests) == 2, array.requests
+
+
+def test_final_statuses(array):
+    client = _client(array)
+    array.script(404, OK)
+    _assert_error(client.get_volumes(), 404)
+    assert len(array.requests) == 1, array.requests
+    # the token is refreshed, and the call retried once
+    array.script(401, 401, OK)
+    _assert_error(client.get_volumes(), 401)
+    assert len(array.requests) == 2 and array.logins == 1, (array.requests, array.logins)
+    array.script(401, OK)
+    assert isinstance(client.get_volumes(), ValidResponse)
+    array.script(418)
+    with pytest.raises(PureError):
+        client.get_volumes()
+
+
+def test_async_client(array):
+
+    async def run():
+        client = to_async_client(_client(array, backoff_factor=0.1, jitter=False))
+        array.script(503, (429, {'Retry-After': '1'}), OK)
+        assert isinstance(await client.get_volumes(), ValidResponse)
+        gaps = array.gaps()
+        assert len(gaps) == 2 and 0.1 <= gaps[0] < 0.3 and gaps[1] >= 0.9, gaps
+        array.script(404)
+        _assert_error(await client.get_volumes(), 404)
+        assert len(array.requests) == 1, array.requests
+        array.script(401, OK)
+        assert isinstance(await client.get_volumes(), ValidResponse)
+        assert array.logins == 1, array.logins
+        with retrying(RetryPolicy(max_retries=0, budget=None)):
+            array.script(503, OK)
+            _assert_error(await client.get_volumes(), 503)
+        client.close()
+
+    asyncio.run(run())
+
+
+def test_async_connection_errors(array):
+
+    async def run():
+        hooks = _RetryCounter()
+        volume = models.VolumePost(provisioned=1048576)
+        client = to_async_client(_client(array, hooks=[hooks]))
+        # the request may have been processed, a POST is not sent again
+        array.script(DROP, OK)
+        with pytest.raises(PureError):
+            await client.post_volumes(names=['vol1'], volume=volume)
+        assert len(array.requests) == 1 and hooks.retries == [], (array.requests, hooks.retries)
+        # a GET is
+        array.script(DROP, OK)
+        assert isinstance(await client.get_volumes(), ValidResponse)
+        assert len(array.requests) == 2 and hooks.retries == [None], (array.requests, hooks.retries)
+        # a POST which failed to connect was not sent, it is retried
+        hooks.retries = []
+        client._api_client.configuration.host = _closed_url()
+        with pytest.raises(PureError):
+            await client.post_volumes(names=['vol1'], volume=volume)
+        assert hooks.retries == [None] * 5, hooks.retries
+        client.close()
+
+    asyncio.run(run())
+
+
+def test_retry_storm(array):
+    calls = 200
+    budget = RetryBudget(ratio=0.1, min_retries_per_second=0, window=60)
+    client = _client(array, budget=budget)
+    array.script(*[503] * (calls * 10))
+    with futures.ThreadPoolExecutor(20) as executor:
+        responses = list(executor.map(lambda _: client.get_volumes(), range(calls)))
+    assert all(isinstance(r, ErrorResponse) for r in responses)
+    # without the budget, each call is sent 6 times
+    assert calls <= len(array.requests) <= calls * 1.1 + 1, len(array.requests)
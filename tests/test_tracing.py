@@ -0,0 +1,147 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+trace = pytest.importorskip('opentelemetry.trace')
+sdk_trace = pytest.importorskip('opentelemetry.sdk.trace')
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks'))
+
+from mock_array import MockArray  # noqa: E402
+from pypureclient import tracing  # noqa: E402
+from pypureclient.async_client import to_async_client  # noqa: E402
+from pypureclient.flasharray.FA_2_38 import Client  # noqa: E402
+from pypureclient._transport.configuration import Configuration  # noqa: E402
+
+ITEMS = 250
+PAGE_SIZE = 100
+CALL_SPAN = 'VolumesApi.volumes_get'
+PAGE_SPAN = CALL_SPAN + ' page'
+
+
+@pytest.fixture(scope='module')
+def exporter():
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+@pytest.fixture(scope='module')
+def array():
+    with MockArray(items=ITEMS, page_size=PAGE_SIZE) as array:
+        yield array
+
+
+def _client(array):
+    configuration = Configuration(host=array.url)
+    configuration.tracing = True
+    # pages are fetched as the items are iterated
+    configuration.prefetch_pages = 0
+    configuration.parallel_pages = 0
+    return Client(configuration=configuration, api_token='token')
+
+
+def _call_spans(exporter, name):
+    """The spans of the call named `name`, its span first, by their names."""
+    spans = exporter.get_finished_spans()
+    calls = [s for s in spans if s.name == name]
+    assert len(calls) == 1, [s.name for s in spans]
+    call = calls[0]
+    tree = [s for s in spans if s.context.trace_id == call.context.trace_id]
+    return call, tree
+
+
+def _children(spans, parent):
+    return [s for s in spans if s.parent is not None and s.parent.span_id == parent.context.span_id]
+
+
+def _assert_request_span(span, request_id, status=200):
+    assert span.name == 'GET' and span.kind == trace.SpanKind.CLIENT, span.name
+    assert span.attributes[tracing.HTTP_STATUS] == status, dict(span.attributes)
+    assert span.attributes[tracing.REQUEST_ID] == request_id, dict(span.attributes)
+    assert span.attributes[tracing.HTTP_METHOD] == 'GET', dict(span.attributes)
+
+
+def _assert_list_call(exporter, request_id):
+    call, spans = _call_spans(exporter, CALL_SPAN)
+    assert call.parent is None, call.parent
+    assert call.attributes[tracing.HTTP_STATUS] == 200, dict(call.attributes)
+    assert call.attributes[tracing.REQUEST_ID] == request_id, dict(call.attributes)
+    assert call.attributes[tracing.ITEM_COUNT] == PAGE_SIZE, dict(call.attributes)
+    assert call.attributes[tracing.TOTAL_ITEM_COUNT] == ITEMS, dict(call.attributes)
+    children = _children(spans, call)
+    requests = [s for s in children if s.name == 'GET']
+    pages = sorted((s for s in children if s.name == PAGE_SPAN), key=lambda s: s.attributes[tracing.PAGE])
+    assert len(requests) == 1 and len(pages) == 2 and len(children) == 3, [s.name for s in children]
+    _assert_request_span(requests[0], request_id)
+    for number, page in enumerate(pages, 1):
+        assert page.attributes[tracing.PAGE] == number, dict(page.attributes)
+        assert page.attributes[tracing.ITEM_COUNT] == min(PAGE_SIZE, ITEMS - number * PAGE_SIZE), \
+            dict(page.attributes)
+        assert page.attributes[tracing.HTTP_STATUS] == 200, dict(page.attributes)
+        page_requests = _children(spans, page)
+        assert len(page_requests) == 1, [s.name for s in page_requests]
+        _assert_request_span(page_requests[0], request_id)
+    assert len(spans) == 6, [s.name for s in spans]
+
+
+def _assert_failed_call(exporter):
+    call, spans = _call_spans(exporter, 'PodsApi.pods_get')
+    assert call.attributes[tracing.HTTP_STATUS] == 404, dict(call.attributes)
+    assert call.status.status_code == trace.StatusCode.ERROR, call.status
+    requests = _children(spans, call)
+    assert len(requests) == 1, [s.name for s in requests]
+    assert requests[0].attributes[tracing.HTTP_STATUS] == 404, dict(requests[0].attributes)
+    assert requests[0].status.status_code == trace.StatusCode.ERROR, requests[0].status
+
+
+def test_sync_list_call(array, exporter):
+    client = _client(array)
+    exporter.clear()
+    response = client.get_volumes(x_request_id='sync-request', total_item_count=True)
+    assert len(list(response.items)) == ITEMS
+    _assert_list_call(exporter, 'sync-request')
+
+
+def test_sync_failed_call(array, exporter):
+    client = _client(array)
+    exporter.clear()
+    client.get_pods()
+    _assert_failed_call(exporter)
+
+
+def test_async_list_call(array, exporter):
+
+    async def run():
+        async with to_async_client(_client(array)) as client:
+            exporter.clear()
+            response = await client.get_volumes(x_request_id='async-request', total_item_count=True)
+            assert len([item async for item in response.items]) == ITEMS
+        _assert_list_call(exporter, 'async-request')
+
+    asyncio.run(run())
+
+
+def test_async_failed_call(array, exporter):
+
+    async def run():
+        async with to_async_client(_client(array)) as client:
+            exporter.clear()
+            await client.get_pods()
+        _assert_failed_call(exporter)
+
+    asyncio.run(run())
+
+
+def test_disabled(array, exporter):
+    client = _client(array)
+    client._api_client.configuration.tracing = False
+    exporter.clear()
+    assert len(list(client.get_volumes().items)) == ITEMS
+    assert not exporter.get_finished_spans(), [s.name for s in exporter.get_finished_spans()]